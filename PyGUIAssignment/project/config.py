@@ -31,7 +31,7 @@ WINDOW_TITLE = "Group 2 - Enhanced Linked Lists"
 WINDOW_GEOMETRY = "1920x1080"
 
 # List types
-LIST_TYPES = ["Singly", "Doubly", "Circular Singly", "Circular Doubly"]
+LIST_TYPES = ["Singly", "Doubly", "Circular Singly", "Circular Doubly", "Skip List"]
 
 # RPS settings
 RPS_ROUNDS = 5
@@ -1,6 +1,31 @@
 from .node import Node
+from .singly_list import SinglyLinkedList
+from .doubly_list import DoublyLinkedList
+from .circular_singly_list import CircularSinglyLinkedList
+from .circular_doubly_list import CircularDoublyLinkedList
+from .node_pool import NodePool
+from .value_index import ValueIndex
+from .pooled_doubly_list import PooledDoublyList
+from .ring_buffer import RingBuffer, RingCircularSinglyList
+from .skip_list import SkipList
+from .unrolled_list import UnrolledLinkedList
 from .linked_lists import LinkedListManager
 from .stack import StackManager
+from .queues import QueueManager, DequeManager
+from .journal import OperationJournal
+from .persistent import PersistentStack, PersistentSinglyList
+from .storage import save_state, load_state
+from .threadsafe import ConcurrentLinkedListManager, ConcurrentStackManager, AsyncStackManager
+from .instrumentation import Instrumentation
 
-__all__ = ['Node', 'LinkedListManager', 'StackManager']
-
+__all__ = ['Node', 'SinglyLinkedList', 'DoublyLinkedList',
+           'CircularSinglyLinkedList', 'CircularDoublyLinkedList',
+           'NodePool', 'PooledDoublyList', 'ValueIndex',
+           'RingBuffer', 'RingCircularSinglyList', 'SkipList',
+           'UnrolledLinkedList',
+           'LinkedListManager', 'StackManager', 'QueueManager', 'DequeManager',
+           'OperationJournal',
+           'PersistentStack', 'PersistentSinglyList',
+           'save_state', 'load_state',
+           'ConcurrentLinkedListManager', 'ConcurrentStackManager', 'AsyncStackManager',
+           'Instrumentation']
@@ -0,0 +1,308 @@
+"""Benchmark suite for the managers, for gating model changes
+
+Times insert, delete, traverse, peek and search on every list kind (and the
+stack) at several sizes, and reports ops/sec plus the peak memory ten calls
+of each operation allocate. Runs can be saved as JSON and compared, and a
+comparison exits with status 1 when anything got slower or hungrier than the
+threshold allows (after measuring anything flagged once more). Compare runs
+from the same quiet machine; timings move with load and CPU clock.
+
+Run from the project directory (no GUI needed):
+    python -m models.bench_suite --save base.json
+    ... change the models ...
+    python -m models.bench_suite --compare base.json
+    python -m models.bench_suite --diff base.json new.json
+"""
+import argparse
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from .linked_lists import LinkedListManager
+from .stack import StackManager
+
+SIZES = (100, 1_000, 10_000)
+REPS = 200
+REPEAT = 5
+MIN_TIME = 0.02
+# Calls traced for the peak memory figure
+MEMORY_CALLS = 10
+THRESHOLD = 0.2
+# Peak memory changes smaller than this are noise, whatever the ratio
+MIN_BYTES = 1024
+
+# name: (manager kind, LinkedListManager options)
+SUBJECTS = {
+    "singly": ("singly", {}),
+    "doubly": ("doubly", {}),
+    "doubly (pooled)": ("doubly", {"use_node_pool": True}),
+    "doubly (unrolled)": ("doubly", {"unrolled": True}),
+    "circular_singly": ("circular_singly", {}),
+    "circular_singly (ring)": ("circular_singly", {"ring_buffer": True}),
+    "circular_doubly": ("circular_doubly", {}),
+    "skip": ("skip", {}),
+    "stack": ("stack", {}),
+}
+OPS = ("insert_end", "insert_front", "delete_end", "delete_front", "traverse", "peek", "search")
+MUTATING = {"insert_end", "insert_front", "delete_end", "delete_front"}
+TRAVERSE = {
+    "singly": lambda m: m.singly_traverse(),
+    "doubly": lambda m: m.doubly_traverse_forward(),
+    "circular_singly": lambda m: m.circular_singly_traverse(1),
+    "circular_doubly": lambda m: m.circular_doubly_traverse_forward(1),
+    "skip": lambda m: m.skip_traverse(),
+}
+
+
+def _load(subject, n, reps, indexed):
+    """A manager holding 0..n-1 in the subject's list"""
+    kind, options = SUBJECTS[subject]
+    if kind == "stack":
+        manager = StackManager(capacity=None, indexed=indexed)
+        manager.from_iterable(range(n))
+        return manager
+    # The ring preallocates its capacity, so give it room for a batch of inserts
+    capacity = n + reps if options.get("ring_buffer") else None
+    manager = LinkedListManager(capacity=capacity, indexed=indexed, **options)
+    getattr(manager, f"{kind}_from_iterable")(range(n))
+    return manager
+
+
+def _operations(manager, kind, n):
+    """{op name: callable(i)} bound to manager; ops the kind lacks are left out"""
+    if kind == "stack":
+        return {
+            "insert_end": manager.push,
+            "delete_end": lambda i: manager.pop(),
+            "traverse": lambda i: list(manager.get_stack()),
+            "peek": lambda i: manager.peek(),
+            "search": lambda i: manager.search(n // 2),
+        }
+    insert = getattr(manager, f"{kind}_insert")
+    delete = getattr(manager, f"{kind}_delete")
+    peek = getattr(manager, f"{kind}_peek")
+    search = getattr(manager, f"{kind}_search")
+    traverse = TRAVERSE[kind]
+    return {
+        "insert_end": insert,
+        "insert_front": lambda i: insert(i, 0),
+        "delete_end": lambda i: delete(),
+        "delete_front": lambda i: delete(0),
+        "traverse": lambda i: traverse(manager),
+        "peek": lambda i: peek(),
+        "search": lambda i: search(n // 2),
+    }
+
+
+def _batch(op, reps):
+    """Run op reps times with the collector off (as timeit does) and return the seconds"""
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        for i in range(reps):
+            op(i)
+        return time.perf_counter() - start
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _restorer(manager, kind, op_name, n):
+    """Untimed bulk undo of count calls of a mutating op, so the next batch starts at size n"""
+    if kind == "stack":
+        if op_name == "insert_end":
+            return lambda count: [manager.pop() for i in range(count)]
+        return lambda count: manager.from_iterable(range(n))
+    if op_name == "insert_end":
+        return lambda count: getattr(manager, f"{kind}_delete_range")(n, n + count)
+    if op_name == "insert_front":
+        return lambda count: getattr(manager, f"{kind}_delete_range")(0, count)
+    if op_name == "delete_end":
+        return lambda count: getattr(manager, f"{kind}_extend")(range(n - count, n))
+    return lambda count: getattr(manager, f"{kind}_insert_many")(0, range(count))
+
+
+def measure(subject, op_name, n, reps=REPS, repeat=REPEAT, indexed=False):
+    """
+    Time one operation on a subject holding n values.
+
+    One timed call sizes the batches (at most reps calls, about MIN_TIME
+    long, so O(n) ops at large n stay quick); a sample runs batches until
+    MIN_TIME has passed, undoing each batch of a mutating op in bulk
+    (untimed) so every batch starts at size n. The best of repeat samples
+    is kept. Returns a result dict, or None when the subject has no such op.
+    """
+    kind = SUBJECTS[subject][0]
+    if op_name.startswith("delete"):
+        reps = min(reps, n)
+    manager = _load(subject, n, reps, indexed)
+    op = _operations(manager, kind, n).get(op_name)
+    if op is None:
+        return None
+    restore = _restorer(manager, kind, op_name, n) if op_name in MUTATING else lambda count: None
+
+    first = _batch(op, 1)
+    restore(1)
+    batch = max(1, min(reps, int(MIN_TIME / max(first, 1e-9))))
+    best = float("inf")
+    for _ in range(repeat):
+        elapsed = 0.0
+        calls = 0
+        while elapsed < MIN_TIME:
+            elapsed += _batch(op, batch)
+            calls += batch
+            restore(batch)
+        best = min(best, elapsed / calls)
+
+    # A fixed batch under tracemalloc, which is too slow to time alongside
+    count = min(MEMORY_CALLS, reps)
+    tracemalloc.start()
+    try:
+        for i in range(count):
+            op(i)
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    restore(count)
+    return {
+        "subject": subject,
+        "op": op_name,
+        "n": n,
+        "batch": batch,
+        "seconds_per_op": best,
+        "ops_per_sec": 1 / best if best else float("inf"),
+        "peak_bytes": peak,
+    }
+
+
+def run(subjects=None, ops=None, sizes=SIZES, reps=REPS, repeat=REPEAT, indexed=False, out=None):
+    """Measure every subject x op x size and return the run as a JSON-ready dict"""
+    results = []
+    for subject in subjects or SUBJECTS:
+        for n in sizes:
+            for op_name in ops or OPS:
+                result = measure(subject, op_name, n, reps, repeat, indexed)
+                if result is None:
+                    continue
+                results.append(result)
+                if out is not None:
+                    print(_format(result), file=out, flush=True)
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "sizes": list(sizes),
+            "reps": reps,
+            "repeat": repeat,
+            "indexed": indexed,
+            "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+        },
+        "results": results,
+    }
+
+
+def _format(result):
+    return (f"{result['subject']:<24}{result['op']:<14}{result['n']:>9,}"
+            f"{result['ops_per_sec']:>14,.0f} ops/s{result['peak_bytes'] / 1024:>11,.1f} KiB peak")
+
+
+def compare(old, new, threshold=THRESHOLD):
+    """
+    Match the results of two runs by (subject, op, n) and return
+    (regressions, improvements) as lists of (key, report line). A result regresses
+    when its ops/sec falls by more than threshold (a fraction) or its peak
+    memory grows by more than threshold and MIN_BYTES.
+    """
+    baseline = {(r["subject"], r["op"], r["n"]): r for r in old["results"]}
+    regressions = []
+    improvements = []
+    for result in new["results"]:
+        key = (result["subject"], result["op"], result["n"])
+        before = baseline.get(key)
+        if before is None:
+            continue
+        label = f"{key[0]} {key[1]} n={key[2]:,}"
+        speed = result["ops_per_sec"] / before["ops_per_sec"] - 1
+        line = (f"{label}: {before['ops_per_sec']:,.0f} -> {result['ops_per_sec']:,.0f} ops/s "
+                f"({speed:+.0%})")
+        if speed < -threshold:
+            regressions.append((key, line))
+        elif speed > threshold:
+            improvements.append((key, line))
+        grown = result["peak_bytes"] - before["peak_bytes"]
+        if grown > MIN_BYTES and grown > threshold * before["peak_bytes"]:
+            regressions.append((key, f"{label}: peak {before['peak_bytes']:,} -> {result['peak_bytes']:,} bytes"))
+    return regressions, improvements
+
+
+def _report(old, new, threshold):
+    """Print a comparison and return the exit status (1 if anything regressed)"""
+    if old["meta"].get("python") != new["meta"].get("python"):
+        print(f"Note: comparing Python {old['meta'].get('python')} with {new['meta'].get('python')}")
+    regressions, improvements = compare(old, new, threshold)
+    for key, line in improvements:
+        print(f"  faster     {line}")
+    for key, line in regressions:
+        print(f"  REGRESSION {line}")
+    print(f"{len(regressions)} regression(s), {len(improvements)} improvement(s) "
+          f"at a {threshold:.0%} threshold")
+    return 1 if regressions else 0
+
+
+def recheck(old, new, threshold=THRESHOLD, **options):
+    """
+    Measure every result of new that regressed against old once more and
+    keep the better figures, so one noisy sample does not fail the gate
+    """
+    regressions, improvements = compare(old, new, threshold)
+    keys = {key for key, line in regressions}
+    for result in new["results"]:
+        if (result["subject"], result["op"], result["n"]) in keys:
+            again = measure(result["subject"], result["op"], result["n"], **options)
+            result["ops_per_sec"] = max(result["ops_per_sec"], again["ops_per_sec"])
+            result["seconds_per_op"] = min(result["seconds_per_op"], again["seconds_per_op"])
+            result["peak_bytes"] = min(result["peak_bytes"], again["peak_bytes"])
+    return new
+
+
+def _load_run(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m models.bench_suite",
+                                     description="Benchmark the list and stack managers")
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES)
+    parser.add_argument("--subjects", nargs="+", choices=SUBJECTS, metavar="SUBJECT",
+                        help=f"subset of: {', '.join(SUBJECTS)}")
+    parser.add_argument("--ops", nargs="+", choices=OPS, help=f"subset of: {', '.join(OPS)}")
+    parser.add_argument("--reps", type=int, default=REPS, help="most calls per timed batch")
+    parser.add_argument("--repeat", type=int, default=REPEAT, help="samples per result (best is kept)")
+    parser.add_argument("--indexed", action="store_true", help="keep value indexes on every list")
+    parser.add_argument("--save", metavar="FILE", help="write this run as JSON")
+    parser.add_argument("--compare", metavar="BASELINE", help="compare this run with a saved one")
+    parser.add_argument("--diff", nargs=2, metavar=("OLD", "NEW"), help="compare two saved runs without running")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD,
+                        help="allowed slowdown or memory growth as a fraction (default %(default)s)")
+    args = parser.parse_args(argv)
+
+    if args.diff:
+        return _report(_load_run(args.diff[0]), _load_run(args.diff[1]), args.threshold)
+    new = run(args.subjects, args.ops, args.sizes, args.reps, args.repeat, args.indexed, out=sys.stdout)
+    if args.compare:
+        old = _load_run(args.compare)
+        recheck(old, new, args.threshold, reps=args.reps, repeat=args.repeat, indexed=args.indexed)
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(new, f, indent=1)
+    if args.compare:
+        return _report(old, new, args.threshold)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
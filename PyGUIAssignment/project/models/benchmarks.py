@@ -0,0 +1,461 @@
+"""Micro-benchmarks for the linked list and stack models
+
+Run from the project directory (no GUI needed):
+    python -m models.benchmarks
+"""
+import os
+import random
+import tempfile
+import time
+from collections import deque
+import tracemalloc
+from .linked_lists import LinkedListManager, LIST_KINDS
+from .doubly_list import DoublyLinkedList
+from .circular_doubly_list import CircularDoublyLinkedList
+from .pooled_doubly_list import PooledDoublyList
+from .circular_singly_list import CircularSinglyLinkedList
+from .ring_buffer import RingCircularSinglyList
+from .skip_list import SkipList
+from .unrolled_list import UnrolledLinkedList
+from .stack import StackManager
+from .queues import QueueManager, DequeManager
+from .persistent import PersistentStack, PersistentSinglyList
+from .storage import save_state, load_state
+
+
+def _timed(func, *args):
+    """Run func(*args) once and return the elapsed seconds"""
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def _traced_bytes(build):
+    """Return the bytes still allocated after build() runs, keeping its result alive"""
+    tracemalloc.start()
+    try:
+        kept = build()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del kept
+    return current
+
+
+class _DictNode:
+    """The pre-__slots__ node layout, kept only for comparison"""
+    def __init__(self, data):
+        self.data = data
+        self.next = None
+        self.prev = None
+
+
+def _build_dict_chain(values):
+    head = tail = None
+    for value in values:
+        node = _DictNode(value)
+        if tail:
+            node.prev = tail
+            tail.next = node
+        else:
+            head = node
+        tail = node
+    return head
+
+
+def _head_only_seek(self, index):
+    """The pre-optimization seek: always walk forward from the head"""
+    current = self.head
+    for i in range(index):
+        current = current.next
+    return current
+
+
+def bench_doubly_append(sizes=(10_000, 20_000, 40_000, 80_000)):
+    """Bulk append into the doubly list; time per node should stay flat"""
+    results = []
+    for n in sizes:
+        manager = LinkedListManager(capacity=None)
+        elapsed = _timed(lambda: [manager.doubly_insert(i) for i in range(n)])
+        results.append((n, elapsed))
+    
+    print("Doubly append (bulk load)")
+    for n, elapsed in results:
+        print(f"  n={n:>8}: {elapsed:8.4f}s  {elapsed / n * 1e6:6.2f} us/node")
+    return results
+
+
+def bench_positional_seek(n=20_000, reps=200):
+    """Insert/delete at the 90th percentile position, head-only seek vs nearer-end seek"""
+    position = n * 9 // 10
+    results = []
+    for name, list_cls in (("doubly", DoublyLinkedList),
+                           ("circular_doubly", CircularDoublyLinkedList)):
+        manager = LinkedListManager(capacity=None)
+        insert = getattr(manager, f"{name}_insert")
+        delete = getattr(manager, f"{name}_delete")
+        for i in range(n):
+            insert(i)
+        
+        def run():
+            for i in range(reps):
+                insert(i, position)
+                delete(position)
+        
+        nearer_end_seek = list_cls._node_at
+        list_cls._node_at = _head_only_seek
+        try:
+            before = _timed(run)
+        finally:
+            list_cls._node_at = nearer_end_seek
+        after = _timed(run)
+        results.append((name, before, after))
+    
+    print(f"Positional insert+delete at p90 (n={n}, {reps} reps)")
+    for name, before, after in results:
+        print(f"  {name:<16} head-only: {before:8.4f}s  nearer-end: {after:8.4f}s  "
+              f"speedup: {before / after:5.1f}x")
+    return results
+
+
+def bench_front_insert(n=100_000):
+    """Insert at position 0, node-based singly lists vs the old list-backed storage"""
+    backing = []
+    list_backed = _timed(lambda: [backing.insert(0, i) for i in range(n)])
+    results = [("list-backed", list_backed)]
+    for name in ("singly", "circular_singly"):
+        insert = getattr(LinkedListManager(capacity=None), f"{name}_insert")
+        results.append((name, _timed(lambda: [insert(i, 0) for i in range(n)])))
+    
+    print(f"Front insert (n={n})")
+    for name, elapsed in results:
+        print(f"  {name:<16} {elapsed:8.4f}s  {n / elapsed:12,.0f} ops/s")
+    return results
+
+
+def bench_node_memory(n=1_000_000):
+    """Bytes per node for dict-based nodes, slotted nodes and the array-backed pool"""
+    values = list(range(n))
+    
+    def build_list(list_cls):
+        linked = list_cls()
+        for value in values:
+            linked.append(value)
+        return linked
+    
+    results = [
+        ("dict Node", _traced_bytes(lambda: _build_dict_chain(values))),
+        ("slotted Node", _traced_bytes(lambda: build_list(DoublyLinkedList))),
+        ("node pool", _traced_bytes(lambda: build_list(PooledDoublyList))),
+    ]
+    
+    print(f"Doubly list memory (n={n})")
+    for name, size in results:
+        print(f"  {name:<16} {size / 2**20:8.1f} MiB  {size / n:6.1f} bytes/node")
+    return results
+
+
+def bench_bulk_load(n=100_000):
+    """Per-element inserts vs extend/insert_many/delete_range for each list kind"""
+    values = list(range(n))
+    results = []
+    for kind in LIST_KINDS:
+        manager = LinkedListManager(capacity=None)
+        insert = getattr(manager, f"{kind}_insert")
+        per_element = _timed(lambda: [insert(value) for value in values])
+        
+        manager = LinkedListManager(capacity=None)
+        extend = _timed(getattr(manager, f"{kind}_extend"), values)
+        insert_many = _timed(getattr(manager, f"{kind}_insert_many"), n // 2, values)
+        delete_range = _timed(getattr(manager, f"{kind}_delete_range"), n // 2, n // 2 + n)
+        results.append((kind, per_element, extend, insert_many, delete_range))
+    
+    print(f"Bulk operations (n={n}, ops/s)")
+    print(f"  {'kind':<16} {'insert x n':>12} {'extend':>12} {'insert_many':>12} {'delete_range':>12}")
+    for kind, *timings in results:
+        print(f"  {kind:<16} " + " ".join(f"{n / t:12,.0f}" for t in timings))
+    return results
+
+
+def _peak_bytes(func):
+    """Return the peak traced allocation while func() runs"""
+    tracemalloc.start()
+    try:
+        func()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def bench_circular_iter_memory(n=10_000, cycles=(1, 10, 100)):
+    """Peak memory of materialized vs lazy circular traversal as cycles grow"""
+    manager = LinkedListManager(capacity=None)
+    manager.circular_singly_extend(range(n))
+    manager.circular_doubly_extend(range(n))
+    results = []
+    for c in cycles:
+        results.append((c,
+                        _peak_bytes(lambda: manager.circular_doubly_traverse_forward(c)),
+                        _peak_bytes(lambda: deque(manager.circular_doubly_iter_forward(c), maxlen=0)),
+                        _peak_bytes(lambda: deque(manager.circular_singly_iter(c), maxlen=0))))
+    
+    print(f"Circular traversal peak memory (n={n})")
+    for c, listed, lazy_doubly, lazy_singly in results:
+        print(f"  cycles={c:<4} traverse: {listed / 2**20:8.2f} MiB  "
+              f"iter (doubly): {lazy_doubly / 1024:6.1f} KiB  "
+              f"iter (singly): {lazy_singly / 1024:6.1f} KiB")
+    return results
+
+
+def bench_snapshots(n=5_000):
+    """Snapshot after every push: copying StackManager vs keeping PersistentStack versions"""
+    def copy_snapshots():
+        stack = StackManager(capacity=None)
+        history = []
+        for i in range(n):
+            stack.push(i)
+            history.append(list(stack.get_stack()))
+        return history
+    
+    def persistent_snapshots():
+        stack = PersistentStack(capacity=None)
+        history = []
+        for i in range(n):
+            stack = stack.push(i)
+            history.append(stack)
+        return history
+    
+    def persistent_list_snapshots():
+        linked = PersistentSinglyList(capacity=None)
+        history = []
+        for i in range(n):
+            linked = linked.appendleft(i)
+            history.append(linked)
+        return history
+    
+    results = []
+    for name, build in (("copy list", copy_snapshots),
+                        ("persistent stack", persistent_snapshots),
+                        ("persistent singly", persistent_list_snapshots)):
+        elapsed = _timed(build)
+        results.append((name, elapsed, _traced_bytes(build)))
+    
+    print(f"Snapshot after every operation (n={n})")
+    for name, elapsed, size in results:
+        print(f"  {name:<18} {elapsed:8.4f}s  {size / 2**20:8.2f} MiB")
+    return results
+
+
+def bench_reverse(n=100_000, reps=100):
+    """Reverse-and-read: copying reversal vs the O(1) direction flag"""
+    linked = DoublyLinkedList.from_iterable(range(n))
+    copy_reverse = _timed(lambda: [list(reversed(linked.to_list())) for i in range(reps)])
+    flag_reverse = _timed(lambda: [linked.reverse() for i in range(reps)])
+    reversed_read = _timed(lambda: [list(reversed(linked)) for i in range(reps)])
+    copy_peak = _peak_bytes(lambda: list(reversed(linked.to_list())))
+    read_peak = _peak_bytes(lambda: list(reversed(linked)))
+    
+    print(f"Doubly reverse (n={n}, per call)")
+    print(f"  list(reversed(to_list())) {copy_reverse / reps * 1e3:8.3f} ms  peak {copy_peak / 2**20:6.2f} MiB")
+    print(f"  reverse() flag            {flag_reverse / reps * 1e6:8.3f} us")
+    print(f"  list(reversed(linked))    {reversed_read / reps * 1e3:8.3f} ms  peak {read_peak / 2**20:6.2f} MiB")
+    return copy_reverse, flag_reverse, reversed_read
+
+
+def bench_save_load(n=1_000_000):
+    """Save/load time, file size and load peak memory for both file formats"""
+    manager = LinkedListManager(capacity=None)
+    manager.doubly_extend(range(n))
+    structure = _traced_bytes(lambda: DoublyLinkedList.from_iterable(range(n)))
+    results = []
+    with tempfile.TemporaryDirectory() as folder:
+        for suffix in (".llst", ".jsonl"):
+            path = os.path.join(folder, "state" + suffix)
+            save = _timed(save_state, path, manager)
+            loaded = LinkedListManager(capacity=None)
+            load = _timed(load_state, path, loaded)
+            peak = _peak_bytes(lambda: load_state(path, LinkedListManager(capacity=None)))
+            results.append((suffix, save, load, os.path.getsize(path), peak))
+    
+    print(f"Save/load of a {n:,}-node doubly list (structure itself: {structure / 2**20:.1f} MiB)")
+    for suffix, save, load, size, peak in results:
+        print(f"  {suffix:<7} save {save:6.2f}s  load {load:6.2f}s  "
+              f"file {size / 2**20:6.1f} MiB  load peak {peak / 2**20:6.1f} MiB")
+    return results
+
+
+def bench_ring_buffer(n=1_000, ops=200_000):
+    """Bounded circular list and stack: Node/list storage vs the preallocated ring"""
+    nodes = CircularSinglyLinkedList.from_iterable(range(n))
+    ring = RingCircularSinglyList.from_iterable(range(n), n)
+    
+    def round_robin(linked):
+        for i in range(ops):
+            linked.append(linked.popleft())
+    
+    def rotations(linked):
+        for i in range(ops):
+            linked.rotate(7)
+    
+    def push_pop(stack):
+        for i in range(ops):
+            stack.push(i)
+            if stack.size() == n:
+                for j in range(n // 2):
+                    stack.pop()
+    
+    results = {
+        "popleft+append node": _timed(round_robin, nodes),
+        "popleft+append ring": _timed(round_robin, ring),
+        "rotate(7) node": _timed(rotations, nodes),
+        "rotate(7) ring": _timed(rotations, ring),
+        "stack list": _timed(push_pop, StackManager(capacity=n)),
+        "stack ring": _timed(push_pop, StackManager(capacity=n, ring_buffer=True)),
+    }
+    print(f"Bounded ring vs nodes (capacity {n}, {ops:,} ops)")
+    for name, elapsed in results.items():
+        print(f"  {name:<20} {elapsed:8.4f}s  {elapsed / ops * 1e6:6.2f} us/op")
+    return results
+
+
+def bench_fifo(n=100_000):
+    """FIFO and double-ended workloads: Python list and deque vs the doubly-backed managers"""
+    def list_fifo():
+        items = []
+        for i in range(n):
+            items.append(i)
+        while items:
+            items.pop(0)
+    
+    def deque_fifo():
+        items = deque()
+        for i in range(n):
+            items.append(i)
+        while items:
+            items.popleft()
+    
+    def queue_fifo():
+        queue = QueueManager(capacity=None)
+        for i in range(n):
+            queue.enqueue(i)
+        while not queue.is_empty():
+            queue.dequeue()
+    
+    def deque_both_ends():
+        both = DequeManager(capacity=None)
+        for i in range(n // 2):
+            both.push_front(i)
+            both.push_back(i)
+        while not both.is_empty():
+            both.pop_front()
+            both.pop_back()
+    
+    results = {
+        "list pop(0)": _timed(list_fifo),
+        "collections.deque": _timed(deque_fifo),
+        "QueueManager": _timed(queue_fifo),
+        "DequeManager (both)": _timed(deque_both_ends),
+    }
+    print(f"FIFO workload ({n:,} enqueues then dequeues)")
+    for name, elapsed in results.items():
+        print(f"  {name:<20} {elapsed:8.4f}s  {elapsed / (2 * n) * 1e6:6.2f} us/op")
+    return results
+
+
+def bench_skip_list(n=100_000, reps=2_000, seed=0):
+    """Random positional insert/get/delete: doubly list vs indexable skip list"""
+    rng = random.Random(seed)
+    positions = [rng.randrange(n) for i in range(reps)]
+    
+    def workload(linked):
+        for position in positions:
+            linked.insert(position, position)
+        for position in positions:
+            linked.get(position) if isinstance(linked, SkipList) else linked._node_at(position)
+        for position in positions:
+            linked.delete(position)
+    
+    results = []
+    for name, list_cls in (("doubly", DoublyLinkedList), ("skip list", SkipList)):
+        build = _timed(list_cls.from_iterable, range(n))
+        linked = list_cls.from_iterable(range(n))
+        elapsed = _timed(workload, linked)
+        memory = _traced_bytes(lambda: list_cls.from_iterable(range(n)))
+        results.append((name, build, elapsed, memory))
+    
+    print(f"Positional access at n={n:,} ({reps:,} each of insert/get/delete at random positions)")
+    for name, build, elapsed, memory in results:
+        print(f"  {name:<10} build {build:6.3f}s  ops {elapsed:7.3f}s "
+              f"({elapsed / (3 * reps) * 1e6:8.1f} us/op)  memory {memory / 2**20:6.1f} MiB")
+    return results
+
+
+def bench_unrolled(n=1_000_000, reps=5):
+    """Traversal and memory: one Node per value vs pooled arrays vs unrolled blocks"""
+    results = []
+    for name, list_cls in (("doubly (Node)", DoublyLinkedList),
+                           ("pooled", PooledDoublyList),
+                           ("unrolled", UnrolledLinkedList)):
+        linked = list_cls.from_iterable(range(n))
+        iterate = _timed(lambda: [sum(linked) for i in range(reps)]) / reps
+        listed = _timed(lambda: [linked.to_list() for i in range(reps)]) / reps
+        backwards = _timed(lambda: [sum(reversed(linked)) for i in range(reps)]) / reps
+        memory = _traced_bytes(lambda: list_cls.from_iterable(range(n)))
+        results.append((name, iterate, listed, backwards, memory))
+        del linked
+    
+    print(f"Traversal of {n:,} values (mean of {reps})")
+    for name, iterate, listed, backwards, memory in results:
+        print(f"  {name:<14} iterate {iterate * 1e3:7.1f} ms  to_list {listed * 1e3:7.1f} ms  "
+              f"reversed {backwards * 1e3:7.1f} ms  memory {memory / 2**20:6.1f} MiB "
+              f"({memory / n:5.1f} B/value)")
+    return results
+
+
+def bench_sort(sizes=(100_000, 1_000_000), seed=0):
+    """In-place merge sort (relinking nodes) vs exporting, sorting and rebuilding the list"""
+    def export_sort_rebuild(linked):
+        return DoublyLinkedList.from_iterable(sorted(linked.to_list()))
+    
+    results = []
+    for n in sizes:
+        values = list(range(n))
+        random.Random(seed).shuffle(values)
+        linked = DoublyLinkedList.from_iterable(values)
+        relinked = _timed(linked.sort)
+        assert linked.validate() and linked.to_list() == sorted(values)
+        linked = DoublyLinkedList.from_iterable(values)
+        relinked_peak = _peak_bytes(linked.sort)
+        linked = DoublyLinkedList.from_iterable(values)
+        rebuilt = _timed(export_sort_rebuild, linked)
+        rebuilt_peak = _peak_bytes(lambda: export_sort_rebuild(linked))
+        other = DoublyLinkedList.from_iterable(range(1, 2 * n, 2))
+        linked = DoublyLinkedList.from_iterable(range(0, 2 * n, 2))
+        merged = _timed(linked.merge_sorted, other)
+        results.append((n, relinked, relinked_peak, rebuilt, rebuilt_peak, merged))
+        del linked, other
+    
+    print("Sorting a shuffled doubly list")
+    for n, relinked, relinked_peak, rebuilt, rebuilt_peak, merged in results:
+        print(f"  n={n:>9,}  merge sort {relinked:6.2f}s peak {relinked_peak / n:6.2f} B/node  "
+              f"export+sorted+rebuild {rebuilt:6.2f}s peak {rebuilt_peak / n:6.1f} B/node  "
+              f"merge_sorted(n) {merged:5.2f}s")
+    return results
+
+
+if __name__ == "__main__":
+    bench_doubly_append()
+    bench_positional_seek()
+    bench_front_insert()
+    bench_node_memory()
+    bench_bulk_load()
+    bench_circular_iter_memory()
+    bench_snapshots()
+    bench_reverse()
+    bench_save_load()
+    bench_ring_buffer()
+    bench_fifo()
+    bench_skip_list()
+    bench_unrolled()
+    bench_sort()
@@ -0,0 +1,344 @@
+"""Node-based circular singly linked list (tail.next is the head)"""
+from .node import Node, build_chain, iter_chain, merge_chains, sort_chain, take_chain
+from .value_index import ValueIndex
+
+class CircularSinglyLinkedList:
+    def __init__(self, indexed=False):
+        """
+        indexed keeps a ValueIndex so membership tests are O(1); like
+        SinglyLinkedList it also numbers the nodes from the head (position =
+        number - base while numbered is set) so search hits need no walk.
+        """
+        self.tail = None
+        self.size = 0
+        self.index = ValueIndex() if indexed else None
+        self.base = 0
+        self.numbered = True
+
+    @property
+    def head(self):
+        return self.tail.next if self.tail else None
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        """Yield each value once, starting at the head"""
+        if not self.tail:
+            return
+        current = self.tail.next
+        for i in range(self.size):
+            yield current.data
+            current = current.next
+
+    def __contains__(self, value):
+        return self.contains(value)
+
+    def _node_at(self, index):
+        """Return the node at index (-1 is the tail, 0 <= index < size otherwise)"""
+        if index == -1 or index == self.size - 1:
+            return self.tail
+        current = self.tail.next
+        for i in range(index):
+            current = current.next
+        return current
+
+    def _splice_after(self, before, first, last, count, at_end=False):
+        """
+        Link the chain first..last (count nodes) after before.
+        at_end makes the chain's last node the new tail.
+        """
+        if not self.tail or (before is self.tail and at_end):
+            number = self.base + self.size
+        elif before is self.tail:
+            self.base -= count
+            number = self.base
+        else:
+            self.numbered = False
+            number = None
+        if not self.tail:
+            last.next = first
+            self.tail = last
+        else:
+            last.next = before.next
+            before.next = first
+            if at_end:
+                self.tail = last
+        self.size += count
+        if self.index is not None:
+            node = first
+            for i in range(count):
+                self.index.add(node.data, node, number)
+                if number is not None:
+                    number += 1
+                node = node.next
+
+    def _cut_after(self, before, count):
+        """Unlink count nodes after before and return the first of them"""
+        first = before.next
+        last = first
+        for i in range(count - 1):
+            last = last.next
+        if before is self.tail:
+            self.base += count
+        elif last is not self.tail:
+            self.numbered = False
+        if count == self.size:
+            self.tail = None
+        else:
+            before.next = last.next
+            if last is self.tail:
+                self.tail = before
+        last.next = None
+        self.size -= count
+        if self.index is not None:
+            node = first
+            while node:
+                self.index.discard(node.data, node)
+                node = node.next
+        return first
+
+    def rotate(self, steps=1):
+        """Make the node steps positions ahead the new head (walks steps nodes)"""
+        if self.tail:
+            self.tail = self._node_at(steps % self.size - 1)
+            self.numbered = False
+
+    def appendleft(self, value):
+        """Insert at the head in O(1)"""
+        new_node = Node(value)
+        self._splice_after(self.tail, new_node, new_node, 1)
+        return new_node
+
+    def append(self, value):
+        """Insert at the end in O(1)"""
+        new_node = Node(value)
+        self._splice_after(self.tail, new_node, new_node, 1, at_end=True)
+        return new_node
+
+    def insert(self, value, position=None):
+        """Insert value at position (end if None) and return the new node"""
+        if position is None:
+            return self.append(value)
+        if position < 0 or position > self.size:
+            raise ValueError(f"Position must be between 0 and {self.size}")
+        if position == 0:
+            return self.appendleft(value)
+        if position == self.size:
+            return self.append(value)
+
+        new_node = Node(value)
+        self._splice_after(self._node_at(position - 1), new_node, new_node, 1)
+        return new_node
+
+    def popleft(self):
+        """Remove and return the head value in O(1)"""
+        if not self.tail:
+            raise ValueError("List is empty!")
+        return self._cut_after(self.tail, 1).data
+
+    def pop(self):
+        """Remove and return the tail value (walks to the node before the tail)"""
+        if not self.tail:
+            raise ValueError("List is empty!")
+        return self.delete(self.size - 1)
+
+    def delete(self, position=None):
+        """Remove the value at position (end if None) and return it"""
+        if not self.tail:
+            raise ValueError("List is empty!")
+        if position is None:
+            return self.pop()
+        if position < 0 or position >= self.size:
+            raise ValueError(f"Position must be between 0 and {self.size - 1}")
+        return self._cut_after(self._node_at(position - 1), 1).data
+
+    # Bulk operations
+    @classmethod
+    def from_iterable(cls, values, max_count=None, **options):
+        """Build a new list from values in one pass"""
+        linked = cls(**options)
+        linked.extend(values, max_count)
+        return linked
+
+    def extend(self, values, max_count=None):
+        """Append every value in one splice and return how many were added"""
+        return self.insert_many(None, values, max_count)
+
+    def insert_many(self, position, values, max_count=None):
+        """Splice values in starting at position (end if None); return the count"""
+        if position is None:
+            position = self.size
+        if position < 0 or position > self.size:
+            raise ValueError(f"Position must be between 0 and {self.size}")
+        first, last, count = build_chain(values, max_count, doubly=False)
+        if not count:
+            return 0
+
+        before = self._node_at(position - 1) if self.tail else None
+        self._splice_after(before, first, last, count, at_end=position == self.size)
+        return count
+
+    def _cut_range(self, start, stop):
+        """Unlink positions start..stop-1 and return the detached chain (None if empty)"""
+        if start < 0 or stop > self.size or start > stop:
+            raise ValueError(f"Range must satisfy 0 <= start <= stop <= {self.size}")
+        count = stop - start
+        if not count:
+            return None
+
+        return self._cut_after(self._node_at(start - 1), count)
+
+    def delete_range(self, start, stop):
+        """Unlink positions start..stop-1 in one pass and return how many were removed"""
+        self._cut_range(start, stop)
+        return stop - start
+
+    def pop_range(self, start, stop):
+        """Unlink positions start..stop-1 and return their values"""
+        return list(iter_chain(self._cut_range(start, stop)))
+
+    # Sorting
+    def _unlink_all(self):
+        """Open the ring into a None-terminated chain from the head and return the first; the index keeps its entries"""
+        if not self.tail:
+            return None
+        first = self.tail.next
+        self.tail.next = None
+        self.tail = None
+        self.size = 0
+        return first
+
+    def _relink_all(self, first, last, count):
+        """Close the None-terminated chain first..last (count nodes) into the whole ring"""
+        if last:
+            last.next = first
+        self.tail = last
+        self.size = count
+        self.numbered = False
+
+    def sort(self, key=None, reverse=False):
+        """Stable merge sort that relinks the existing nodes: O(n log n) time, no new nodes"""
+        count = self.size
+        first, last = sort_chain(self._unlink_all(), key, reverse)
+        self._relink_all(first, last, count)
+
+    def merge_sorted(self, other, key=None, reverse=False):
+        """
+        Merge the sorted values of other into this sorted list in one pass,
+        keeping it sorted (ties keep this list's values first); return how many
+        were added. Node-based lists hand over their nodes and are left empty.
+        """
+        if other is self:
+            raise ValueError("Cannot merge a list into itself")
+        incoming, added = take_chain(other, self.index)
+        count = self.size + added
+        first, last = merge_chains(self._unlink_all(), incoming, key, reverse)
+        self._relink_all(first, last, count)
+        return added
+
+    # Search
+    def contains(self, value):
+        """Membership test; O(1) on average when indexed"""
+        if self.index is not None:
+            return value in self.index
+        return any(data == value for data in self)
+
+    def _renumber(self):
+        """Number every node by its position from the head in one pass"""
+        node = self.tail.next
+        for i in range(self.size):
+            self.index.place(node.data, node, i)
+            node = node.next
+        self.base = 0
+        self.numbered = True
+
+    def search(self, value):
+        """
+        Return the position of the first node holding value (from head), or -1.
+        Indexed lists answer from the node numbers (see SinglyLinkedList.search).
+        """
+        if self.index is not None:
+            if value not in self.index:
+                return -1
+            if not self.numbered:
+                self._renumber()
+            return self.index.lowest(value)[0] - self.base
+        for i, data in enumerate(self):
+            if data == value:
+                return i
+        return -1
+
+    def delete_value(self, value):
+        """Remove the first node holding value and return True, or False if absent"""
+        position = self.search(value)
+        if position == -1:
+            return False
+        self.delete(position)
+        return True
+
+    def iter_forward(self, cycles=1, limit=None, start=0):
+        """
+        Lazily yield (step, value, index) triples walking the ring from
+        position start. Stops after the given cycles and/or limit steps;
+        with both None it never stops.
+        """
+        if not self.tail:
+            return
+        steps = None if cycles is None else self.size * cycles
+        if limit is not None:
+            steps = limit if steps is None else min(steps, limit)
+
+        size = self.size
+        current = self._node_at(start % size)
+        step = 0
+        while steps is None or step < steps:
+            yield step, current.data, (start + step) % size
+            current = current.next
+            step += 1
+
+    def traverse(self, cycles=2):
+        """Return (step, value, index) triples walking the ring for the given cycles"""
+        return list(self.iter_forward(cycles))
+
+    def to_list(self):
+        """Return one lap of values starting at the head"""
+        return list(self)
+
+    def peek(self):
+        """Peek at the first element"""
+        if not self.tail:
+            return None
+        return self.tail.next.data
+
+    def clear(self):
+        """Remove all nodes"""
+        self.tail = None
+        self.size = 0
+        self.base = 0
+        self.numbered = True
+        if self.index is not None:
+            self.index.clear()
+
+    def validate(self):
+        """Check ring closure, tail and cached size in O(n); raise ValueError if broken"""
+        if not self.tail:
+            if self.size:
+                raise ValueError(f"Invalid list: no nodes but size is {self.size}")
+            nodes = []
+        else:
+            head = self.tail.next
+            nodes = []
+            current = head
+            for i in range(self.size):
+                if current is None or (i and current is head):
+                    raise ValueError(f"Invalid list: ring closes after {i} nodes, size is {self.size}")
+                nodes.append(current)
+                current = current.next
+            if nodes[-1] is not self.tail or current is not head:
+                raise ValueError("Invalid list: ring does not close at the tail")
+        if self.index is not None:
+            self.index.validate((node.data, node) for node in nodes)
+            if self.numbered:
+                self.index.check_numbers(((node.data, node) for node in nodes), self.base)
+        return True
@@ -0,0 +1,436 @@
+"""Doubly linked list with head/tail pointers and a cached size"""
+from .node import Node, build_chain, iter_chain, merge_chains, sort_chain, take_chain
+from .value_index import ValueIndex
+
+class DoublyLinkedList:
+    def __init__(self, indexed=False):
+        """
+        indexed keeps a ValueIndex so membership tests are O(1); it also
+        numbers the nodes in physical order (see SinglyLinkedList) so search
+        hits need no walk.
+        head/tail are the physical ends; while reversed is set, positions count
+        from the tail and traversal follows prev links (see reverse).
+        """
+        self.head = None
+        self.tail = None
+        self.size = 0
+        self.reversed = False
+        self.index = ValueIndex() if indexed else None
+        self.base = 0
+        self.numbered = True
+
+    def __len__(self):
+        return self.size
+
+    def _values(self, forward):
+        """Yield values along the physical next (forward) or prev links"""
+        if forward:
+            current = self.head
+            while current:
+                yield current.data
+                current = current.next
+        else:
+            current = self.tail
+            while current:
+                yield current.data
+                current = current.prev
+
+    def __iter__(self):
+        return self._values(not self.reversed)
+
+    def __reversed__(self):
+        return self._values(self.reversed)
+
+    def __contains__(self, value):
+        return self.contains(value)
+
+    def _physical(self, position):
+        """Map a logical node position to its physical position"""
+        return self.size - 1 - position if self.reversed else position
+
+    def _node_at(self, index):
+        """Return the node at physical index (0 <= index < size), walking from the nearer end"""
+        if index <= self.size // 2:
+            current = self.head
+            for i in range(index):
+                current = current.next
+        else:
+            current = self.tail
+            for i in range(self.size - 1 - index):
+                current = current.prev
+        return current
+
+    def _splice(self, first, last, count, before, after):
+        """Link the chain first..last (count nodes) between before and after"""
+        if after is None:
+            number = self.base + self.size
+        elif before is None:
+            self.base -= count
+            number = self.base
+        else:
+            self.numbered = False
+            number = None
+        first.prev = before
+        last.next = after
+        if before:
+            before.next = first
+        else:
+            self.head = first
+        if after:
+            after.prev = last
+        else:
+            self.tail = last
+        self.size += count
+        index = self.index
+        # Chains from insert_many are built owned already
+        if index is not None or first.owner is not self:
+            node = first
+            for i in range(count):
+                node.owner = self
+                if index is not None:
+                    index.add(node.data, node, number)
+                    if number is not None:
+                        number += 1
+                node = node.next
+
+    def _cut(self, first, last, count):
+        """Unlink the chain first..last (count nodes) and return it detached"""
+        before = first.prev
+        after = last.next
+        if before is None:
+            self.base += count
+        elif after is not None:
+            self.numbered = False
+        if before:
+            before.next = after
+        else:
+            self.head = after
+        if after:
+            after.prev = before
+        else:
+            self.tail = before
+        first.prev = None
+        last.next = None
+        self.size -= count
+        index = self.index
+        node = first
+        for i in range(count):
+            node.owner = None
+            if index is not None:
+                index.discard(node.data, node)
+            node = node.next
+        return first
+
+    def _link_at(self, first, last, count, position):
+        """Splice a chain in so that it starts at physical position"""
+        before = self._node_at(position - 1) if position else None
+        after = before.next if before else self.head
+        self._splice(first, last, count, before, after)
+
+    def reverse(self):
+        """Reverse the list in O(1) by flipping which way the links are read"""
+        self.reversed = not self.reversed
+
+    def append(self, value):
+        """Insert at the end in O(1)"""
+        new_node = Node(value)
+        if self.reversed:
+            self._splice(new_node, new_node, 1, None, self.head)
+        else:
+            self._splice(new_node, new_node, 1, self.tail, None)
+        return new_node
+
+    def appendleft(self, value):
+        """Insert at the front in O(1)"""
+        new_node = Node(value)
+        if self.reversed:
+            self._splice(new_node, new_node, 1, self.tail, None)
+        else:
+            self._splice(new_node, new_node, 1, None, self.head)
+        return new_node
+
+    def insert(self, value, position=None):
+        """Insert value at position (end if None) and return the new node"""
+        if position is None or position == self.size:
+            return self.append(value)
+        if position < 0 or position > self.size:
+            raise ValueError("Position out of range")
+        if position == 0:
+            return self.appendleft(value)
+
+        new_node = Node(value)
+        if self.reversed:
+            position = self.size - position
+        self._link_at(new_node, new_node, 1, position)
+        return new_node
+
+    def pop(self):
+        """Remove and return the last value in O(1)"""
+        if not self.tail:
+            raise ValueError("List is empty!")
+        node = self.head if self.reversed else self.tail
+        return self._cut(node, node, 1).data
+
+    def popleft(self):
+        """Remove and return the first value in O(1)"""
+        if not self.head:
+            raise ValueError("List is empty!")
+        node = self.tail if self.reversed else self.head
+        return self._cut(node, node, 1).data
+
+    def delete(self, position=None):
+        """Remove the value at position (end if None) and return it"""
+        if not self.head:
+            raise ValueError("List is empty!")
+        if position is None:
+            return self.pop()
+        if position < 0 or position >= self.size:
+            raise ValueError("Position out of range")
+        node = self._node_at(self._physical(position))
+        return self._cut(node, node, 1).data
+
+    # Bulk operations
+    @classmethod
+    def from_iterable(cls, values, max_count=None, **options):
+        """Build a new list from values in one pass"""
+        linked = cls(**options)
+        linked.extend(values, max_count)
+        return linked
+
+    def extend(self, values, max_count=None):
+        """Append every value in one splice and return how many were added"""
+        return self.insert_many(None, values, max_count)
+
+    def insert_many(self, position, values, max_count=None):
+        """Splice values in starting at position (end if None); return the count"""
+        if position is None:
+            position = self.size
+        if position < 0 or position > self.size:
+            raise ValueError("Position out of range")
+        first, last, count = build_chain(values, max_count, reverse=self.reversed, owner=self)
+        if not count:
+            return 0
+
+        if self.reversed:
+            position = self.size - position
+        self._link_at(first, last, count, position)
+        return count
+
+    def _cut_range(self, start, stop):
+        """Unlink positions start..stop-1 and return the detached chain (None if empty)"""
+        if start < 0 or stop > self.size or start > stop:
+            raise ValueError(f"Range must satisfy 0 <= start <= stop <= {self.size}")
+        count = stop - start
+        if not count:
+            return None
+        if self.reversed:
+            start = self.size - stop
+
+        first = self._node_at(start)
+        last = first
+        for i in range(count - 1):
+            last = last.next
+        return self._cut(first, last, count)
+
+    def delete_range(self, start, stop):
+        """Unlink positions start..stop-1 in one pass and return how many were removed"""
+        self._cut_range(start, stop)
+        return stop - start
+
+    def pop_range(self, start, stop):
+        """Unlink positions start..stop-1 and return their values"""
+        values = list(iter_chain(self._cut_range(start, stop)))
+        if self.reversed:
+            values.reverse()
+        return values
+
+    # Sorting
+    def _unlink_all(self):
+        """
+        Detach every node as a None-terminated chain along next in list order
+        and return the first; prev links are stale until _relink_all, and the
+        index keeps its entries.
+        """
+        first = self.head
+        if self.reversed:
+            # List order runs along prev from the tail
+            first = node = self.tail
+            while node:
+                node.next = node.prev
+                node = node.prev
+            self.reversed = False
+        self.head = None
+        self.tail = None
+        self.size = 0
+        return first
+
+    def _relink_all(self, first, last, count):
+        """Make the None-terminated chain first..last (count nodes) the whole list, fixing prev links"""
+        previous = None
+        node = first
+        while node:
+            node.prev = previous
+            node.owner = self
+            previous = node
+            node = node.next
+        self.head = first
+        self.tail = last
+        self.size = count
+        self.numbered = False
+
+    def sort(self, key=None, reverse=False):
+        """Stable merge sort that relinks the existing nodes: O(n log n) time, no new nodes"""
+        count = self.size
+        first, last = sort_chain(self._unlink_all(), key, reverse)
+        self._relink_all(first, last, count)
+
+    def merge_sorted(self, other, key=None, reverse=False):
+        """
+        Merge the sorted values of other into this sorted list in one pass,
+        keeping it sorted (ties keep this list's values first); return how many
+        were added. Node-based lists hand over their nodes and are left empty.
+        """
+        if other is self:
+            raise ValueError("Cannot merge a list into itself")
+        incoming, added = take_chain(other, self.index)
+        count = self.size + added
+        first, last = merge_chains(self._unlink_all(), incoming, key, reverse)
+        self._relink_all(first, last, count)
+        return added
+
+    # Search
+    def contains(self, value):
+        """Membership test; O(1) on average when indexed"""
+        if self.index is not None:
+            return value in self.index
+        return any(data == value for data in self)
+
+    def _renumber(self):
+        """Number every node by its physical position in one pass"""
+        node = self.head
+        for i in range(self.size):
+            self.index.place(node.data, node, i)
+            node = node.next
+        self.base = 0
+        self.numbered = True
+
+    def search(self, value):
+        """
+        Return the position of the first node holding value (from head), or -1.
+        Indexed lists answer from the node numbers, renumbering first if the
+        middle changed since the last search.
+        """
+        if self.index is not None:
+            if value not in self.index:
+                return -1
+            if not self.numbered:
+                self._renumber()
+            if self.reversed:
+                return self.size - 1 - (self.index.highest(value)[0] - self.base)
+            return self.index.lowest(value)[0] - self.base
+        for i, data in enumerate(self):
+            if data == value:
+                return i
+        return -1
+
+    def find(self, value):
+        """
+        Return a node holding value, or None.
+        Unindexed lists return the first match from the head; indexed lists
+        answer in O(1) with the longest-held match.
+        """
+        if self.index is not None:
+            return self.index.first(value)
+        current = self.tail if self.reversed else self.head
+        while current:
+            if current.data == value:
+                return current
+            current = current.prev if self.reversed else current.next
+        return None
+
+    def remove_node(self, node):
+        """
+        Unlink a node handle from this list in O(1) and return its value.
+        Raises ValueError, before touching any link, for a node that was
+        removed already or belongs to another list.
+        """
+        if node.owner is not self:
+            raise ValueError("Node is not in this list")
+        return self._cut(node, node, 1).data
+
+    def index_of(self, node):
+        """Return the position of a node handle by walking back to the head"""
+        if node.owner is not self:
+            raise ValueError("Node is not in this list")
+        position = 0
+        node = node.next if self.reversed else node.prev
+        while node:
+            position += 1
+            node = node.next if self.reversed else node.prev
+        return position
+
+    def delete_value(self, value):
+        """Remove one node holding value and return True, or False if absent"""
+        node = self.find(value)
+        if node is None:
+            return False
+        self._cut(node, node, 1)
+        return True
+
+    def traverse_forward(self):
+        """Return (index, value) pairs from head to tail"""
+        return list(enumerate(self))
+
+    def traverse_reverse(self):
+        """Return (index, value) pairs from tail to head"""
+        return list(enumerate(reversed(self)))
+
+    def to_list(self):
+        """Return the values from head to tail as a Python list"""
+        return list(self)
+
+    def peek(self):
+        """Peek at the first element"""
+        if not self.head:
+            return None
+        return self.tail.data if self.reversed else self.head.data
+
+    def clear(self):
+        """Remove all nodes, detaching each so outstanding handles are rejected"""
+        node = self.head
+        while node:
+            node.owner = None
+            node = node.next
+        self.head = None
+        self.tail = None
+        self.size = 0
+        self.reversed = False
+        self.base = 0
+        self.numbered = True
+        if self.index is not None:
+            self.index.clear()
+
+    def validate(self):
+        """Check next/prev symmetry, ends and cached size in O(n); raise ValueError if broken"""
+        nodes = []
+        previous = None
+        current = self.head
+        while current:
+            if len(nodes) == self.size:
+                raise ValueError(f"Invalid list: more than {self.size} nodes or a cycle")
+            if current.prev is not previous:
+                raise ValueError(f"Invalid list: prev link of node {len(nodes)} is wrong")
+            if current.owner is not self:
+                raise ValueError(f"Invalid list: node {len(nodes)} is owned by another list")
+            nodes.append(current)
+            previous = current
+            current = current.next
+        if len(nodes) != self.size:
+            raise ValueError(f"Invalid list: {len(nodes)} nodes but size is {self.size}")
+        if self.tail is not previous:
+            raise ValueError("Invalid list: tail is not the last node")
+        if self.index is not None:
+            self.index.validate((node.data, node) for node in nodes)
+            if self.numbered:
+                self.index.check_numbers(((node.data, node) for node in nodes), self.base)
+        return True
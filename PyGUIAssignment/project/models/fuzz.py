@@ -0,0 +1,324 @@
+"""Randomized differential checks for every list kind
+
+Run from the project directory (no GUI needed):
+    python -m models.fuzz [ops] [seed]
+Each list class (and each storage variant behind the manager) is driven by
+random operations alongside a plain Python list holding the same values;
+results must match after every step and validate() must pass throughout.
+Each check raises AssertionError when a list and its reference disagree.
+"""
+import random
+import sys
+from collections import deque
+from heapq import merge
+from itertools import islice
+from .journal import OperationJournal
+from .linked_lists import LinkedListManager, LIST_KINDS
+from .singly_list import SinglyLinkedList
+from .doubly_list import DoublyLinkedList
+from .pooled_doubly_list import PooledDoublyList
+from .unrolled_list import UnrolledLinkedList
+from .circular_singly_list import CircularSinglyLinkedList
+from .ring_buffer import RingCircularSinglyList
+from .circular_doubly_list import CircularDoublyLinkedList
+from .skip_list import SkipList
+
+
+# Sizes stay small so every position is hit often; a few distinct values
+# keep duplicates (and the index's handle sets) in play
+MAX_SIZE = 40
+VALUES = range(6)
+VALIDATE_EVERY = 16
+
+# (class, extra constructor options); tiny blocks make the unrolled list split and merge
+VARIANTS = {
+    "singly": (SinglyLinkedList, {}),
+    "doubly": (DoublyLinkedList, {}),
+    "pooled doubly": (PooledDoublyList, {}),
+    "unrolled doubly": (UnrolledLinkedList, {"block_size": 4}),
+    "circular singly": (CircularSinglyLinkedList, {}),
+    "ring circular singly": (RingCircularSinglyList, {"capacity": MAX_SIZE + 8}),
+    "circular doubly": (CircularDoublyLinkedList, {}),
+    "skip": (SkipList, {}),
+}
+
+MANAGER_OPTIONS = {
+    "plain": {},
+    "node pool": {"use_node_pool": True},
+    "unrolled": {"unrolled": True},
+    "ring buffer": {"ring_buffer": True},
+}
+
+
+def _values(rng, most=6):
+    return [rng.choice(VALUES) for i in range(rng.randrange(most + 1))]
+
+
+def _check(linked, ref, step):
+    assert linked.size == len(ref), f"step {step}: size {linked.size}, expected {len(ref)}"
+    assert linked.to_list() == ref, f"step {step}: {linked.to_list()} != {ref}"
+
+
+def _rejects(call, *args):
+    """True if call raised ValueError (the list's out-of-range / empty signal)"""
+    try:
+        call(*args)
+    except ValueError:
+        return True
+    return False
+
+
+def _step(linked, ref, rng, cls, options, indexed):
+    """Apply one random operation to linked and ref; return the (possibly new) list and ref"""
+    n = len(ref)
+    grow = n < MAX_SIZE - 8
+    op = rng.randrange(19)
+    value = rng.choice(VALUES)
+
+    if op < 3 and grow:
+        position = rng.choice([None, rng.randrange(n + 1)])
+        linked.insert(value, position)
+        ref.insert(n if position is None else position, value)
+    elif op == 3 and grow:
+        if rng.random() < 0.5:
+            linked.append(value)
+            ref.append(value)
+        else:
+            linked.appendleft(value)
+            ref.insert(0, value)
+    elif op < 7:
+        if not n:
+            assert _rejects(linked.delete), "delete on an empty list did not raise"
+        else:
+            position = rng.choice([None, rng.randrange(n)])
+            expected = ref.pop(-1 if position is None else position)
+            assert linked.delete(position) == expected, "delete returned the wrong value"
+    elif op == 7:
+        if n:
+            left = rng.random() < 0.5
+            expected = ref.pop(0 if left else -1)
+            assert (linked.popleft() if left else linked.pop()) == expected, "pop returned the wrong value"
+        else:
+            assert _rejects(linked.pop) and _rejects(linked.popleft), "pop on an empty list did not raise"
+    elif op == 8 and grow:
+        values = _values(rng)
+        position = rng.choice([None, rng.randrange(n + 1)])
+        assert linked.insert_many(position, values) == len(values), "insert_many miscounted"
+        at = n if position is None else position
+        ref[at:at] = values
+    elif op == 9 and grow:
+        values = _values(rng)
+        assert linked.extend(values) == len(values), "extend miscounted"
+        ref.extend(values)
+    elif op == 10:
+        start = rng.randrange(n + 1)
+        stop = rng.randrange(start, min(n, start + 8) + 1)
+        assert linked.pop_range(start, stop) == ref[start:stop], "pop_range returned the wrong values"
+        del ref[start:stop]
+    elif op == 11:
+        # Out-of-range requests must raise and leave the list untouched
+        assert _rejects(linked.insert, value, n + 1 + rng.randrange(3)), "insert past the end did not raise"
+        assert _rejects(linked.insert, value, -1 - rng.randrange(3)), "negative insert did not raise"
+        assert _rejects(linked.delete, n + rng.randrange(3)), "delete past the end did not raise"
+        assert _rejects(linked.pop_range, 0, n + 1), "pop_range past the end did not raise"
+    elif op == 12:
+        if hasattr(linked, "reverse"):
+            linked.reverse()
+            ref.reverse()
+        elif hasattr(linked, "reverse_inplace"):
+            linked.reverse_inplace()
+            ref.reverse()
+        elif hasattr(linked, "rotate"):
+            steps = rng.randrange(-n - 2, n + 3)
+            linked.rotate(steps)
+            if n:
+                steps %= n
+                ref[:] = ref[steps:] + ref[:steps]
+    elif op == 13:
+        assert linked.contains(value) == (value in ref), f"contains({value}) is wrong"
+        expected = ref.index(value) if value in ref else -1
+        assert linked.search(value) == expected, f"search({value}) is wrong"
+        assert linked.peek() == (ref[0] if ref else None), "peek is wrong"
+    elif op == 14 and hasattr(linked, "find"):
+        node = linked.find(value)
+        if value not in ref:
+            assert node is None, f"find({value}) found a missing value"
+        elif indexed or rng.random() < 0.5:
+            # Indexed lists may hand back any match (the longest-held one)
+            position = linked.index_of(node)
+            assert ref[position] == value, "find returned a node without the value"
+            assert indexed or position == ref.index(value), "find missed the first match"
+            assert linked.remove_node(node) == value, "remove_node returned the wrong value"
+            del ref[position]
+        else:
+            assert linked.delete_value(value), "delete_value missed a present value"
+            ref.remove(value)
+    elif op == 14 and hasattr(linked, "delete_value"):
+        assert linked.delete_value(value) == (value in ref), f"delete_value({value}) is wrong"
+        if value in ref:
+            ref.remove(value)
+    elif op == 15:
+        if hasattr(linked, "get") and n:
+            position = rng.randrange(n)
+            assert linked.get(position) == ref[position], "get is wrong"
+        if hasattr(linked, "iter_forward") and n:
+            limit = rng.randrange(3 * n)
+            walked = [step[1] for step in linked.iter_forward(None, limit)]
+            assert walked == [ref[i % n] for i in range(limit)], "iter_forward is wrong"
+        if hasattr(linked, "traverse_reverse"):
+            walked = [step[1] for step in islice(linked.traverse_reverse(), n)]
+            assert walked == ref[::-1], "traverse_reverse is wrong"
+    elif op == 16 and rng.random() < 0.1:
+        linked.clear()
+        ref.clear()
+    elif op == 17 and rng.random() < 0.1:
+        ref = _values(rng, MAX_SIZE // 2)
+        linked = cls.from_iterable(ref, indexed=indexed, **options)
+    elif op == 18:
+        key = rng.choice([None, _parity])
+        reverse = rng.random() < 0.5
+        linked.sort(key=key, reverse=reverse)
+        ref.sort(key=key, reverse=reverse)
+        if grow:
+            # Merge in sorted values, either plain or as a list giving up its nodes
+            values = sorted(_values(rng), key=key, reverse=reverse)
+            other = rng.choice([values, cls.from_iterable(values, indexed=indexed, **options)])
+            assert linked.merge_sorted(other, key=key, reverse=reverse) == len(values), \
+                "merge_sorted miscounted"
+            ref[:] = merge(ref, values, key=key, reverse=reverse)
+            if hasattr(other, "validate"):
+                other.validate()
+                assert not hasattr(other, "_unlink_all") or not other.size, "merged nodes left behind"
+    return linked, ref
+
+
+def _parity(value):
+    return value % 2
+
+
+def fuzz_list(name, ops=20_000, seed=0, indexed=False):
+    """Drive one list class with random operations against a Python list"""
+    cls, options = VARIANTS[name]
+    rng = random.Random(seed)
+    linked = cls(indexed=indexed, **options)
+    ref = []
+    for step in range(ops):
+        linked, ref = _step(linked, ref, rng, cls, options, indexed)
+        if step % VALIDATE_EVERY == 0:
+            linked.validate()
+            _check(linked, ref, step)
+    linked.validate()
+    _check(linked, ref, ops)
+    return linked
+
+
+def fuzz_manager(ops=20_000, seed=0, capacity=12, **options):
+    """
+    Random manager operations on every kind under a capacity, with a journal:
+    every few steps a random number of steps is undone and redone, and each
+    list must match the snapshot taken when that step was made.
+    """
+    rng = random.Random(seed)
+    journal = OperationJournal(max_steps=64)
+    manager = LinkedListManager(capacity=capacity, journal=journal, **options)
+    refs = {kind: [] for kind in LIST_KINDS}
+
+    def snapshot():
+        return {kind: list(ref) for kind, ref in refs.items()}
+
+    def latest():
+        return journal.undo_steps[-1] if journal.undo_steps else None
+
+    # history[-1 - k] is the state k journaled steps back
+    history = deque([snapshot()], maxlen=journal.undo_steps.maxlen + 1)
+
+    def matches(expected, step):
+        manager.validate()
+        for kind in LIST_KINDS:
+            _check(getattr(manager, f"{kind}_list"), expected[kind], step)
+
+    for step in range(ops):
+        kind = rng.choice(LIST_KINDS)
+        ref = refs[kind]
+        n = len(ref)
+        value = rng.choice(VALUES)
+        op = rng.randrange(9)
+        before = latest()
+        try:
+            if op < 3:
+                position = rng.choice([None, rng.randrange(n + 2)])
+                getattr(manager, f"{kind}_insert")(value, position)
+                ref.insert(n if position is None else position, value)
+            elif op == 4 and kind in ("singly", "circular_singly") and rng.random() < 0.5:
+                # These delete the first match; node-handle kinds may take any (see find)
+                getattr(manager, f"{kind}_delete_value")(value)
+                ref.remove(value)
+            elif op < 5:
+                position = rng.choice([None, rng.randrange(n + 1)])
+                getattr(manager, f"{kind}_delete")(position)
+                del ref[-1 if position is None else position]
+            elif op == 5:
+                values = _values(rng)
+                position = rng.randrange(n + 1)
+                count = min(len(values), capacity - n)
+                if count < len(values):
+                    assert _rejects(getattr(manager, f"{kind}_insert_many"), position, values), \
+                        f"{kind}: insert_many past capacity did not raise"
+                else:
+                    getattr(manager, f"{kind}_insert_many")(position, values)
+                    ref[position:position] = values
+            elif op == 6:
+                start = rng.randrange(n + 1)
+                stop = rng.randrange(start, n + 1)
+                getattr(manager, f"{kind}_delete_range")(start, stop)
+                del ref[start:stop]
+            elif op == 8:
+                values = _values(rng)
+                if ref == sorted(ref) and len(values) <= capacity - n:
+                    getattr(manager, f"{kind}_merge_sorted")(values)
+                    ref[:] = merge(ref, sorted(values))
+                else:
+                    reverse = rng.random() < 0.3
+                    getattr(manager, f"{kind}_sort")(reverse)
+                    ref.sort(reverse=reverse)
+            elif hasattr(manager, f"{kind}_reverse"):
+                getattr(manager, f"{kind}_reverse")()
+                ref.reverse()
+            elif kind == "circular_singly" and n:
+                steps = rng.randrange(1, n + 1)
+                manager.circular_singly_rotate(steps)
+                ref[:] = ref[steps % n:] + ref[:steps % n]
+            else:
+                getattr(manager, f"{kind}_clear")()
+                ref.clear()
+        except ValueError:
+            # Full, empty or out of range: the manager must have left everything alone
+            assert latest() is before, f"{kind}: a rejected operation was journaled"
+        if latest() is not before:
+            history.append(snapshot())
+
+        if step % VALIDATE_EVERY == 0:
+            matches(refs, step)
+        if step % 50 == 49 and journal.can_undo():
+            back = rng.randrange(1, len(journal.undo_steps) + 1)
+            for i in range(back):
+                manager.undo()
+            matches(history[-1 - back], step)
+            for i in range(back):
+                manager.redo()
+            matches(refs, step)
+    matches(refs, ops)
+    return manager
+
+
+if __name__ == "__main__":
+    ops = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    seed = int(sys.argv[2]) if len(sys.argv) > 2 else 0
+    for name in VARIANTS:
+        for indexed in (False, True):
+            fuzz_list(name, ops, seed, indexed)
+            print(f"{name}{' (indexed)' if indexed else ''}: {ops:,} ops ok")
+    for label, options in MANAGER_OPTIONS.items():
+        for indexed in (False, True):
+            fuzz_manager(ops, seed, indexed=indexed, **options)
+            print(f"manager, {label}{' (indexed)' if indexed else ''}: {ops:,} ops ok")
@@ -0,0 +1,290 @@
+"""
+Opt-in operation counters and timing for the managers.
+
+Instrumentation.attach(manager) shadows each public manager method with a
+timed wrapper on that one instance, and swaps the manager's lists onto
+counting subclasses so every node a call walks over (the O(n) positional
+seeks of the singly, doubly and circular lists, the block hops of the
+unrolled list, and every full traversal) is charged to that call. The ring
+buffer list and the skip list are not counted: the ring does slot
+arithmetic and the skip list's O(log n) seeks are not tallied, so calls on
+them show a blank nodes column instead of a misleading 0. A manager that
+is never attached runs the plain class methods with no overhead at all;
+detach() removes the wrappers and puts its lists back on their plain
+classes.
+"""
+import functools
+import math
+import time
+from collections import deque
+from .singly_list import SinglyLinkedList
+from .doubly_list import DoublyLinkedList
+from .circular_singly_list import CircularSinglyLinkedList
+from .circular_doubly_list import CircularDoublyLinkedList
+from .pooled_doubly_list import PooledDoublyList
+from .ring_buffer import RingCircularSinglyList
+from .skip_list import SkipList
+from .unrolled_list import UnrolledLinkedList
+
+SAMPLES = 1024
+
+
+def _nearer_end(linked, index):
+    return index if index <= linked.size // 2 else linked.size - 1 - index
+
+
+def _from_head(linked, index):
+    return 0 if index in (-1, linked.size - 1) else index
+
+
+# Links followed by _node_at(index), mirroring each class's seek
+WALKS = {
+    SinglyLinkedList: _from_head,
+    CircularSinglyLinkedList: _from_head,
+    DoublyLinkedList: _nearer_end,
+    PooledDoublyList: _nearer_end,
+    CircularDoublyLinkedList: _nearer_end,
+}
+# Lists whose positional work is not counted (see the module docstring)
+UNCOUNTED = (RingCircularSinglyList, SkipList)
+# Iterators that visit one node per item they yield
+TRAVERSALS = ("__iter__", "__reversed__", "iter_forward", "iter_reverse")
+LIST_CLASSES = (SinglyLinkedList, DoublyLinkedList, CircularSinglyLinkedList,
+                CircularDoublyLinkedList, PooledDoublyList, RingCircularSinglyList,
+                SkipList, UnrolledLinkedList)
+
+
+class MethodStats:
+    """Calls, failures, latency and nodes walked for one manager method"""
+    def __init__(self, samples=SAMPLES):
+        self.calls = 0
+        self.errors = 0
+        self.total = 0.0
+        self.slowest = 0.0
+        self.walked = 0
+        self.uncounted = False
+        self.samples = deque(maxlen=samples)
+
+    def add(self, seconds, walked, failed):
+        """walked is None for a call on a list whose walks are not counted"""
+        self.calls += 1
+        self.errors += failed
+        self.total += seconds
+        self.slowest = max(self.slowest, seconds)
+        if walked is None:
+            self.uncounted = True
+        else:
+            self.walked += walked
+        self.samples.append(seconds)
+
+    def percentile(self, p):
+        """Nearest-rank percentile (0-100) of the recent latencies, in seconds"""
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        return ordered[max(0, math.ceil(p / 100 * len(ordered)) - 1)]
+
+    def summary(self):
+        """Plain dict of the figures (times in microseconds)"""
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "total_us": self.total * 1e6,
+            "mean_us": self.total / self.calls * 1e6 if self.calls else 0.0,
+            "p50_us": self.percentile(50) * 1e6,
+            "p95_us": self.percentile(95) * 1e6,
+            "p99_us": self.percentile(99) * 1e6,
+            "max_us": self.slowest * 1e6,
+            "nodes": None if self.uncounted else self.walked,
+            "nodes_per_call": None if self.uncounted else
+                              self.walked / self.calls if self.calls else 0.0,
+        }
+
+
+class Instrumentation:
+    """
+    Per-method statistics for every manager attached to it, keyed by
+    method name (e.g. 'doubly_insert', 'push'). Attaching several managers
+    pools their figures; pass prefix to keep them apart.
+    """
+    def __init__(self, samples=SAMPLES):
+        self.samples = samples
+        self.stats = {}
+        self.walked = 0
+        self._counted = {}
+        self._attached = {}
+
+    # Lists
+    def _counting_class(self, cls):
+        """A subclass of cls that charges each node it walks to self.walked"""
+        counted = self._counted.get(cls)
+        if counted is not None:
+            return counted
+        probe = self
+        namespace = {"__module__": cls.__module__, "__qualname__": cls.__qualname__}
+        walk = WALKS.get(cls)
+        if walk is not None:
+            node_at = cls._node_at
+
+            def _node_at(linked, index):
+                probe.walked += walk(linked, index)
+                return node_at(linked, index)
+            namespace["_node_at"] = _node_at
+        if cls is UnrolledLinkedList:
+            namespace["_locate"] = _counting_locate(probe)
+        for name in TRAVERSALS:
+            if hasattr(cls, name):
+                namespace[name] = _counting_iterator(probe, getattr(cls, name))
+        counted = type(cls.__name__, (cls,), namespace)
+        counted.plain_class = cls
+        self._counted[cls] = counted
+        return counted
+
+    def _track(self, manager, names):
+        """Move the manager's current lists onto counting classes (lists get swapped by undo/load)"""
+        for name in names:
+            linked = getattr(manager, name)
+            if type(linked) in LIST_CLASSES:
+                linked.__class__ = self._counting_class(type(linked))
+
+    def _untrack(self, manager):
+        for linked in _lists_held_by(manager):
+            if getattr(type(linked), "plain_class", None) is not None:
+                linked.__class__ = type(linked).plain_class
+
+    # Managers
+    def attach(self, manager, prefix=""):
+        """
+        Start recording every public method of manager.
+        The counters work by reassigning __class__ on the live list objects
+        (and on lists swapped in later by undo or load), so until detach()
+        type(linked) is the counting subclass: exact type() checks fail and
+        pickling the lists fails, as the subclass cannot be found by name.
+        isinstance() still holds.
+        """
+        if id(manager) in self._attached:
+            return manager
+        lists = [name for name, value in vars(manager).items() if isinstance(value, LIST_CLASSES)]
+        names = []
+        for name in dir(type(manager)):
+            method = getattr(manager, name)
+            if name.startswith("_") or not callable(method):
+                continue
+            target = _target_list(name, lists)
+            setattr(manager, name, self._timed(manager, lists, target, prefix + name, method))
+            names.append(name)
+        self._attached[id(manager)] = (manager, names)
+        self._track(manager, lists)
+        return manager
+
+    def detach(self, manager):
+        """Stop recording manager and restore its plain methods and lists"""
+        manager, names = self._attached.pop(id(manager), (manager, ()))
+        for name in names:
+            vars(manager).pop(name, None)
+        self._untrack(manager)
+        return manager
+
+    def detach_all(self):
+        for manager, names in list(self._attached.values()):
+            self.detach(manager)
+
+    def _timed(self, manager, lists, target, name, method):
+        """target is the list attribute the method works on (None if unknown)"""
+        stats = self.stats.get(name)
+        if stats is None:
+            stats = self.stats[name] = MethodStats(self.samples)
+
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            self._track(manager, lists)
+            walked = self.walked
+            failed = True
+            start = time.perf_counter()
+            try:
+                result = method(*args, **kwargs)
+                failed = False
+                return result
+            finally:
+                elapsed = time.perf_counter() - start
+                if target is not None and isinstance(getattr(manager, target), UNCOUNTED):
+                    stats.add(elapsed, None, failed)
+                else:
+                    stats.add(elapsed, self.walked - walked, failed)
+        return wrapper
+
+    # Reading the figures
+    def reset(self):
+        """Zero every counter, keeping the managers attached"""
+        for stats in self.stats.values():
+            stats.__init__(self.samples)
+        self.walked = 0
+
+    def report(self):
+        """{method name: summary dict} for every method called at least once"""
+        return {name: stats.summary() for name, stats in self.stats.items() if stats.calls}
+
+    def lines(self, top=None):
+        """Human-readable report lines, busiest (by total time) first"""
+        report = sorted(self.report().items(), key=lambda item: item[1]["total_us"], reverse=True)
+        if not report:
+            return ["No operations recorded yet"]
+        lines = [f"{'method':<28}{'calls':>7}{'err':>5}{'mean us':>10}{'p50':>9}"
+                 f"{'p95':>9}{'p99':>9}{'nodes/call':>12}"]
+        for name, s in report[:top]:
+            nodes = "" if s['nodes_per_call'] is None else f"{s['nodes_per_call']:.1f}"
+            lines.append(f"{name:<28}{s['calls']:>7}{s['errors']:>5}{s['mean_us']:>10.1f}"
+                         f"{s['p50_us']:>9.1f}{s['p95_us']:>9.1f}{s['p99_us']:>9.1f}"
+                         f"{nodes:>12}")
+        return lines
+
+
+def _counting_iterator(probe, method):
+    @functools.wraps(method)
+    def wrapper(linked, *args, **kwargs):
+        for item in method(linked, *args, **kwargs):
+            probe.walked += 1
+            yield item
+    return wrapper
+
+
+def _counting_locate(probe):
+    """UnrolledLinkedList._locate, charging each block it steps past"""
+    def _locate(linked, index):
+        if index <= linked.size // 2:
+            block = linked.head
+            while index > len(block.values) or (index == len(block.values) and block.next):
+                index -= len(block.values)
+                block = block.next
+                probe.walked += 1
+            return block, index
+        block = linked.tail
+        remaining = linked.size - index
+        while remaining > len(block.values):
+            remaining -= len(block.values)
+            block = block.prev
+            probe.walked += 1
+        return block, len(block.values) - remaining
+    return _locate
+
+
+def _target_list(name, lists):
+    """The list attribute a manager method works on, by its kind_ prefix (skip_insert -> skip_list)"""
+    for attr in lists:
+        if attr.endswith("_list") and name.startswith(attr[:-len("list")]):
+            return attr
+    return None
+
+
+def _lists_held_by(manager):
+    """Lists the manager holds now, plus older ones its journal can swap back in"""
+    held = [value for value in vars(manager).values() if isinstance(value, LIST_CLASSES)]
+    journal = getattr(manager, "journal", None)
+    if journal is not None:
+        for step in list(journal.undo_steps) + journal.redo_steps:
+            for redo, redo_args, undo, undo_args in step:
+                for part in (redo, undo, *redo_args, *undo_args):
+                    part = getattr(part, "__self__", part)
+                    if isinstance(part, LIST_CLASSES):
+                        held.append(part)
+    return held
@@ -0,0 +1,84 @@
+"""Undo/redo journal of compact inverse operations"""
+import threading
+from collections import deque
+from contextlib import contextmanager
+
+class OperationJournal:
+    """
+    Records each mutation as (redo, redo_args, undo, undo_args) so it can be
+    reversed or replayed without copying the structure it changed.
+    One journal can be shared by several managers to get a single history,
+    also across threads: every method holds the journal's lock, and a batch
+    holds it for its whole block, so other threads' records wait for the
+    batch to close instead of landing in it.
+    """
+    def __init__(self, max_steps=1000):
+        """max_steps bounds the undo history; the oldest steps are dropped first"""
+        self.undo_steps = deque(maxlen=max_steps)
+        self.redo_steps = []
+        self._batch = None
+        self._depth = 0
+        self.lock = threading.RLock()
+
+    def record(self, redo, redo_args, undo, undo_args):
+        """Add one operation and its inverse to the history"""
+        entry = (redo, redo_args, undo, undo_args)
+        with self.lock:
+            if self._batch is not None:
+                self._batch.append(entry)
+                return
+            self.undo_steps.append((entry,))
+            self.redo_steps.clear()
+
+    @contextmanager
+    def batch(self):
+        """Group every operation recorded inside the block into one undo step"""
+        with self.lock:
+            if self._depth == 0:
+                self._batch = []
+            self._depth += 1
+            try:
+                yield self
+            finally:
+                self._depth -= 1
+                if self._depth == 0:
+                    entries, self._batch = self._batch, None
+                    if entries:
+                        self.undo_steps.append(tuple(entries))
+                        self.redo_steps.clear()
+
+    def can_undo(self):
+        """Check if there is a step to undo"""
+        return bool(self.undo_steps)
+
+    def can_redo(self):
+        """Check if there is a step to redo"""
+        return bool(self.redo_steps)
+
+    def undo(self):
+        """Reverse the latest step and return how many operations it held"""
+        with self.lock:
+            if not self.undo_steps:
+                raise ValueError("Nothing to undo!")
+            step = self.undo_steps.pop()
+            for redo, redo_args, undo, undo_args in reversed(step):
+                undo(*undo_args)
+            self.redo_steps.append(step)
+            return len(step)
+
+    def redo(self):
+        """Replay the latest undone step and return how many operations it held"""
+        with self.lock:
+            if not self.redo_steps:
+                raise ValueError("Nothing to redo!")
+            step = self.redo_steps.pop()
+            for redo, redo_args, undo, undo_args in step:
+                redo(*redo_args)
+            self.undo_steps.append(step)
+            return len(step)
+
+    def clear(self):
+        """Forget the whole history"""
+        with self.lock:
+            self.undo_steps.clear()
+            self.redo_steps.clear()
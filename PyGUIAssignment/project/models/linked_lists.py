@@ -1,418 +1,794 @@
 """Linked list data structures and operations"""
-from .node import Node
+from contextlib import nullcontext
+from heapq import merge
+from itertools import chain
+from .singly_list import SinglyLinkedList
+from .circular_singly_list import CircularSinglyLinkedList
+from .doubly_list import DoublyLinkedList
+from .circular_doubly_list import CircularDoublyLinkedList
+from .pooled_doubly_list import PooledDoublyList
+from .ring_buffer import RingCircularSinglyList
+from .skip_list import SkipList
+from .unrolled_list import UnrolledLinkedList
 
 MAX_NODES = 10
+LIST_KINDS = ("singly", "doubly", "circular_singly", "circular_doubly", "skip")
 
 class LinkedListManager:
-    def __init__(self):
-        self.singly_list = []
-        self.doubly_head = None
-        self.circular_singly_list = []
-        self.circular_doubly_head = None
+    def __init__(self, capacity=MAX_NODES, use_node_pool=False, indexed=False, journal=None,
+                 ring_buffer=False, unrolled=False):
+        """
+        capacity caps each list's node count (None for unbounded);
+        use_node_pool stores the doubly list in parallel arrays instead of Node objects;
+        unrolled stores the doubly list in blocks of values (node handles become positions);
+        ring_buffer stores the circular singly list in a preallocated ring of
+        capacity slots (needs a capacity);
+        indexed keeps a value index on every list for O(1) contains;
+        journal is an OperationJournal that records every mutation for undo/redo
+        """
+        self.capacity = capacity
+        self.indexed = indexed
+        self.journal = journal
+        self.singly_list = SinglyLinkedList(indexed)
+        if unrolled:
+            doubly_cls = UnrolledLinkedList
+        else:
+            doubly_cls = PooledDoublyList if use_node_pool else DoublyLinkedList
+        self.doubly_list = doubly_cls(indexed)
+        if ring_buffer:
+            self.circular_singly_list = RingCircularSinglyList(indexed, capacity)
+        else:
+            self.circular_singly_list = CircularSinglyLinkedList(indexed)
+        self.circular_doubly_list = CircularDoublyLinkedList(indexed)
+        self.skip_list = SkipList(indexed)
+        # Attributes of the lists kept sorted (ordered-insert mode)
+        self.ordered = set()
+    
+    def _check_capacity(self, size):
+        """Raise if a list of the given size cannot take another node"""
+        if self.capacity is not None and size >= self.capacity:
+            raise ValueError(f"List is full! Maximum {self.capacity} nodes allowed.")
+    
+    def _room(self, linked):
+        """How many more nodes fit in linked (None if unbounded)"""
+        if self.capacity is None:
+            return None
+        return max(self.capacity - linked.size, 0)
+    
+    # Journal records hold the list's own bound methods and positions, never copies
+    def _record(self, redo, redo_args, undo, undo_args):
+        """Add one operation and its inverse to the journal, if there is one"""
+        if self.journal is not None:
+            self.journal.record(redo, redo_args, undo, undo_args)
+    
+    def _record_insert(self, linked, value, position):
+        """Record an insert at position; its inverse deletes that position"""
+        self._record(linked.insert, (value, position), linked.delete, (position,))
+    
+    def _record_delete(self, linked, value, position):
+        """Record a delete at position; its inverse re-inserts the value there"""
+        self._record(linked.delete, (position,), linked.insert, (value, position))
+    
+    def _replace(self, attr, linked):
+        """Swap in a whole new list object; the old one is kept only by the journal"""
+        old = getattr(self, attr)
+        setattr(self, attr, linked)
+        self._record(setattr, (self, attr, linked), setattr, (self, attr, old))
+    
+    def _clear(self, attr):
+        """Clear in place, or swap in an empty list so the journal can restore the old one"""
+        linked = getattr(self, attr)
+        if self.journal is None:
+            linked.clear()
+        else:
+            self._from_iterable(attr, ())
+    
+    def _splice_values(self, linked, position, values):
+        """Bulk insert up to the capacity and return how many values went in"""
+        start = linked.size if position is None else position
+        if self.journal is not None:
+            values = list(values)
+        count = linked.insert_many(position, values, self._room(linked))
+        if count and self.journal is not None:
+            self._record(linked.insert_many, (start, values[:count]),
+                         linked.delete_range, (start, start + count))
+        return count
+    
+    def _extend(self, linked, values, suffix):
+        """Bulk append with a single summary message (a merge if the list is kept sorted)"""
+        attr = self._ordered_attr(linked)
+        if attr is not None:
+            return self._merge_sorted(attr, values, suffix)
+        count = self._splice_values(linked, None, values)
+        return f"Inserted {count} values at end{suffix}"
+    
+    def _insert_many(self, linked, position, values, suffix):
+        """Bulk positional insert with a single summary message"""
+        self._check_unordered(linked, "insert at a position")
+        count = self._splice_values(linked, position, values)
+        return f"Inserted {count} values at position {position}{suffix}"
+    
+    def _delete_range(self, linked, start, stop, suffix):
+        """Bulk positional delete with a single summary message"""
+        if self.journal is None:
+            count = linked.delete_range(start, stop)
+        else:
+            values = linked.pop_range(start, stop)
+            count = len(values)
+            if count:
+                self._record(linked.delete_range, (start, stop),
+                             linked.insert_many, (start, values))
+        return f"Deleted {count} values from positions {start}-{stop - 1}{suffix}"
+    
+    def _reverse(self, reverse):
+        """Reverse a list with its self-inverse reverse method"""
+        self._check_unordered(reverse.__self__, "reverse it")
+        reverse()
+        self._record(reverse, (), reverse, ())
+    
+    def _remove_node(self, linked, node):
+        """Unlink a node handle; its position is only looked up when journaling"""
+        position = linked.index_of(node) if self.journal is not None else None
+        value = linked.remove_node(node)
+        if position is not None:
+            self._record_delete(linked, value, position)
+        return value
+    
+    def _delete_value(self, linked, value):
+        """Delete a node holding value (see find) or raise if there is none"""
+        node = linked.find(value)
+        if node is None:
+            raise ValueError(f"Value '{value}' not found")
+        self._remove_node(linked, node)
+    
+    def _delete_first(self, linked, value):
+        """Delete the first node holding value by position (lists without node handles) or raise if there is none"""
+        position = linked.search(value)
+        if position == -1:
+            raise ValueError(f"Value '{value}' not found")
+        linked.delete(position)
+        self._record_delete(linked, value, position)
+    
+    def _build(self, attr, values):
+        """A new list of attr's class holding values (sorted if that list is kept sorted), not swapped in"""
+        list_cls = type(getattr(self, attr))
+        if attr in self.ordered:
+            values = _sorted(values)
+        return list_cls.from_iterable(values, self.capacity, indexed=self.indexed)
+    
+    def _from_iterable(self, attr, values):
+        """Replace a whole list with values (sorted if the list is kept sorted) and return the new one"""
+        linked = self._build(attr, values)
+        self._replace(attr, linked)
+        return linked
+    
+    # Sorting and ordered-insert mode
+    def _ordered_attr(self, linked):
+        """The attribute holding linked if that list is kept sorted, else None"""
+        for attr in self.ordered:
+            if getattr(self, attr) is linked:
+                return attr
+        return None
+    
+    def _check_unordered(self, linked, action):
+        if self._ordered_attr(linked) is not None:
+            raise ValueError(f"List is kept sorted; turn off ordered mode to {action}")
+    
+    def _place(self, attr, value, position):
+        """
+        Position that keeps a sorted list sorted (after equal values; None for
+        the end), or position unchanged when the list is not kept sorted
+        """
+        if attr not in self.ordered:
+            return position
+        if position is not None:
+            raise ValueError("List is kept sorted; insert without a position")
+        linked = getattr(self, attr)
+        try:
+            if hasattr(linked, 'bisect_right'):
+                # The skip list seeks down its levels in O(log n)
+                position = linked.bisect_right(value)
+                return None if position == linked.size else position
+            for i, data in enumerate(linked):
+                if value < data:
+                    return i
+        except TypeError as e:
+            raise ValueError(f"Values cannot be ordered: {e}") from None
+        return None
+    
+    def _sort(self, attr, reverse, suffix):
+        """Sort by relinking the nodes, or (when journaling) swap in a sorted copy so undo can restore the old order"""
+        linked = getattr(self, attr)
+        if self.journal is None:
+            _check_comparable(linked)
+            linked.sort(reverse=reverse)
+        else:
+            linked = self._from_iterable(attr, _sorted(linked, reverse))
+        order = "descending" if reverse else "ascending"
+        return f"Sorted {linked.size} values {order}{suffix}"
+    
+    def _merge_sorted(self, attr, values, suffix):
+        """Merge values (sorted first) into a sorted list, up to the capacity"""
+        linked = getattr(self, attr)
+        values = _sorted(values)
+        room = self._room(linked)
+        if room is not None and len(values) > room:
+            raise ValueError(f"List is full! Only {room} more nodes fit.")
+        _check_comparable(chain(linked, values))
+        if self.journal is None:
+            linked.merge_sorted(values)
+        else:
+            self._from_iterable(attr, merge(linked, values))
+        return f"Merged {len(values)} values in order{suffix}"
+    
+    def _set_ordered(self, attr, on, suffix):
+        """Turn ordered-insert mode on (sorting the list ascending) or off"""
+        if on == (attr in self.ordered):
+            return f"Ordered mode already {'on' if on else 'off'}{suffix}"
+        batch = self.journal.batch() if self.journal is not None else nullcontext()
+        with batch:
+            if on:
+                self._sort(attr, False, suffix)
+                self.ordered.add(attr)
+                self._record(self.ordered.add, (attr,), self.ordered.discard, (attr,))
+            else:
+                self.ordered.discard(attr)
+                self._record(self.ordered.discard, (attr,), self.ordered.add, (attr,))
+        if on:
+            return f"Keeping list sorted{suffix}"
+        return f"Stopped keeping list sorted{suffix}"
+    
+    def undo(self):
+        """Reverse the latest journaled step"""
+        if self.journal is None:
+            raise ValueError("Undo is not enabled!")
+        count = self.journal.undo()
+        return f"Undid {count} operation(s)"
+    
+    def redo(self):
+        """Replay the latest undone step"""
+        if self.journal is None:
+            raise ValueError("Undo is not enabled!")
+        count = self.journal.redo()
+        return f"Redid {count} operation(s)"
     
     # Singly Linked List Methods
     def singly_insert(self, value, position=None):
         """Insert into singly linked list"""
-        if len(self.singly_list) >= MAX_NODES:
-            raise ValueError(f"List is full! Maximum {MAX_NODES} nodes allowed.")
+        self._check_capacity(self.singly_list.size)
+        position = self._place('singly_list', value, position)
         
+        linked = self.singly_list
+        at = linked.size if position is None else position
+        linked.insert(value, position)
+        self._record_insert(linked, value, at)
         if position is not None:
-            if position < 0 or position > len(self.singly_list):
-                raise ValueError(f"Position must be between 0 and {len(self.singly_list)}")
-            self.singly_list.insert(position, value)
             return f"Inserted '{value}' at position {position}"
-        else:
-            self.singly_list.append(value)
-            return f"Inserted '{value}' at end"
+        return f"Inserted '{value}' at end"
     
     def singly_delete(self, position=None):
         """Delete from singly linked list"""
-        if not self.singly_list:
-            raise ValueError("List is empty!")
-        
+        linked = self.singly_list
+        at = linked.size - 1 if position is None else position
+        value = linked.delete(position)
+        self._record_delete(linked, value, at)
         if position is None:
-            value = self.singly_list.pop()
             return f"Deleted '{value}' from end"
-        else:
-            if position < 0 or position >= len(self.singly_list):
-                raise ValueError(f"Position must be between 0 and {len(self.singly_list)-1}")
-            value = self.singly_list.pop(position)
-            return f"Deleted '{value}' from position {position}"
+        return f"Deleted '{value}' from position {position}"
     
     def singly_traverse(self):
         """Traverse singly linked list"""
-        if not self.singly_list:
-            return []
-        return [(i, value) for i, value in enumerate(self.singly_list)]
+        return self.singly_list.traverse()
+    
+    def singly_reverse(self):
+        """Reverse the singly linked list in place"""
+        self._reverse(self.singly_list.reverse_inplace)
+        return "Reversed singly linked list"
     
     def singly_clear(self):
         """Clear singly linked list"""
-        self.singly_list.clear()
+        self._clear('singly_list')
     
     def get_singly_list(self):
         """Get singly linked list"""
-        return self.singly_list
+        return self.singly_list.to_list()
     
     def singly_peek(self):
         """Peek at the first element"""
-        if not self.singly_list:
-            return None
-        return self.singly_list[0]
+        return self.singly_list.peek()
+    
+    def singly_contains(self, value):
+        """Check whether the singly linked list holds value"""
+        return self.singly_list.contains(value)
+    
+    def singly_search(self, value):
+        """Position of value in the singly linked list from the head, or -1"""
+        return self.singly_list.search(value)
+    
+    def singly_delete_value(self, value):
+        """Delete the first node holding value from the singly linked list"""
+        self._delete_first(self.singly_list, value)
+        return f"Deleted '{value}'"
+    
+    def singly_extend(self, values):
+        """Append many values to the singly linked list in one pass"""
+        return self._extend(self.singly_list, values, "")
+    
+    def singly_insert_many(self, position, values):
+        """Insert many values into the singly linked list starting at position"""
+        return self._insert_many(self.singly_list, position, values, "")
+    
+    def singly_delete_range(self, start, stop):
+        """Delete positions start..stop-1 from the singly linked list"""
+        return self._delete_range(self.singly_list, start, stop, "")
+    
+    def singly_from_iterable(self, values):
+        """Replace the singly linked list with values"""
+        linked = self._from_iterable('singly_list', values)
+        return f"Loaded {linked.size} values"
+    
+    def singly_sort(self, reverse=False):
+        """Sort the singly linked list (stable)"""
+        return self._sort('singly_list', reverse, "")
+    
+    def singly_merge_sorted(self, values):
+        """Merge values into the sorted singly linked list, keeping it sorted"""
+        return self._merge_sorted('singly_list', values, "")
+    
+    def singly_set_ordered(self, on=True):
+        """Keep the singly linked list sorted: inserts find their own position"""
+        return self._set_ordered('singly_list', on, "")
     
     # Doubly Linked List Methods
     def doubly_insert(self, value, position=None):
         """Insert into doubly linked list"""
-        # Count nodes
-        count = 0
-        temp = self.doubly_head
-        while temp:
-            count += 1
-            temp = temp.next
-        
-        if count >= MAX_NODES:
-            raise ValueError(f"List is full! Maximum {MAX_NODES} nodes allowed.")
-        
-        new_node = Node(value)
+        self._check_capacity(self.doubly_list.size)
+        position = self._place('doubly_list', value, position)
         
-        if not self.doubly_head:
-            self.doubly_head = new_node
+        linked = self.doubly_list
+        at = linked.size if position is None else position
+        if not linked.size:
+            if position not in (None, 0):
+                raise ValueError("Position out of range")
+            linked.append(value)
+            self._record_insert(linked, value, 0)
             return f"Inserted '{value}' as first node"
         
+        linked.insert(value, position)
+        self._record_insert(linked, value, at)
         if position is None:
-            # Insert at end
-            current = self.doubly_head
-            while current.next:
-                current = current.next
-            current.next = new_node
-            new_node.prev = current
             return f"Inserted '{value}' at end"
-        
-        if position == 0:
-            new_node.next = self.doubly_head
-            self.doubly_head.prev = new_node
-            self.doubly_head = new_node
-            return f"Inserted '{value}' at position 0"
-        
-        current = self.doubly_head
-        for i in range(position - 1):
-            if not current:
-                raise ValueError("Position out of range")
-            current = current.next
-        
-        if not current:
-            raise ValueError("Position out of range")
-        
-        new_node.next = current.next
-        new_node.prev = current
-        if current.next:
-            current.next.prev = new_node
-        current.next = new_node
         return f"Inserted '{value}' at position {position}"
     
     def doubly_delete(self, position=None):
         """Delete from doubly linked list"""
-        if not self.doubly_head:
+        linked = self.doubly_list
+        if not linked.size:
             raise ValueError("List is empty!")
         
         if position is None:
-            # Delete last node
-            if not self.doubly_head.next:
-                value = self.doubly_head.data
-                self.doubly_head = None
+            last_node = linked.size == 1
+            value = linked.pop()
+            self._record_delete(linked, value, linked.size)
+            if last_node:
                 return f"Deleted '{value}' (last node)"
-            
-            current = self.doubly_head
-            while current.next:
-                current = current.next
-            value = current.data
-            current.prev.next = None
             return f"Deleted '{value}' from end"
         
-        if position == 0:
-            value = self.doubly_head.data
-            self.doubly_head = self.doubly_head.next
-            if self.doubly_head:
-                self.doubly_head.prev = None
-            return f"Deleted '{value}' from position 0"
-        
-        current = self.doubly_head
-        for i in range(position):
-            if not current:
-                raise ValueError("Position out of range")
-            current = current.next
-        
-        if not current:
-            raise ValueError("Position out of range")
-        
-        value = current.data
-        if current.prev:
-            current.prev.next = current.next
-        if current.next:
-            current.next.prev = current.prev
+        value = linked.delete(position)
+        self._record_delete(linked, value, position)
         return f"Deleted '{value}' from position {position}"
     
     def doubly_traverse_forward(self):
         """Traverse doubly linked list forward"""
-        if not self.doubly_head:
-            return []
-        
-        result = []
-        current = self.doubly_head
-        i = 0
-        while current:
-            result.append((i, current.data))
-            current = current.next
-            i += 1
-        return result
+        return self.doubly_list.traverse_forward()
     
     def doubly_traverse_reverse(self):
         """Traverse doubly linked list in reverse"""
-        if not self.doubly_head:
-            return []
-        
-        # Go to end
-        current = self.doubly_head
-        while current.next:
-            current = current.next
-        
-        result = []
-        i = 0
-        while current:
-            result.append((i, current.data))
-            current = current.prev
-            i += 1
-        return result
+        return self.doubly_list.traverse_reverse()
+    
+    def doubly_reverse(self):
+        """Reverse the doubly linked list in O(1)"""
+        self._reverse(self.doubly_list.reverse)
+        return "Reversed doubly linked list"
     
     def doubly_clear(self):
         """Clear doubly linked list"""
-        self.doubly_head = None
-    
-    def get_doubly_list(self):
-        """Get doubly linked list as array"""
-        if not self.doubly_head:
-            return []
-        nodes = []
-        current = self.doubly_head
-        while current:
-            nodes.append(current.data)
-            current = current.next
-        return nodes
+        self._clear('doubly_list')
+    
+    def get_doubly_list(self, reverse=False):
+        """Get doubly linked list as array (last node first if reverse)"""
+        if reverse:
+            return list(reversed(self.doubly_list))
+        return self.doubly_list.to_list()
     
     def doubly_peek(self):
         """Peek at the first element"""
-        if not self.doubly_head:
-            return None
-        return self.doubly_head.data
+        return self.doubly_list.peek()
+    
+    def doubly_contains(self, value):
+        """Check whether the doubly linked list holds value"""
+        return self.doubly_list.contains(value)
+    
+    def doubly_search(self, value):
+        """Position of value in the doubly linked list from the head, or -1"""
+        return self.doubly_list.search(value)
+    
+    def doubly_find(self, value):
+        """Return a node handle holding value in the doubly linked list, or None"""
+        return self.doubly_list.find(value)
+    
+    def doubly_remove_node(self, node):
+        """Unlink a node handle from the doubly linked list without seeking"""
+        value = self._remove_node(self.doubly_list, node)
+        return f"Deleted '{value}'"
+    
+    def doubly_delete_value(self, value):
+        """Delete a node holding value from the doubly linked list (see find)"""
+        self._delete_value(self.doubly_list, value)
+        return f"Deleted '{value}'"
+    
+    def doubly_extend(self, values):
+        """Append many values to the doubly linked list in one pass"""
+        return self._extend(self.doubly_list, values, "")
+    
+    def doubly_insert_many(self, position, values):
+        """Insert many values into the doubly linked list starting at position"""
+        return self._insert_many(self.doubly_list, position, values, "")
+    
+    def doubly_delete_range(self, start, stop):
+        """Delete positions start..stop-1 from the doubly linked list"""
+        return self._delete_range(self.doubly_list, start, stop, "")
+    
+    def doubly_from_iterable(self, values):
+        """Replace the doubly linked list with values"""
+        linked = self._from_iterable('doubly_list', values)
+        return f"Loaded {linked.size} values"
+    
+    def doubly_sort(self, reverse=False):
+        """Sort the doubly linked list (stable)"""
+        return self._sort('doubly_list', reverse, "")
+    
+    def doubly_merge_sorted(self, values):
+        """Merge values into the sorted doubly linked list, keeping it sorted"""
+        return self._merge_sorted('doubly_list', values, "")
+    
+    def doubly_set_ordered(self, on=True):
+        """Keep the doubly linked list sorted: inserts find their own position"""
+        return self._set_ordered('doubly_list', on, "")
     
     # Circular Singly Linked List Methods
     def circular_singly_insert(self, value, position=None):
         """Insert into circular singly linked list"""
-        if len(self.circular_singly_list) >= MAX_NODES:
-            raise ValueError(f"List is full! Maximum {MAX_NODES} nodes allowed.")
+        self._check_capacity(self.circular_singly_list.size)
+        position = self._place('circular_singly_list', value, position)
         
+        linked = self.circular_singly_list
+        at = linked.size if position is None else position
+        linked.insert(value, position)
+        self._record_insert(linked, value, at)
         if position is not None:
-            if position < 0 or position > len(self.circular_singly_list):
-                raise ValueError(f"Position must be between 0 and {len(self.circular_singly_list)}")
-            self.circular_singly_list.insert(position, value)
             return f"Inserted '{value}' at position {position} (circular)"
-        else:
-            self.circular_singly_list.append(value)
-            return f"Inserted '{value}' at end (circular)"
+        return f"Inserted '{value}' at end (circular)"
     
     def circular_singly_delete(self, position=None):
         """Delete from circular singly linked list"""
-        if not self.circular_singly_list:
-            raise ValueError("List is empty!")
-        
+        linked = self.circular_singly_list
+        at = linked.size - 1 if position is None else position
+        value = linked.delete(position)
+        self._record_delete(linked, value, at)
         if position is None:
-            value = self.circular_singly_list.pop()
             return f"Deleted '{value}' from end (circular)"
-        
-        if position < 0 or position >= len(self.circular_singly_list):
-            raise ValueError(f"Position must be between 0 and {len(self.circular_singly_list)-1}")
-        value = self.circular_singly_list.pop(position)
         return f"Deleted '{value}' from position {position} (circular)"
     
     def circular_singly_traverse(self, cycles=2):
         """Traverse circular singly linked list"""
-        if not self.circular_singly_list:
-            return []
-        
-        result = []
-        list_len = len(self.circular_singly_list)
-        for i in range(list_len * cycles):
-            idx = i % list_len
-            result.append((i, self.circular_singly_list[idx], idx))
-        return result
+        return self.circular_singly_list.traverse(cycles)
+    
+    def circular_singly_iter(self, cycles=2, limit=None, start=0):
+        """Lazily traverse circular singly linked list from position start"""
+        return self.circular_singly_list.iter_forward(cycles, limit, start)
+    
+    def circular_singly_rotate(self, steps=1):
+        """Make the node steps positions ahead the new head"""
+        linked = self.circular_singly_list
+        if not linked.size:
+            raise ValueError("List is empty!")
+        self._check_unordered(linked, "rotate it")
+        linked.rotate(steps)
+        self._record(linked.rotate, (steps,), linked.rotate, (-steps,))
+        return f"Rotated by {steps} (head is now '{linked.peek()}')"
     
     def circular_singly_clear(self):
         """Clear circular singly linked list"""
-        self.circular_singly_list.clear()
+        self._clear('circular_singly_list')
     
     def get_circular_singly_list(self):
         """Get circular singly linked list"""
-        return self.circular_singly_list
+        return self.circular_singly_list.to_list()
     
     def circular_singly_peek(self):
         """Peek at the first element"""
-        if not self.circular_singly_list:
-            return None
-        return self.circular_singly_list[0]
+        return self.circular_singly_list.peek()
+    
+    def circular_singly_contains(self, value):
+        """Check whether the circular singly linked list holds value"""
+        return self.circular_singly_list.contains(value)
+    
+    def circular_singly_search(self, value):
+        """Position of value in the circular singly linked list from the head, or -1"""
+        return self.circular_singly_list.search(value)
+    
+    def circular_singly_delete_value(self, value):
+        """Delete the first node holding value from the circular singly linked list"""
+        self._delete_first(self.circular_singly_list, value)
+        return f"Deleted '{value}' (circular)"
+    
+    def circular_singly_extend(self, values):
+        """Append many values to the circular singly linked list in one pass"""
+        return self._extend(self.circular_singly_list, values, " (circular)")
+    
+    def circular_singly_insert_many(self, position, values):
+        """Insert many values into the circular singly linked list starting at position"""
+        return self._insert_many(self.circular_singly_list, position, values, " (circular)")
+    
+    def circular_singly_delete_range(self, start, stop):
+        """Delete positions start..stop-1 from the circular singly linked list"""
+        return self._delete_range(self.circular_singly_list, start, stop, " (circular)")
+    
+    def circular_singly_from_iterable(self, values):
+        """Replace the circular singly linked list with values"""
+        linked = self._from_iterable('circular_singly_list', values)
+        return f"Loaded {linked.size} values (circular)"
+    
+    def circular_singly_sort(self, reverse=False):
+        """Sort the circular singly linked list (stable)"""
+        return self._sort('circular_singly_list', reverse, " (circular)")
+    
+    def circular_singly_merge_sorted(self, values):
+        """Merge values into the sorted circular singly linked list, keeping it sorted"""
+        return self._merge_sorted('circular_singly_list', values, " (circular)")
+    
+    def circular_singly_set_ordered(self, on=True):
+        """Keep the circular singly linked list sorted: inserts find their own position"""
+        return self._set_ordered('circular_singly_list', on, " (circular)")
     
     # Circular Doubly Linked List Methods
     def circular_doubly_insert(self, value, position=None):
         """Insert into circular doubly linked list"""
-        # Count nodes
-        count = 0
-        if self.circular_doubly_head:
-            temp = self.circular_doubly_head
-            count = 1
-            temp = temp.next
-            while temp != self.circular_doubly_head:
-                count += 1
-                temp = temp.next
-        
-        if count >= MAX_NODES:
-            raise ValueError(f"List is full! Maximum {MAX_NODES} nodes allowed.")
+        self._check_capacity(self.circular_doubly_list.size)
+        position = self._place('circular_doubly_list', value, position)
         
-        new_node = Node(value)
-        
-        if not self.circular_doubly_head:
-            self.circular_doubly_head = new_node
-            new_node.next = new_node
-            new_node.prev = new_node
+        linked = self.circular_doubly_list
+        at = linked.size if position is None else position
+        if not linked.size:
+            if position not in (None, 0):
+                raise ValueError("Position out of range")
+            linked.append(value)
+            self._record_insert(linked, value, 0)
             return f"Inserted '{value}' as first node (circular doubly)"
         
+        linked.insert(value, position)
+        self._record_insert(linked, value, at)
         if position is None:
-            # Insert at end (before head)
-            last = self.circular_doubly_head.prev
-            new_node.next = self.circular_doubly_head
-            new_node.prev = last
-            last.next = new_node
-            self.circular_doubly_head.prev = new_node
             return f"Inserted '{value}' at end (circular doubly)"
-        
-        if position == 0:
-            last = self.circular_doubly_head.prev
-            new_node.next = self.circular_doubly_head
-            new_node.prev = last
-            last.next = new_node
-            self.circular_doubly_head.prev = new_node
-            self.circular_doubly_head = new_node
-            return f"Inserted '{value}' at position 0 (circular doubly)"
-        
-        current = self.circular_doubly_head
-        for i in range(position - 1):
-            current = current.next
-            if current == self.circular_doubly_head:
-                raise ValueError("Position out of range")
-        
-        new_node.next = current.next
-        new_node.prev = current
-        current.next.prev = new_node
-        current.next = new_node
         return f"Inserted '{value}' at position {position} (circular doubly)"
     
     def circular_doubly_delete(self, position=None):
         """Delete from circular doubly linked list"""
-        if not self.circular_doubly_head:
+        linked = self.circular_doubly_list
+        if not linked.size:
             raise ValueError("List is empty!")
         
         if position is None:
-            # Delete last node (node before head)
-            if self.circular_doubly_head.next == self.circular_doubly_head:
-                value = self.circular_doubly_head.data
-                self.circular_doubly_head = None
+            last_node = linked.size == 1
+            value = linked.pop()
+            self._record_delete(linked, value, linked.size)
+            if last_node:
                 return f"Deleted '{value}' (last node in circular doubly)"
-            
-            last = self.circular_doubly_head.prev
-            value = last.data
-            last.prev.next = self.circular_doubly_head
-            self.circular_doubly_head.prev = last.prev
             return f"Deleted '{value}' from end (circular doubly)"
         
-        if position == 0:
-            value = self.circular_doubly_head.data
-            if self.circular_doubly_head.next == self.circular_doubly_head:
-                self.circular_doubly_head = None
-            else:
-                last = self.circular_doubly_head.prev
-                self.circular_doubly_head = self.circular_doubly_head.next
-                last.next = self.circular_doubly_head
-                self.circular_doubly_head.prev = last
-            return f"Deleted '{value}' from position 0 (circular doubly)"
-        
-        current = self.circular_doubly_head
-        for i in range(position):
-            current = current.next
-            if current == self.circular_doubly_head and i < position:
-                raise ValueError("Position out of range")
-        
-        value = current.data
-        current.prev.next = current.next
-        current.next.prev = current.prev
+        value = linked.delete(position)
+        self._record_delete(linked, value, position)
         return f"Deleted '{value}' from position {position} (circular doubly)"
     
     def circular_doubly_traverse_forward(self, cycles=2):
         """Traverse circular doubly linked list forward"""
-        if not self.circular_doubly_head:
-            return []
-        
-        # Count nodes
-        temp = self.circular_doubly_head
-        list_len = 1
-        temp = temp.next
-        while temp != self.circular_doubly_head:
-            list_len += 1
-            temp = temp.next
-        
-        result = []
-        current = self.circular_doubly_head
-        for i in range(list_len * cycles):
-            result.append((i, current.data))
-            current = current.next
-        return result
+        return self.circular_doubly_list.traverse_forward(cycles)
     
     def circular_doubly_traverse_reverse(self, cycles=2):
         """Traverse circular doubly linked list in reverse"""
-        if not self.circular_doubly_head:
-            return []
-        
-        # Count nodes
-        temp = self.circular_doubly_head
-        list_len = 1
-        temp = temp.next
-        while temp != self.circular_doubly_head:
-            list_len += 1
-            temp = temp.next
-        
-        result = []
-        current = self.circular_doubly_head.prev
-        for i in range(list_len * cycles):
-            result.append((i, current.data))
-            current = current.prev
-        return result
+        return self.circular_doubly_list.traverse_reverse(cycles)
+    
+    def circular_doubly_iter_forward(self, cycles=2, limit=None):
+        """Lazily traverse circular doubly linked list forward"""
+        return self.circular_doubly_list.iter_forward(cycles, limit)
+    
+    def circular_doubly_iter_reverse(self, cycles=2, limit=None):
+        """Lazily traverse circular doubly linked list in reverse"""
+        return self.circular_doubly_list.iter_reverse(cycles, limit)
+    
+    def circular_doubly_reverse(self):
+        """Reverse the circular doubly linked list in O(1)"""
+        self._reverse(self.circular_doubly_list.reverse)
+        return "Reversed circular doubly linked list"
     
     def circular_doubly_clear(self):
         """Clear circular doubly linked list"""
-        self.circular_doubly_head = None
+        self._clear('circular_doubly_list')
     
-    def get_circular_doubly_list(self):
-        """Get circular doubly linked list as array"""
-        if not self.circular_doubly_head:
-            return []
-        
-        nodes = []
-        current = self.circular_doubly_head
-        nodes.append(current.data)
-        current = current.next
-        while current != self.circular_doubly_head:
-            nodes.append(current.data)
-            current = current.next
-        return nodes
+    def get_circular_doubly_list(self, reverse=False):
+        """Get circular doubly linked list as array (last node first if reverse)"""
+        if reverse:
+            return list(reversed(self.circular_doubly_list))
+        return self.circular_doubly_list.to_list()
     
     def circular_doubly_peek(self):
         """Peek at the first element"""
-        if not self.circular_doubly_head:
-            return None
-        return self.circular_doubly_head.data
\ No newline at end of file
+        return self.circular_doubly_list.peek()
+    
+    def circular_doubly_contains(self, value):
+        """Check whether the circular doubly linked list holds value"""
+        return self.circular_doubly_list.contains(value)
+    
+    def circular_doubly_search(self, value):
+        """Position of value in the circular doubly linked list from the head, or -1"""
+        return self.circular_doubly_list.search(value)
+    
+    def circular_doubly_find(self, value):
+        """Return a node handle holding value in the circular doubly linked list, or None"""
+        return self.circular_doubly_list.find(value)
+    
+    def circular_doubly_remove_node(self, node):
+        """Unlink a node handle from the circular doubly linked list without seeking"""
+        value = self._remove_node(self.circular_doubly_list, node)
+        return f"Deleted '{value}' (circular doubly)"
+    
+    def circular_doubly_delete_value(self, value):
+        """Delete a node holding value from the circular doubly linked list (see find)"""
+        self._delete_value(self.circular_doubly_list, value)
+        return f"Deleted '{value}' (circular doubly)"
+    
+    def circular_doubly_extend(self, values):
+        """Append many values to the circular doubly linked list in one pass"""
+        return self._extend(self.circular_doubly_list, values, " (circular doubly)")
+    
+    def circular_doubly_insert_many(self, position, values):
+        """Insert many values into the circular doubly linked list starting at position"""
+        return self._insert_many(self.circular_doubly_list, position, values, " (circular doubly)")
+    
+    def circular_doubly_delete_range(self, start, stop):
+        """Delete positions start..stop-1 from the circular doubly linked list"""
+        return self._delete_range(self.circular_doubly_list, start, stop, " (circular doubly)")
+    
+    def circular_doubly_from_iterable(self, values):
+        """Replace the circular doubly linked list with values"""
+        linked = self._from_iterable('circular_doubly_list', values)
+        return f"Loaded {linked.size} values (circular doubly)"
+    
+    def circular_doubly_sort(self, reverse=False):
+        """Sort the circular doubly linked list (stable)"""
+        return self._sort('circular_doubly_list', reverse, " (circular doubly)")
+    
+    def circular_doubly_merge_sorted(self, values):
+        """Merge values into the sorted circular doubly linked list, keeping it sorted"""
+        return self._merge_sorted('circular_doubly_list', values, " (circular doubly)")
+    
+    def circular_doubly_set_ordered(self, on=True):
+        """Keep the circular doubly linked list sorted: inserts find their own position"""
+        return self._set_ordered('circular_doubly_list', on, " (circular doubly)")
+    
+    # Skip List Methods
+    def skip_insert(self, value, position=None):
+        """Insert into the skip list in O(log n)"""
+        self._check_capacity(self.skip_list.size)
+        position = self._place('skip_list', value, position)
+        
+        linked = self.skip_list
+        at = linked.size if position is None else position
+        linked.insert(value, position)
+        self._record_insert(linked, value, at)
+        if position is not None:
+            return f"Inserted '{value}' at position {position} (skip list)"
+        return f"Inserted '{value}' at end (skip list)"
+    
+    def skip_delete(self, position=None):
+        """Delete from the skip list in O(log n)"""
+        linked = self.skip_list
+        at = linked.size - 1 if position is None else position
+        value = linked.delete(position)
+        self._record_delete(linked, value, at)
+        if position is None:
+            return f"Deleted '{value}' from end (skip list)"
+        return f"Deleted '{value}' from position {position} (skip list)"
+    
+    def skip_get(self, position):
+        """Value at position in the skip list, in O(log n)"""
+        return self.skip_list.get(position)
+    
+    def skip_traverse(self):
+        """Traverse the skip list along its bottom level"""
+        return self.skip_list.traverse()
+    
+    def skip_clear(self):
+        """Clear the skip list"""
+        self._clear('skip_list')
+    
+    def get_skip_list(self):
+        """Get the skip list as array"""
+        return self.skip_list.to_list()
+    
+    def get_skip_towers(self):
+        """Get (value, height) pairs of the skip list's nodes"""
+        return self.skip_list.towers()
+    
+    def skip_peek(self):
+        """Peek at the first element"""
+        return self.skip_list.peek()
+    
+    def skip_contains(self, value):
+        """Check whether the skip list holds value"""
+        return self.skip_list.contains(value)
+    
+    def skip_search(self, value):
+        """Position of value in the skip list from the head, or -1"""
+        return self.skip_list.search(value)
+    
+    def skip_extend(self, values):
+        """Append many values to the skip list"""
+        return self._extend(self.skip_list, values, " (skip list)")
+    
+    def skip_insert_many(self, position, values):
+        """Insert many values into the skip list starting at position"""
+        return self._insert_many(self.skip_list, position, values, " (skip list)")
+    
+    def skip_delete_range(self, start, stop):
+        """Delete positions start..stop-1 from the skip list"""
+        return self._delete_range(self.skip_list, start, stop, " (skip list)")
+    
+    def skip_from_iterable(self, values):
+        """Replace the skip list with values"""
+        linked = self._from_iterable('skip_list', values)
+        return f"Loaded {linked.size} values (skip list)"
+    
+    def skip_sort(self, reverse=False):
+        """Sort the skip list (stable)"""
+        return self._sort('skip_list', reverse, " (skip list)")
+    
+    def skip_merge_sorted(self, values):
+        """Merge values into the sorted skip list, keeping it sorted"""
+        return self._merge_sorted('skip_list', values, " (skip list)")
+    
+    def skip_set_ordered(self, on=True):
+        """Keep the skip list sorted: inserts find their own position"""
+        return self._set_ordered('skip_list', on, " (skip list)")
+    
+    # Invariants
+    def validate(self):
+        """Check every list's links, cached size and index in O(n); raise ValueError if one is broken"""
+        for kind in LIST_KINDS:
+            linked = getattr(self, f"{kind}_list")
+            try:
+                linked.validate()
+            except ValueError as e:
+                raise ValueError(f"{kind}: {e}") from None
+            if self.capacity is not None and linked.size > self.capacity:
+                raise ValueError(f"{kind}: {linked.size} nodes but capacity is {self.capacity}")
+        return "All lists valid"
+
+
+def _sorted(values, reverse=False):
+    """sorted(), with mixed-type values reported as ValueError"""
+    try:
+        return sorted(values, reverse=reverse)
+    except TypeError as e:
+        raise ValueError(f"Values cannot be sorted: {e}") from None
+
+
+def _check_comparable(values):
+    """
+    Raise ValueError unless the values can be sorted, before an in-place sort
+    or merge starts relinking nodes. sorted() over a copy compares the values
+    the way the merge will and fails on any pair it cannot order, while the
+    nodes are still linked as they were.
+    """
+    _sorted(values)
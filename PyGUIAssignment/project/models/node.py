@@ -1,7 +1,154 @@
 """Node class for doubly linked list"""
 
 class Node:
-    def __init__(self, data):
+    # owner is the doubly list the node is linked into (None once unlinked)
+    __slots__ = ('data', 'next', 'prev', 'owner')
+
+    def __init__(self, data, owner=None):
         self.data = data
         self.next = None
-        self.prev = None
\ No newline at end of file
+        self.prev = None
+        self.owner = owner
+
+
+def iter_chain(node):
+    """Yield the values of a detached chain, following next until None"""
+    while node:
+        yield node.data
+        node = node.next
+
+
+def build_chain(values, max_count=None, doubly=True, reverse=False, owner=None):
+    """
+    Link values into a detached chain of nodes in one pass.
+    reverse links each new node in front, so the chain runs last value first;
+    owner is the list the nodes are built for.
+    Returns (first, last, count); raises ValueError past max_count values.
+    """
+    first = last = None
+    count = 0
+    for value in values:
+        if count == max_count:
+            raise ValueError(f"List is full! Only {max_count} more nodes fit.")
+        node = Node(value, owner)
+        if not last:
+            first = last = node
+        elif reverse:
+            node.next = first
+            if doubly:
+                first.prev = node
+            first = node
+        else:
+            last.next = node
+            if doubly:
+                node.prev = last
+            last = node
+        count += 1
+    return first, last, count
+
+
+class _Anchor:
+    """Stand-in predecessor for the first node while a chain is relinked"""
+    __slots__ = ('next',)
+
+    def __init__(self):
+        self.next = None
+
+
+def _merge(a, b, key, reverse):
+    """Stable merge of two sorted None-terminated chains (ties take from a); return the first node"""
+    anchor = tail = _Anchor()
+    if key is None and not reverse:
+        # The common case, without the key and direction checks
+        while a and b:
+            if b.data < a.data:
+                tail.next = b
+                tail = b
+                b = b.next
+            else:
+                tail.next = a
+                tail = a
+                a = a.next
+    else:
+        while a and b:
+            x = a.data if key is None else key(a.data)
+            y = b.data if key is None else key(b.data)
+            if (y > x) if reverse else (y < x):
+                tail.next = b
+                tail = b
+                b = b.next
+            else:
+                tail.next = a
+                tail = a
+                a = a.next
+    tail.next = a or b
+    return anchor.next
+
+
+def _last(node):
+    """Walk a None-terminated chain to its last node (None if empty)"""
+    if node:
+        while node.next:
+            node = node.next
+    return node
+
+
+def merge_chains(a, b, key=None, reverse=False):
+    """
+    Stable merge of two sorted None-terminated chains by relinking next
+    (ties take from a first). Returns (first, last) of the merged chain.
+    """
+    first = _merge(a, b, key, reverse)
+    return first, _last(first)
+
+
+def sort_chain(first, key=None, reverse=False):
+    """
+    Stable merge sort of a None-terminated chain that relinks the existing
+    nodes along next only, in O(n log n) time. Sorted runs of 2**i nodes wait
+    in bins[i] (so the only extra space is O(log n) bin slots) and merge like
+    a binary counter as each node is taken off the chain.
+    Returns (first, last); prev links are left for the caller to fix.
+    """
+    bins = []
+    while first:
+        carry = first
+        first = first.next
+        carry.next = None
+        i = 0
+        while i < len(bins) and bins[i] is not None:
+            # bins[i] holds earlier nodes, so it goes first to keep the sort stable
+            carry = _merge(bins[i], carry, key, reverse)
+            bins[i] = None
+            i += 1
+        if i == len(bins):
+            bins.append(carry)
+        else:
+            bins[i] = carry
+    result = None
+    for chain in bins:
+        if chain is not None:
+            result = chain if result is None else _merge(chain, result, key, reverse)
+    return result, _last(result)
+
+
+def take_chain(source, index=None):
+    """
+    Return (first, count) of a None-terminated chain holding source's values.
+    Node-based lists hand over their own nodes and are left empty; any other
+    iterable is copied into new nodes. index, if given, learns every node.
+    """
+    if hasattr(source, '_unlink_all'):
+        count = source.size
+        first = source._unlink_all()
+        source.clear()
+    else:
+        first, last, count = build_chain(source, doubly=False)
+    node = first
+    while node:
+        # Handles from the source list must not pass its ownership check any more
+        node.owner = None
+        if index is not None:
+            index.add(node.data, node)
+        node = node.next
+    return first, count
@@ -0,0 +1,72 @@
+"""Array-backed node storage: data, next and prev kept in parallel arrays"""
+from array import array
+from itertools import count
+
+NIL = -1
+# Shared by every pool so a stamp never repeats, even across pools and resets
+_stamps = count()
+
+class NodePool:
+    """
+    Arena of nodes addressed by integer index.
+    Released slots are chained through the next array and reused first.
+    Each slot in use carries a stamp that is new every time it is taken
+    (NIL while free), so a (slot, stamp) handle goes stale once the slot
+    is released, even if the slot is taken again.
+    """
+    def __init__(self):
+        self.data = []
+        self.next = array('q')
+        self.prev = array('q')
+        self.stamp = array('q')
+        self.free = NIL
+        self.used = 0
+
+    def __len__(self):
+        return self.used
+
+    def alloc(self, value):
+        """Take a slot for value and return its index"""
+        index = self.free
+        if index != NIL:
+            self.free = self.next[index]
+            self.data[index] = value
+            self.next[index] = NIL
+            self.stamp[index] = next(_stamps)
+        else:
+            index = len(self.data)
+            self.data.append(value)
+            self.next.append(NIL)
+            self.prev.append(NIL)
+            self.stamp.append(next(_stamps))
+        self.used += 1
+        return index
+
+    def release(self, index):
+        """Return a slot to the free list and give back its value"""
+        value = self.data[index]
+        self.data[index] = None
+        self.prev[index] = NIL
+        self.stamp[index] = NIL
+        self.next[index] = self.free
+        self.free = index
+        self.used -= 1
+        return value
+
+    def handle(self, index):
+        """A (slot, stamp) handle for a slot in use"""
+        return index, self.stamp[index]
+
+    def holds(self, handle):
+        """True if handle names a slot that is still the one it was taken for"""
+        index, stamp = handle
+        return 0 <= index < len(self.data) and stamp != NIL and self.stamp[index] == stamp
+
+    def reset(self):
+        """Drop every slot"""
+        self.data = []
+        self.next = array('q')
+        self.prev = array('q')
+        self.stamp = array('q')
+        self.free = NIL
+        self.used = 0
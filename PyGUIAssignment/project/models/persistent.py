@@ -0,0 +1,221 @@
+"""
+Persistent (immutable) stack and singly list built from shared cons cells.
+
+Every operation returns a new version and leaves the old one untouched, so
+keeping a snapshot is just keeping a reference. Cells are (value, rest)
+tuples; versions share every cell after the point they changed.
+
+These are a library-only API: no manager, UI view or storage path uses
+them, and the app's undo still goes through the OperationJournal. Callers
+that want O(1) snapshots hold the versions themselves (bench_snapshots in
+benchmarks.py is the in-tree example). PersistentStack takes
+StackManager's method names and PersistentSinglyList takes the manager's
+singly_* names without the prefix (plus O(1) appendleft/popleft at the
+head), but each mutation returns the new version (removals return
+(value, new_version)) instead of a message.
+"""
+from .linked_lists import MAX_NODES
+from .stack import MAX_STACK_SIZE
+
+
+def _iter_cells(cell):
+    """Yield the values of a cons chain"""
+    while cell is not None:
+        yield cell[0]
+        cell = cell[1]
+
+
+def _rebuild(values, rest):
+    """Prepend values (given last-first) onto rest"""
+    for value in values:
+        rest = (value, rest)
+    return rest
+
+
+class PersistentStack:
+    """Immutable counterpart of StackManager; push/pop/clear return new versions"""
+    __slots__ = ('top', 'count', 'capacity')
+
+    def __init__(self, capacity=MAX_STACK_SIZE):
+        self.top = None
+        self.count = 0
+        self.capacity = capacity
+
+    def _derive(self, top, count):
+        version = object.__new__(PersistentStack)
+        version.top = top
+        version.count = count
+        version.capacity = self.capacity
+        return version
+
+    def __iter__(self):
+        """Yield values from top to bottom"""
+        return _iter_cells(self.top)
+
+    def __len__(self):
+        return self.count
+
+    def push(self, value):
+        """Return a new version with value on top, in O(1)"""
+        if self.capacity is not None and self.count >= self.capacity:
+            raise ValueError(f"Stack is full! Maximum {self.capacity} elements allowed.")
+        return self._derive((value, self.top), self.count + 1)
+
+    def pop(self):
+        """Return (top value, new version without it), in O(1)"""
+        if self.top is None:
+            raise ValueError("Stack is empty!")
+        return self.top[0], self._derive(self.top[1], self.count - 1)
+
+    def peek(self):
+        """Peek at top of stack"""
+        if self.top is None:
+            return None
+        return self.top[0]
+
+    def is_empty(self):
+        """Check if stack is empty"""
+        return self.top is None
+
+    def clear(self):
+        """Return an empty version"""
+        return self._derive(None, 0)
+
+    def from_iterable(self, values):
+        """Return a version holding values (bottom first) in one pass"""
+        top = None
+        count = 0
+        for value in values:
+            if self.capacity is not None and count >= self.capacity:
+                raise ValueError(f"Stack is full! Maximum {self.capacity} elements allowed.")
+            top = (value, top)
+            count += 1
+        return self._derive(top, count)
+
+    def get_stack(self):
+        """Get the stack as list (bottom first, like StackManager)"""
+        values = list(self)
+        values.reverse()
+        return values
+
+    def search(self, value):
+        """Position of value from top (0-indexed) if found, else -1"""
+        for i, data in enumerate(self):
+            if data == value:
+                return i
+        return -1
+
+    def contains(self, value):
+        """Check if value is anywhere in the stack"""
+        return self.search(value) != -1
+
+    def size(self):
+        """Return the size of the stack"""
+        return self.count
+
+
+class PersistentSinglyList:
+    """
+    Immutable counterpart of the manager's singly list.
+    Head insert/delete are O(1); a change at position k copies the k cells before it.
+    """
+    __slots__ = ('head', 'size', 'capacity')
+
+    def __init__(self, capacity=MAX_NODES):
+        self.head = None
+        self.size = 0
+        self.capacity = capacity
+
+    def _derive(self, head, size):
+        version = object.__new__(PersistentSinglyList)
+        version.head = head
+        version.size = size
+        version.capacity = self.capacity
+        return version
+
+    def __iter__(self):
+        return _iter_cells(self.head)
+
+    def __len__(self):
+        return self.size
+
+    def _split(self, position):
+        """Return the values before position (last first) and the cell at position"""
+        prefix = []
+        cell = self.head
+        for i in range(position):
+            prefix.append(cell[0])
+            cell = cell[1]
+        prefix.reverse()
+        return prefix, cell
+
+    def appendleft(self, value):
+        """Return a new version with value at the head, in O(1)"""
+        return self.insert(value, 0)
+
+    def insert(self, value, position=None):
+        """Return a new version with value inserted at position (end if None)"""
+        if self.capacity is not None and self.size >= self.capacity:
+            raise ValueError(f"List is full! Maximum {self.capacity} nodes allowed.")
+        if position is None:
+            position = self.size
+        if position < 0 or position > self.size:
+            raise ValueError(f"Position must be between 0 and {self.size}")
+        prefix, rest = self._split(position)
+        return self._derive(_rebuild(prefix, (value, rest)), self.size + 1)
+
+    def popleft(self):
+        """Return (head value, new version without it), in O(1)"""
+        return self.delete(0)
+
+    def pop(self):
+        """Return (last value, new version without it); copies every other cell"""
+        return self.delete()
+
+    def delete(self, position=None):
+        """Return (value at position, new version without it); position None is the end"""
+        if self.head is None:
+            raise ValueError("List is empty!")
+        if position is None:
+            position = self.size - 1
+        if position < 0 or position >= self.size:
+            raise ValueError(f"Position must be between 0 and {self.size - 1}")
+        prefix, cell = self._split(position)
+        return cell[0], self._derive(_rebuild(prefix, cell[1]), self.size - 1)
+
+    def from_iterable(self, values):
+        """Return a version holding values in one pass"""
+        values = list(values)
+        if self.capacity is not None and len(values) > self.capacity:
+            raise ValueError(f"List is full! Maximum {self.capacity} nodes allowed.")
+        values.reverse()
+        return self._derive(_rebuild(values, None), len(values))
+
+    def contains(self, value):
+        """Check whether the list holds value"""
+        return self.search(value) != -1
+
+    def search(self, value):
+        """Position of value from the head, or -1"""
+        for i, data in enumerate(self):
+            if data == value:
+                return i
+        return -1
+
+    def traverse(self):
+        """Return (index, value) pairs from head to tail"""
+        return list(enumerate(self))
+
+    def get_singly_list(self):
+        """Get the values from head to tail as a Python list"""
+        return list(self)
+
+    def peek(self):
+        """Peek at the first element"""
+        if self.head is None:
+            return None
+        return self.head[0]
+
+    def clear(self):
+        """Return an empty version"""
+        return self._derive(None, 0)
@@ -0,0 +1,523 @@
+"""Doubly linked list stored in a NodePool (integer indices instead of Node objects)"""
+from .node_pool import NodePool, NIL
+from .value_index import ValueIndex
+
+class PooledDoublyList:
+    def __init__(self, indexed=False):
+        """
+        indexed keeps a ValueIndex (value -> slots) so membership tests are O(1);
+        it also numbers the slots in physical order (see SinglyLinkedList) so
+        search hits need no walk.
+        head/tail are the physical ends; while reversed is set, positions count
+        from the tail and traversal follows prev links (see reverse).
+        """
+        self.pool = NodePool()
+        self.head = NIL
+        self.tail = NIL
+        self.size = 0
+        self.reversed = False
+        self.index = ValueIndex() if indexed else None
+        self.base = 0
+        self.numbered = True
+
+    def __len__(self):
+        return self.size
+
+    def _values(self, forward):
+        """Yield values along the physical next (forward) or prev links"""
+        data = self.pool.data
+        links = self.pool.next if forward else self.pool.prev
+        current = self.head if forward else self.tail
+        while current != NIL:
+            yield data[current]
+            current = links[current]
+
+    def __iter__(self):
+        return self._values(not self.reversed)
+
+    def __reversed__(self):
+        return self._values(self.reversed)
+
+    def __contains__(self, value):
+        return self.contains(value)
+
+    def _physical(self, position):
+        """Map a logical node position to its physical position"""
+        return self.size - 1 - position if self.reversed else position
+
+    def _node_at(self, index):
+        """Return the slot at physical index (0 <= index < size), walking from the nearer end"""
+        if index <= self.size // 2:
+            nxt = self.pool.next
+            current = self.head
+            for i in range(index):
+                current = nxt[current]
+        else:
+            prv = self.pool.prev
+            current = self.tail
+            for i in range(self.size - 1 - index):
+                current = prv[current]
+        return current
+
+    def _first_number(self, before, after, count):
+        """Number for the first of count slots linked between before and after (None if that breaks the numbering)"""
+        if after == NIL:
+            return self.base + self.size
+        if before == NIL:
+            self.base -= count
+            return self.base
+        self.numbered = False
+        return None
+
+    def _drop_numbers(self, before, after, count):
+        """Keep the numbering in step with count slots unlinked from between before and after"""
+        if before == NIL:
+            self.base += count
+        elif after != NIL:
+            self.numbered = False
+
+    def _link(self, value, before, after):
+        """Allocate a slot for value between physical neighbours before and after"""
+        pool = self.pool
+        index = pool.alloc(value)
+        if self.index is not None:
+            self.index.add(value, index, self._first_number(before, after, 1))
+        pool.prev[index] = before
+        pool.next[index] = after
+        if before != NIL:
+            pool.next[before] = index
+        else:
+            self.head = index
+        if after != NIL:
+            pool.prev[after] = index
+        else:
+            self.tail = index
+        self.size += 1
+        return index
+
+    def reverse(self):
+        """Reverse the list in O(1) by flipping which way the links are read"""
+        self.reversed = not self.reversed
+
+    def append(self, value):
+        """Insert at the end in O(1)"""
+        if self.reversed:
+            return self._link(value, NIL, self.head)
+        return self._link(value, self.tail, NIL)
+
+    def appendleft(self, value):
+        """Insert at the front in O(1)"""
+        if self.reversed:
+            return self._link(value, self.tail, NIL)
+        return self._link(value, NIL, self.head)
+
+    def insert(self, value, position=None):
+        """Insert value at position (end if None) and return the new slot"""
+        if position is None or position == self.size:
+            return self.append(value)
+        if position < 0 or position > self.size:
+            raise ValueError("Position out of range")
+        if position == 0:
+            return self.appendleft(value)
+
+        if self.reversed:
+            position = self.size - position
+        current = self._node_at(position - 1)
+        return self._link(value, current, self.pool.next[current])
+
+    def _unlink(self, index):
+        """Detach a slot, release it to the pool and return its value"""
+        pool = self.pool
+        before = pool.prev[index]
+        after = pool.next[index]
+        self._drop_numbers(before, after, 1)
+        if before != NIL:
+            pool.next[before] = after
+        else:
+            self.head = after
+        if after != NIL:
+            pool.prev[after] = before
+        else:
+            self.tail = before
+        self.size -= 1
+        if self.index is not None:
+            self.index.discard(pool.data[index], index)
+        return pool.release(index)
+
+    def pop(self):
+        """Remove and return the last value in O(1)"""
+        if self.tail == NIL:
+            raise ValueError("List is empty!")
+        return self._unlink(self.head if self.reversed else self.tail)
+
+    def popleft(self):
+        """Remove and return the first value in O(1)"""
+        if self.head == NIL:
+            raise ValueError("List is empty!")
+        return self._unlink(self.tail if self.reversed else self.head)
+
+    def delete(self, position=None):
+        """Remove the value at position (end if None) and return it"""
+        if self.head == NIL:
+            raise ValueError("List is empty!")
+        if position is None:
+            return self.pop()
+        if position < 0 or position >= self.size:
+            raise ValueError("Position out of range")
+        return self._unlink(self._node_at(self._physical(position)))
+
+    # Bulk operations
+    @classmethod
+    def from_iterable(cls, values, max_count=None, **options):
+        """Build a new list from values in one pass"""
+        linked = cls(**options)
+        linked.extend(values, max_count)
+        return linked
+
+    def extend(self, values, max_count=None):
+        """Append every value in one splice and return how many were added"""
+        return self.insert_many(None, values, max_count)
+
+    def insert_many(self, position, values, max_count=None):
+        """Splice values in starting at position (end if None); return the count"""
+        if position is None:
+            position = self.size
+        if position < 0 or position > self.size:
+            raise ValueError("Position out of range")
+
+        pool = self.pool
+        nxt = pool.next
+        prv = pool.prev
+        first = last = NIL
+        count = 0
+        try:
+            for value in values:
+                if count == max_count:
+                    raise ValueError(f"List is full! Only {max_count} more nodes fit.")
+                index = pool.alloc(value)
+                if last == NIL:
+                    first = last = index
+                elif self.reversed:
+                    nxt[index] = first
+                    prv[first] = index
+                    first = index
+                else:
+                    nxt[last] = index
+                    prv[index] = last
+                    last = index
+                count += 1
+        except ValueError:
+            while first != NIL:
+                first, released = nxt[first], first
+                pool.release(released)
+            raise
+        if not count:
+            return 0
+
+        if self.reversed:
+            position = self.size - position
+        before = self._node_at(position - 1) if position else NIL
+        after = nxt[before] if before != NIL else self.head
+        number = self._first_number(before, after, count)
+        prv[first] = before
+        nxt[last] = after
+        if before != NIL:
+            nxt[before] = first
+        else:
+            self.head = first
+        if after != NIL:
+            prv[after] = last
+        else:
+            self.tail = last
+        self.size += count
+        if self.index is not None:
+            current = first
+            for i in range(count):
+                self.index.add(pool.data[current], current, number)
+                if number is not None:
+                    number += 1
+                current = nxt[current]
+        return count
+
+    def delete_range(self, start, stop):
+        """Unlink positions start..stop-1 in one pass and return how many were removed"""
+        return len(self.pop_range(start, stop))
+
+    def pop_range(self, start, stop):
+        """Unlink positions start..stop-1, release their slots and return their values"""
+        if start < 0 or stop > self.size or start > stop:
+            raise ValueError(f"Range must satisfy 0 <= start <= stop <= {self.size}")
+        count = stop - start
+        if not count:
+            return []
+        if self.reversed:
+            start = self.size - stop
+
+        pool = self.pool
+        nxt = pool.next
+        prv = pool.prev
+        values = []
+        current = self._node_at(start)
+        before = prv[current]
+        for i in range(count):
+            current, released = nxt[current], current
+            if self.index is not None:
+                self.index.discard(pool.data[released], released)
+            values.append(pool.release(released))
+        after = current
+        self._drop_numbers(before, after, count)
+        if before != NIL:
+            nxt[before] = after
+        else:
+            self.head = after
+        if after != NIL:
+            prv[after] = before
+        else:
+            self.tail = before
+        self.size -= count
+        if self.reversed:
+            values.reverse()
+        return values
+
+    # Sorting
+    def _merge_slots(self, a, b, key, reverse):
+        """Stable merge of two sorted NIL-terminated slot chains along next (ties take from a); return the first"""
+        data = self.pool.data
+        nxt = self.pool.next
+        first = tail = NIL
+        while a != NIL and b != NIL:
+            x = data[a] if key is None else key(data[a])
+            y = data[b] if key is None else key(data[b])
+            if (y > x) if reverse else (y < x):
+                taken, b = b, nxt[b]
+            else:
+                taken, a = a, nxt[a]
+            if tail == NIL:
+                first = taken
+            else:
+                nxt[tail] = taken
+            tail = taken
+        rest = a if a != NIL else b
+        if tail == NIL:
+            return rest
+        nxt[tail] = rest
+        return first
+
+    def sort(self, key=None, reverse=False):
+        """
+        Stable merge sort that relinks the existing slots: O(n log n) time, no
+        new slots. Works like node.sort_chain, on the next array.
+        """
+        nxt = self.pool.next
+        prv = self.pool.prev
+        first = self.head
+        if self.reversed:
+            # List order runs along prev from the tail
+            first = slot = self.tail
+            while slot != NIL:
+                nxt[slot] = prv[slot]
+                slot = prv[slot]
+            self.reversed = False
+
+        bins = []
+        while first != NIL:
+            carry = first
+            first = nxt[first]
+            nxt[carry] = NIL
+            i = 0
+            while i < len(bins) and bins[i] != NIL:
+                carry = self._merge_slots(bins[i], carry, key, reverse)
+                bins[i] = NIL
+                i += 1
+            if i == len(bins):
+                bins.append(carry)
+            else:
+                bins[i] = carry
+        first = NIL
+        for chain in bins:
+            if chain != NIL:
+                first = chain if first == NIL else self._merge_slots(chain, first, key, reverse)
+
+        previous = NIL
+        slot = first
+        while slot != NIL:
+            prv[slot] = previous
+            previous = slot
+            slot = nxt[slot]
+        self.head = first
+        self.tail = previous
+        self.numbered = False
+
+    def merge_sorted(self, other, key=None, reverse=False):
+        """
+        Merge the sorted values of other into this sorted list in one pass,
+        keeping it sorted (ties keep this list's values first); return how many
+        were added. Existing slots stay where they are.
+        """
+        if other is self:
+            raise ValueError("Cannot merge a list into itself")
+        pool = self.pool
+        data = pool.data
+        added = 0
+        current = self.tail if self.reversed else self.head
+        for value in other:
+            x = value if key is None else key(value)
+            while current != NIL:
+                y = data[current] if key is None else key(data[current])
+                if (x > y) if reverse else (x < y):
+                    break
+                current = pool.prev[current] if self.reversed else pool.next[current]
+            # Link value just before current in list order (at the end if NIL)
+            if current == NIL:
+                self.append(value)
+            elif self.reversed:
+                self._link(value, current, pool.next[current])
+            else:
+                self._link(value, pool.prev[current], current)
+            added += 1
+        return added
+
+    # Search
+    def contains(self, value):
+        """Membership test; O(1) on average when indexed"""
+        if self.index is not None:
+            return value in self.index
+        return any(data == value for data in self)
+
+    def _renumber(self):
+        """Number every slot by its physical position in one pass"""
+        nxt = self.pool.next
+        data = self.pool.data
+        slot = self.head
+        for i in range(self.size):
+            self.index.place(data[slot], slot, i)
+            slot = nxt[slot]
+        self.base = 0
+        self.numbered = True
+
+    def search(self, value):
+        """
+        Return the position of the first node holding value (from head), or -1.
+        Indexed lists answer from the slot numbers (see DoublyLinkedList.search).
+        """
+        if self.index is not None:
+            if value not in self.index:
+                return -1
+            if not self.numbered:
+                self._renumber()
+            if self.reversed:
+                return self.size - 1 - (self.index.highest(value)[0] - self.base)
+            return self.index.lowest(value)[0] - self.base
+        for i, data in enumerate(self):
+            if data == value:
+                return i
+        return -1
+
+    def find(self, value):
+        """
+        Return a (slot, stamp) handle for a slot holding value, or None.
+        Unindexed lists return the first match from the head; indexed lists
+        answer in O(1) with the longest-held match.
+        """
+        if self.index is not None:
+            index = self.index.first(value)
+            return None if index is None else self.pool.handle(index)
+        data = self.pool.data
+        links = self.pool.prev if self.reversed else self.pool.next
+        current = self.tail if self.reversed else self.head
+        while current != NIL:
+            if data[current] == value:
+                return self.pool.handle(current)
+            current = links[current]
+        return None
+
+    def _slot(self, handle):
+        """The slot of a handle from find; ValueError if it was released (or cleared) since"""
+        if not self.pool.holds(handle):
+            raise ValueError("Node is not in this list")
+        return handle[0]
+
+    def remove_node(self, handle):
+        """
+        Unlink a slot handle from this list in O(1) and return its value.
+        Raises ValueError for a handle whose slot was released since find.
+        """
+        return self._unlink(self._slot(handle))
+
+    def index_of(self, handle):
+        """Return the position of a slot handle by walking back to the head"""
+        index = self._slot(handle)
+        links = self.pool.next if self.reversed else self.pool.prev
+        position = 0
+        index = links[index]
+        while index != NIL:
+            position += 1
+            index = links[index]
+        return position
+
+    def delete_value(self, value):
+        """Remove one slot holding value and return True, or False if absent"""
+        handle = self.find(value)
+        if handle is None:
+            return False
+        self._unlink(handle[0])
+        return True
+
+    def traverse_forward(self):
+        """Return (index, value) pairs from head to tail"""
+        return list(enumerate(self))
+
+    def traverse_reverse(self):
+        """Return (index, value) pairs from tail to head"""
+        return list(enumerate(reversed(self)))
+
+    def to_list(self):
+        """Return the values from head to tail as a Python list"""
+        return list(self)
+
+    def peek(self):
+        """Peek at the first element"""
+        if self.head == NIL:
+            return None
+        return self.pool.data[self.tail if self.reversed else self.head]
+
+    def clear(self):
+        """Remove all nodes and drop the pool's storage"""
+        self.pool.reset()
+        self.head = NIL
+        self.tail = NIL
+        self.size = 0
+        self.reversed = False
+        self.base = 0
+        self.numbered = True
+        if self.index is not None:
+            self.index.clear()
+
+    def validate(self):
+        """Check next/prev symmetry, ends, pool usage and cached size in O(n); raise ValueError if broken"""
+        nxt = self.pool.next
+        prv = self.pool.prev
+        slots = []
+        previous = NIL
+        current = self.head
+        while current != NIL:
+            if len(slots) == self.size:
+                raise ValueError(f"Invalid list: more than {self.size} slots or a cycle")
+            if prv[current] != previous:
+                raise ValueError(f"Invalid list: prev link of slot {current} is wrong")
+            if self.pool.stamp[current] == NIL:
+                raise ValueError(f"Invalid list: slot {current} is linked but marked free")
+            slots.append(current)
+            previous = current
+            current = nxt[current]
+        if len(slots) != self.size or self.pool.used != self.size:
+            raise ValueError(f"Invalid list: {len(slots)} linked and {self.pool.used} used slots "
+                             f"but size is {self.size}")
+        if self.tail != previous:
+            raise ValueError("Invalid list: tail is not the last slot")
+        if self.index is not None:
+            data = self.pool.data
+            self.index.validate((data[slot], slot) for slot in slots)
+            if self.numbered:
+                self.index.check_numbers(((data[slot], slot) for slot in slots), self.base)
+        return True
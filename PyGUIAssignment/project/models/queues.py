@@ -0,0 +1,181 @@
+"""Queue and deque implementations on the project's doubly linked list"""
+from .doubly_list import DoublyLinkedList
+
+MAX_QUEUE_SIZE = 10
+
+class _DoublyEndsManager:
+    """
+    Shared state and queries for managers that only touch the ends of a
+    DoublyLinkedList (head is the front, tail the back; both O(1)).
+    """
+    name = "Queue"
+
+    def __init__(self, capacity=MAX_QUEUE_SIZE, indexed=False, journal=None):
+        """
+        capacity caps the number of elements (None for unbounded);
+        indexed keeps a value index so contains/search skip absent values in O(1);
+        journal is an OperationJournal that records every mutation for undo/redo
+        """
+        self.capacity = capacity
+        self.indexed = indexed
+        self.journal = journal
+        self.linked_list = DoublyLinkedList(indexed)
+
+    def _add(self, value, front):
+        """Add value at one end, checking capacity and journaling the inverse"""
+        linked = self.linked_list
+        if self.capacity is not None and linked.size >= self.capacity:
+            raise ValueError(f"{self.name} is full! Maximum {self.capacity} elements allowed.")
+        if front:
+            linked.appendleft(value)
+            self._record(linked.appendleft, (value,), linked.popleft, ())
+        else:
+            linked.append(value)
+            self._record(linked.append, (value,), linked.pop, ())
+
+    def _remove(self, front):
+        """Remove and return the value at one end, journaling the inverse"""
+        linked = self.linked_list
+        if not linked.size:
+            raise ValueError(f"{self.name} is empty!")
+        if front:
+            value = linked.popleft()
+            self._record(linked.popleft, (), linked.appendleft, (value,))
+        else:
+            value = linked.pop()
+            self._record(linked.pop, (), linked.append, (value,))
+        return value
+
+    def _record(self, redo, redo_args, undo, undo_args):
+        if self.journal is not None:
+            self.journal.record(redo, redo_args, undo, undo_args)
+
+    def _restore(self, linked):
+        """Swap in a whole list (used to undo and redo clear and from_iterable)"""
+        self.linked_list = linked
+
+    def _front(self):
+        linked = self.linked_list
+        return linked.peek() if linked.size else None
+
+    def _back(self):
+        linked = self.linked_list
+        return next(reversed(linked)) if linked.size else None
+
+    def is_empty(self):
+        """Check if there are no elements"""
+        return self.linked_list.size == 0
+
+    def clear(self):
+        """Remove every element"""
+        if self.journal is None:
+            self.linked_list.clear()
+            return
+        old = self.linked_list
+        new = DoublyLinkedList(self.indexed)
+        self._restore(new)
+        self._record(self._restore, (new,), self._restore, (old,))
+
+    def _build(self, values):
+        """A new list holding values (front first), not swapped in"""
+        try:
+            return DoublyLinkedList.from_iterable(values, self.capacity, indexed=self.indexed)
+        except ValueError:
+            raise ValueError(f"{self.name} is full! Maximum {self.capacity} elements allowed.") from None
+
+    def _swap_in(self, linked):
+        """Make a list from _build the current one (journaled) and return the load message"""
+        old = self.linked_list
+        self._restore(linked)
+        self._record(self._restore, (linked,), self._restore, (old,))
+        return f"Loaded {linked.size} values"
+
+    def from_iterable(self, values):
+        """Replace the contents with values (front first) in one pass"""
+        return self._swap_in(self._build(values))
+
+    def search(self, value):
+        """Return the position of value from the front (0-indexed), or -1"""
+        return self.linked_list.search(value)
+
+    def contains(self, value):
+        """Check if value is anywhere in the structure"""
+        return self.linked_list.contains(value)
+
+    def size(self):
+        """Return the number of elements"""
+        return self.linked_list.size
+
+    def undo(self):
+        """Reverse the latest journaled step"""
+        if self.journal is None:
+            raise ValueError("Undo is not enabled!")
+        count = self.journal.undo()
+        return f"Undid {count} operation(s)"
+
+    def redo(self):
+        """Replay the latest undone step"""
+        if self.journal is None:
+            raise ValueError("Undo is not enabled!")
+        count = self.journal.redo()
+        return f"Redid {count} operation(s)"
+
+
+class QueueManager(_DoublyEndsManager):
+    """FIFO queue: enqueue at the back, dequeue from the front, both O(1)"""
+    name = "Queue"
+
+    def enqueue(self, value):
+        """Add value at the back of the queue"""
+        self._add(value, front=False)
+        return f"Enqueued node with value: {value}"
+
+    def dequeue(self):
+        """Remove the value at the front of the queue"""
+        value = self._remove(front=True)
+        return f"Dequeued value: {value}"
+
+    def peek(self):
+        """Peek at the front of the queue"""
+        return self._front()
+
+    def get_queue(self):
+        """Get the queue as list, front first"""
+        return self.linked_list.to_list()
+
+
+class DequeManager(_DoublyEndsManager):
+    """Double-ended queue: O(1) push and pop at the front and the back"""
+    name = "Deque"
+
+    def push_front(self, value):
+        """Add value at the front"""
+        self._add(value, front=True)
+        return f"Pushed node with value: {value} at front"
+
+    def push_back(self, value):
+        """Add value at the back"""
+        self._add(value, front=False)
+        return f"Pushed node with value: {value} at back"
+
+    def pop_front(self):
+        """Remove the value at the front"""
+        value = self._remove(front=True)
+        return f"Popped value: {value} from front"
+
+    def pop_back(self):
+        """Remove the value at the back"""
+        value = self._remove(front=False)
+        return f"Popped value: {value} from back"
+
+    def peek_front(self):
+        """Peek at the front value"""
+        return self._front()
+
+    def peek_back(self):
+        """Peek at the back value"""
+        return self._back()
+
+    def get_deque(self):
+        """Get the deque as list, front first"""
+        return self.linked_list.to_list()
@@ -0,0 +1,268 @@
+"""Headless driver that replays operation scripts against the managers
+
+Run from the project directory (no GUI needed):
+    python -m models.replay script.txt [more scripts, or - for stdin]
+    python -m models.replay --timing --quiet --repeat 100 load.jsonl
+
+A script holds one operation per line, either as words or as a JSON object:
+    kind doubly                    # later bare list ops go to the doubly list
+    insert 5                       # doubly_insert(5)
+    insert "two words" 0           # arguments are Python literals, else strings
+    singly_insert 7                # any manager method by its full name
+    push 3                         # stack.push(3): first manager that has it
+    queue.push_front x             # or name the manager: stack., queue.
+    {"op": "delete", "args": [0]}
+    {"op": "circular_singly_traverse", "kwargs": {"cycles": 1}}
+Blank lines and lines starting with # are skipped. A name resolves to
+{kind}_{name} on the list manager, then the list manager, stack and queue
+manager methods in that order; the managers are the ones the UI drives.
+"""
+import argparse
+import ast
+import inspect
+import json
+import shlex
+import sys
+import time
+from types import GeneratorType
+from .linked_lists import LinkedListManager, LIST_KINDS
+from .stack import StackManager
+from .queues import DequeManager
+from .journal import OperationJournal
+from .instrumentation import Instrumentation
+
+TARGETS = ("", "stack.", "queue.")
+
+
+def _literal(word):
+    try:
+        return ast.literal_eval(word)
+    except (ValueError, SyntaxError):
+        return word
+
+
+def parse_line(line, number=0):
+    """Return (op, args, kwargs) for one script line, or None for blanks and comments"""
+    line = line.strip()
+    if not line or line.startswith("#"):
+        return None
+    if line.startswith("{"):
+        try:
+            step = json.loads(line)
+        except ValueError as e:
+            raise ValueError(f"Line {number}: bad JSON ({e})") from None
+        if not isinstance(step.get("op"), str):
+            raise ValueError(f"Line {number}: JSON step needs an \"op\" string")
+        return step["op"], list(step.get("args", ())), dict(step.get("kwargs", {}))
+    try:
+        words = shlex.split(line, comments=True)
+    except ValueError as e:
+        raise ValueError(f"Line {number}: {e}") from None
+    return words[0], [_literal(word) for word in words[1:]], {}
+
+
+def parse(lines):
+    """Yield (line number, op, args, kwargs) for every step in lines"""
+    for number, line in enumerate(lines, 1):
+        step = parse_line(line, number)
+        if step is not None:
+            yield (number, *step)
+
+
+class ScriptDriver:
+    """Resolves script ops to manager methods and runs them"""
+    def __init__(self, list_manager, stack_manager, queue_manager, kind="singly"):
+        self.managers = dict(zip(TARGETS, (list_manager, stack_manager, queue_manager)))
+        self.kind = kind
+        self._resolved = {}
+        self._signatures = {}
+
+    def resolve(self, op):
+        """Return (full name, bound method) for op; raise ValueError if nothing has it"""
+        key = (self.kind, op)
+        found = self._resolved.get(key)
+        if found is not None:
+            return found
+        prefix, dot, name = op.rpartition(".")
+        prefix += dot
+        if prefix not in self.managers or name.startswith("_"):
+            raise ValueError(f"Unknown operation '{op}'")
+        if prefix:
+            candidates = [(prefix, name)]
+        else:
+            candidates = [("", f"{self.kind}_{name}")] + [(target, name) for target in TARGETS]
+        for target, attr in candidates:
+            method = getattr(self.managers[target], attr, None)
+            if callable(method):
+                found = self._resolved[key] = (target + attr, method)
+                return found
+        raise ValueError(f"Unknown operation '{op}'")
+
+    def use(self, kind):
+        """Send bare list ops to the kind list from now on"""
+        if kind not in LIST_KINDS:
+            raise ValueError(f"kind takes one of: {', '.join(LIST_KINDS)}")
+        self.kind = kind
+        return f"Using the {kind} list"
+
+    def prepare(self, op, args=(), kwargs=None):
+        """
+        Return (full name, zero-argument call) for one step; 'kind' switches
+        the list bare list ops go to. Raises ValueError for unknown ops and
+        for arguments the method's signature does not take.
+        """
+        if op == "kind":
+            if len(args) != 1 or kwargs or args[0] not in LIST_KINDS:
+                raise ValueError(f"kind takes one of: {', '.join(LIST_KINDS)}")
+            return "kind", lambda: self.use(args[0])
+        name, method = self.resolve(op)
+        signature = self._signatures.get(name)
+        if signature is None:
+            signature = self._signatures[name] = inspect.signature(method)
+        try:
+            signature.bind(*args, **(kwargs or {}))
+        except TypeError as e:
+            raise ValueError(f"{name}: {e}") from None
+        return name, lambda: method(*args, **(kwargs or {}))
+
+    def run(self, op, args=(), kwargs=None):
+        """Run one step and return (full name, result); manager errors propagate"""
+        name, call = self.prepare(op, args, kwargs)
+        result = call()
+        if isinstance(result, GeneratorType):
+            result = list(result)
+        return name, result
+
+
+def _show(result):
+    return result if isinstance(result, str) else repr(result)
+
+
+def replay(driver, steps, out=sys.stdout, timing=False, as_json=False, quiet=False, strict=False):
+    """
+    Run every (line, op, args, kwargs) step through driver, writing one
+    result line per step to out as it finishes. Returns (steps run, errors,
+    seconds spent inside the managers). Unknown ops and arguments that do
+    not fit the method stop the replay with ValueError; errors raised by the
+    managers (ValueError, or TypeError for values that cannot be compared)
+    are reported and the replay goes on unless strict.
+    """
+    count = errors = 0
+    spent = 0.0
+    clock = time.perf_counter
+    for number, op, args, kwargs in steps:
+        try:
+            name, call = driver.prepare(op, args, kwargs)
+        except ValueError as e:
+            raise ValueError(f"Line {number}: {e}") from None
+        failed = False
+        start = clock()
+        try:
+            result = call()
+            if isinstance(result, GeneratorType):
+                result = list(result)
+        except (ValueError, TypeError) as e:
+            failed = True
+            result = str(e)
+        elapsed = clock() - start
+        spent += elapsed
+        count += 1
+        errors += failed
+        if as_json:
+            record = {"line": number, "op": name, "ok": not failed}
+            record["error" if failed else "result"] = result
+            if timing:
+                record["us"] = round(elapsed * 1e6, 3)
+            print(json.dumps(record, default=repr), file=out)
+        elif not quiet or failed:
+            shown = f"error: {result}" if failed else _show(result)
+            took = f"  [{elapsed * 1e6:.1f} us]" if timing else ""
+            print(f"{number}: {name} -> {shown}{took}", file=out)
+        if failed and strict:
+            break
+    return count, errors, spent
+
+
+def _read(paths):
+    """Yield the lines of every script in turn ('-' is stdin)"""
+    for path in paths:
+        if path == "-":
+            yield from sys.stdin
+        else:
+            with open(path, encoding="utf-8") as f:
+                yield from f
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m models.replay",
+                                     description="Replay operation scripts against the managers")
+    parser.add_argument("scripts", nargs="*", default=["-"], help="script files ('-' for stdin)")
+    parser.add_argument("--kind", choices=LIST_KINDS, default="singly",
+                        help="list that bare list ops start on (default %(default)s)")
+    parser.add_argument("--capacity", type=int, default=0,
+                        help="node cap per list, stack and queue (0, the default, for unbounded)")
+    parser.add_argument("--indexed", action="store_true", help="keep value indexes")
+    parser.add_argument("--pool", action="store_true", help="store the doubly list in a node pool")
+    parser.add_argument("--unrolled", action="store_true", help="store the doubly list in blocks")
+    parser.add_argument("--ring-buffer", action="store_true",
+                        help="store the circular singly list and stack in rings (needs --capacity)")
+    parser.add_argument("--journal", action="store_true", help="record undo/redo history")
+    parser.add_argument("--repeat", type=int, default=1, help="replay the scripts this many times")
+    parser.add_argument("--timing", action="store_true", help="add per-op times and a throughput summary")
+    parser.add_argument("--stats", action="store_true",
+                        help="print per-method latency percentiles and nodes walked at the end")
+    parser.add_argument("--json", action="store_true", help="write one JSON object per result")
+    parser.add_argument("--quiet", action="store_true", help="only report errors")
+    parser.add_argument("--strict", action="store_true", help="stop at the first failed op and exit 1")
+    args = parser.parse_args(argv)
+
+    capacity = args.capacity or None
+    if args.ring_buffer and capacity is None:
+        parser.error("--ring-buffer needs --capacity")
+    journal = OperationJournal() if args.journal else None
+    driver = ScriptDriver(
+        LinkedListManager(capacity, args.pool, args.indexed, journal, args.ring_buffer, args.unrolled),
+        StackManager(capacity, args.indexed, journal, args.ring_buffer),
+        DequeManager(capacity, args.indexed, journal),
+        args.kind)
+    instrumentation = None
+    if args.stats:
+        instrumentation = Instrumentation()
+        for prefix, manager in driver.managers.items():
+            instrumentation.attach(manager, prefix)
+
+    # A single pass streams the scripts step by step; repeats need them kept
+    steps = parse(_read(args.scripts))
+    if args.repeat > 1:
+        try:
+            steps = list(steps)
+        except (OSError, ValueError) as e:
+            print(e, file=sys.stderr)
+            return 2
+    count = errors = 0
+    spent = 0.0
+    start = time.perf_counter()
+    try:
+        for _ in range(args.repeat):
+            ran, failed, inside = replay(driver, steps, sys.stdout, args.timing, args.json,
+                                         args.quiet, args.strict)
+            count, errors, spent = count + ran, errors + failed, spent + inside
+            if failed and args.strict:
+                break
+    except (OSError, ValueError) as e:
+        print(e, file=sys.stderr)
+        return 2
+    wall = time.perf_counter() - start
+
+    if args.timing:
+        rate = count / spent if spent else float("inf")
+        print(f"# {count:,} ops, {errors:,} errors, {spent:.3f}s in the managers "
+              f"({rate:,.0f} ops/s), {wall:.3f}s wall")
+    if instrumentation is not None:
+        for line in instrumentation.lines():
+            print(f"# {line}")
+    return 1 if errors and args.strict else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
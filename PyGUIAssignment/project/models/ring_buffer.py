@@ -0,0 +1,484 @@
+"""
+Fixed-capacity ring buffer, and a circular singly list stored in one.
+
+The buffer preallocates its slots once: both ends take O(1) appends and pops,
+middle inserts/deletes shift whichever side is shorter, and nothing is ever
+reallocated. RingCircularSinglyList keeps the CircularSinglyLinkedList API on
+top of it; its head is an offset into the buffer, so rotate() is O(1) and the
+circular traversal can start from any node without copying.
+"""
+from heapq import merge
+from itertools import count as counter
+from .value_index import ValueIndex
+
+
+class RingBuffer:
+    """Preallocated slots addressed from start modulo capacity"""
+    def __init__(self, capacity):
+        if capacity is None or capacity < 1:
+            raise ValueError("Ring buffer needs a positive capacity")
+        self.slots = [None] * capacity
+        self.capacity = capacity
+        self.start = 0
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def _slot(self, index):
+        return (self.start + index) % self.capacity
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("Ring buffer index out of range")
+        return self.slots[self._slot(index)]
+
+    def values(self, first=0):
+        """Yield one lap of values, beginning at index first and wrapping to 0"""
+        slots = self.slots
+        capacity = self.capacity
+        start = self.start
+        size = self.size
+        for i in range(first, first + size):
+            yield slots[(start + i % size) % capacity]
+
+    def __iter__(self):
+        return self.values()
+
+    def __reversed__(self):
+        slots = self.slots
+        for i in range(self.size - 1, -1, -1):
+            yield slots[self._slot(i)]
+
+    @property
+    def full(self):
+        return self.size == self.capacity
+
+    def append(self, value):
+        """Add value at the back in O(1)"""
+        if self.size == self.capacity:
+            raise ValueError(f"Ring buffer is full! Maximum {self.capacity} values allowed.")
+        self.slots[(self.start + self.size) % self.capacity] = value
+        self.size += 1
+
+    def appendleft(self, value):
+        """Add value at the front in O(1)"""
+        if self.size == self.capacity:
+            raise ValueError(f"Ring buffer is full! Maximum {self.capacity} values allowed.")
+        self.start = (self.start - 1) % self.capacity
+        self.slots[self.start] = value
+        self.size += 1
+
+    def pop(self):
+        """Remove and return the back value in O(1)"""
+        if not self.size:
+            raise ValueError("Ring buffer is empty!")
+        self.size -= 1
+        slot = (self.start + self.size) % self.capacity
+        value = self.slots[slot]
+        self.slots[slot] = None
+        return value
+
+    def popleft(self):
+        """Remove and return the front value in O(1)"""
+        if not self.size:
+            raise ValueError("Ring buffer is empty!")
+        value = self.slots[self.start]
+        self.slots[self.start] = None
+        self.start = (self.start + 1) % self.capacity
+        self.size -= 1
+        return value
+
+    def insert_many(self, index, values):
+        """
+        Insert values before index, shifting the shorter side once;
+        return how many went in.
+        """
+        values = list(values)
+        count = len(values)
+        if not 0 <= index <= self.size:
+            raise IndexError("Ring buffer index out of range")
+        if self.size + count > self.capacity:
+            raise ValueError(f"Ring buffer is full! Only {self.capacity - self.size} more values fit.")
+        if not count:
+            return 0
+        slots = self.slots
+        slot = self._slot
+        if index < self.size - index:
+            self.start = (self.start - count) % self.capacity
+            for i in range(index):
+                slots[slot(i)] = slots[slot(i + count)]
+        else:
+            for i in range(self.size - 1, index - 1, -1):
+                slots[slot(i + count)] = slots[slot(i)]
+        for i, value in enumerate(values, index):
+            slots[slot(i)] = value
+        self.size += count
+        return count
+
+    def pop_range(self, first, stop):
+        """Remove indices first..stop-1, shifting the shorter side once; return their values"""
+        if first < 0 or stop > self.size or first > stop:
+            raise IndexError(f"Range must satisfy 0 <= start <= stop <= {self.size}")
+        count = stop - first
+        slots = self.slots
+        slot = self._slot
+        values = [slots[slot(i)] for i in range(first, stop)]
+        if first < self.size - stop:
+            for i in range(first - 1, -1, -1):
+                slots[slot(i + count)] = slots[slot(i)]
+            for i in range(count):
+                slots[slot(i)] = None
+            self.start = slot(count)
+        else:
+            for i in range(stop, self.size):
+                slots[slot(i - count)] = slots[slot(i)]
+            for i in range(self.size - count, self.size):
+                slots[slot(i)] = None
+        self.size -= count
+        return values
+
+    def rotate(self, steps):
+        """
+        Make index steps the new front (negative steps rotate the other way).
+        O(1) when full; otherwise moves the shorter side across the free slots.
+        """
+        if not self.size:
+            return
+        size = self.size
+        steps %= size
+        if size == self.capacity:
+            self.start = self._slot(steps)
+            return
+        slots = self.slots
+        capacity = self.capacity
+        start = self.start
+        if steps <= size - steps:
+            for i in range(start, start + steps):
+                slots[(i + size) % capacity] = slots[i % capacity]
+                slots[i % capacity] = None
+            self.start = (start + steps) % capacity
+        else:
+            for i in range(start + size - 1, start + steps - 1, -1):
+                slots[(i - size) % capacity] = slots[i % capacity]
+                slots[i % capacity] = None
+            self.start = (start + steps - size) % capacity
+
+    def clear(self):
+        """Drop every value but keep the slots"""
+        self.slots[:] = [None] * self.capacity
+        self.start = 0
+        self.size = 0
+
+
+class RingCircularSinglyList:
+    """
+    Bounded circular singly list on a RingBuffer, with the same API as
+    CircularSinglyLinkedList. head is the buffer index of the logical first
+    value: rotate() only moves it, and reads and mid-list inserts/deletes
+    add it into their buffer index instead of moving values.
+
+    Both ends sit where the ring closes, between buffer index head - 1 and
+    head. The buffer only has free slots after its last value, so after a
+    rotation the first end insert or delete of a partly filled ring moves
+    the free slots there once (min(head, size - head) values, see
+    RingBuffer.rotate). Later end operations are O(1) until the next
+    rotation. A full ring only rotates the buffer's start, so nothing moves.
+    """
+    def __init__(self, indexed=False, capacity=None):
+        """
+        capacity is fixed for the life of the list;
+        indexed keeps a ValueIndex (value -> tickets) so membership tests are O(1)
+        """
+        self.buffer = RingBuffer(capacity)
+        self.head = 0
+        self.index = ValueIndex() if indexed else None
+        # Values move between slots, so the index tracks a ticket per value instead
+        self.tickets = RingBuffer(capacity) if indexed else None
+        self.next_ticket = counter()
+
+    @property
+    def size(self):
+        return self.buffer.size
+
+    @property
+    def capacity(self):
+        return self.buffer.capacity
+
+    def __len__(self):
+        return self.buffer.size
+
+    def __iter__(self):
+        """Yield each value once, starting at the head"""
+        return self.buffer.values(self.head)
+
+    def __contains__(self, value):
+        return self.contains(value)
+
+    def rotate(self, steps=1):
+        """Make the node steps positions ahead the new head, in O(1)"""
+        if self.size:
+            self.head = (self.head + steps) % self.size
+
+    def _settle(self):
+        """Make head buffer index 0, moving the free slots to where the ring closes"""
+        if self.head:
+            self.buffer.rotate(self.head)
+            if self.tickets is not None:
+                self.tickets.rotate(self.head)
+            self.head = 0
+
+    def _put(self, position, values, max_count=None):
+        """Insert values at logical position; return how many went in"""
+        values = list(values)
+        room = self.capacity - self.size
+        if max_count is not None:
+            room = min(room, max_count)
+        if len(values) > room:
+            raise ValueError(f"List is full! Only {room} more nodes fit.")
+        if position in (0, self.size):
+            # The ends: the buffer's own ends once the free slots are there
+            self._settle()
+            at = position
+        else:
+            at = self.head + position
+            if at > self.size:
+                # Wraps round to the buffer's front, before the head value
+                at -= self.size
+                self.head += len(values)
+        count = self.buffer.insert_many(at, values)
+        if self.index is not None:
+            tickets = [next(self.next_ticket) for value in values]
+            self.tickets.insert_many(at, tickets)
+            for value, ticket in zip(values, tickets):
+                self.index.add(value, ticket)
+        return count
+
+    def _cut(self, first, stop):
+        """Remove buffer indices first..stop-1 and return their values"""
+        values = self.buffer.pop_range(first, stop)
+        if self.index is not None:
+            for value, ticket in zip(values, self.tickets.pop_range(first, stop)):
+                self.index.discard(value, ticket)
+        return values
+
+    def _take(self, start, stop):
+        """Remove logical positions start..stop-1 and return their values"""
+        size = self.size
+        if start == 0 or stop == size:
+            self._settle()
+            return self._cut(start, stop)
+        first = self.head + start
+        last = self.head + stop
+        if first >= size:
+            # Entirely before the head value in the buffer
+            values = self._cut(first - size, last - size)
+            self.head -= stop - start
+        elif last > size:
+            # Runs off the buffer's end and on from its front
+            values = self._cut(first, size) + self._cut(0, last - size)
+            self.head -= last - size
+        else:
+            values = self._cut(first, last)
+        return values
+
+    def _push(self, value, left):
+        """Add one value at either end in O(1) once settled"""
+        if self.buffer.size == self.buffer.capacity:
+            raise ValueError(f"List is full! Maximum {self.capacity} nodes allowed.")
+        self._settle()
+        if left:
+            self.buffer.appendleft(value)
+        else:
+            self.buffer.append(value)
+        if self.index is not None:
+            ticket = next(self.next_ticket)
+            if left:
+                self.tickets.appendleft(ticket)
+            else:
+                self.tickets.append(ticket)
+            self.index.add(value, ticket)
+
+    def _pop(self, left):
+        """Remove one value from either end in O(1) once settled"""
+        if not self.buffer.size:
+            raise ValueError("List is empty!")
+        self._settle()
+        value = self.buffer.popleft() if left else self.buffer.pop()
+        if self.index is not None:
+            self.index.discard(value, self.tickets.popleft() if left else self.tickets.pop())
+        return value
+
+    def appendleft(self, value):
+        """Insert at the head in O(1)"""
+        self._push(value, True)
+
+    def append(self, value):
+        """Insert at the end in O(1)"""
+        self._push(value, False)
+
+    def insert(self, value, position=None):
+        """Insert value at position (end if None)"""
+        if position is None:
+            return self.append(value)
+        if position < 0 or position > self.size:
+            raise ValueError(f"Position must be between 0 and {self.size}")
+        self._put(position, (value,))
+
+    def popleft(self):
+        """Remove and return the head value in O(1)"""
+        return self._pop(True)
+
+    def pop(self):
+        """Remove and return the tail value in O(1)"""
+        return self._pop(False)
+
+    def delete(self, position=None):
+        """Remove the value at position (end if None) and return it"""
+        if not self.size:
+            raise ValueError("List is empty!")
+        if position is None:
+            return self.pop()
+        if position < 0 or position >= self.size:
+            raise ValueError(f"Position must be between 0 and {self.size - 1}")
+        return self._take(position, position + 1)[0]
+
+    # Bulk operations
+    @classmethod
+    def from_iterable(cls, values, max_count=None, **options):
+        """Build a new list from values in one pass; capacity defaults to max_count"""
+        options.setdefault("capacity", max_count)
+        linked = cls(**options)
+        linked.extend(values, max_count)
+        return linked
+
+    def extend(self, values, max_count=None):
+        """Append every value and return how many were added"""
+        return self.insert_many(None, values, max_count)
+
+    def insert_many(self, position, values, max_count=None):
+        """Insert values starting at position (end if None) in one shift; return the count"""
+        if position is None:
+            position = self.size
+        if position < 0 or position > self.size:
+            raise ValueError(f"Position must be between 0 and {self.size}")
+        return self._put(position, values, max_count)
+
+    def delete_range(self, start, stop):
+        """Remove positions start..stop-1 in one shift and return how many were removed"""
+        return len(self.pop_range(start, stop))
+
+    def pop_range(self, start, stop):
+        """Remove positions start..stop-1 and return their values"""
+        if start < 0 or stop > self.size or start > stop:
+            raise ValueError(f"Range must satisfy 0 <= start <= stop <= {self.size}")
+        return self._take(start, stop)
+
+    # Sorting
+    def sort(self, key=None, reverse=False):
+        """Stable sort: the values are sorted in one array and refilled into the same slots"""
+        values = sorted(self, key=key, reverse=reverse)
+        self.clear()
+        self.extend(values)
+
+    def merge_sorted(self, other, key=None, reverse=False):
+        """
+        Merge the sorted values of other into this sorted list in one pass,
+        keeping it sorted (ties keep this list's values first); return how many
+        were added. other is only read.
+        """
+        if other is self:
+            raise ValueError("Cannot merge a list into itself")
+        incoming = list(other)
+        room = self.capacity - self.size
+        if len(incoming) > room:
+            raise ValueError(f"List is full! Only {room} more nodes fit.")
+        values = list(merge(self, incoming, key=key, reverse=reverse))
+        self.clear()
+        self.extend(values)
+        return len(incoming)
+
+    # Search
+    def contains(self, value):
+        """Membership test; O(1) on average when indexed"""
+        if self.index is not None:
+            return value in self.index
+        return any(data == value for data in self)
+
+    def search(self, value):
+        """Return the position of the first node holding value (from head), or -1"""
+        if self.index is not None and value not in self.index:
+            return -1
+        for i, data in enumerate(self):
+            if data == value:
+                return i
+        return -1
+
+    def delete_value(self, value):
+        """Remove the first value equal to value and return True, or False if absent"""
+        position = self.search(value)
+        if position == -1:
+            return False
+        self.delete(position)
+        return True
+
+    def iter_forward(self, cycles=1, limit=None, start=0):
+        """
+        Lazily yield (step, value, index) triples walking the ring from
+        position start. Stops after the given cycles and/or limit steps;
+        with both None it never stops.
+        """
+        size = self.size
+        if not size:
+            return
+        steps = None if cycles is None else size * cycles
+        if limit is not None:
+            steps = limit if steps is None else min(steps, limit)
+
+        buffer = self.buffer
+        head = self.head
+        step = 0
+        while steps is None or step < steps:
+            index = (start + step) % size
+            yield step, buffer[(head + index) % size], index
+            step += 1
+
+    def traverse(self, cycles=2):
+        """Return (step, value, index) triples walking the ring for the given cycles"""
+        return list(self.iter_forward(cycles))
+
+    def to_list(self):
+        """Return one lap of values starting at the head"""
+        return list(self)
+
+    def peek(self):
+        """Peek at the first element"""
+        if not self.size:
+            return None
+        return self.buffer[self.head]
+
+    def clear(self):
+        """Remove all values, keeping the preallocated slots"""
+        self.buffer.clear()
+        self.head = 0
+        if self.index is not None:
+            self.tickets.clear()
+            self.index.clear()
+
+    def validate(self):
+        """Check the head offset, unused slots and ticket index in O(capacity); raise ValueError if broken"""
+        buffer = self.buffer
+        if not 0 <= buffer.size <= buffer.capacity or not 0 <= buffer.start < buffer.capacity:
+            raise ValueError(f"Invalid list: size {buffer.size} or start {buffer.start} out of range")
+        if not (0 <= self.head < self.size or self.head == self.size == 0):
+            raise ValueError(f"Invalid list: head offset {self.head} out of range")
+        live = {buffer._slot(i) for i in range(buffer.size)}
+        if any(buffer.slots[slot] is not None for slot in range(buffer.capacity) if slot not in live):
+            raise ValueError("Invalid list: a free slot still holds a value")
+        if self.index is not None:
+            if self.tickets.size != buffer.size:
+                raise ValueError(f"Invalid list: {self.tickets.size} tickets but size is {buffer.size}")
+            self.index.validate(zip(buffer, self.tickets))
+        return True
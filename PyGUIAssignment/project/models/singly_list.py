@@ -0,0 +1,318 @@
+"""Node-based singly linked list with head/tail pointers and a cached size"""
+from .node import Node, build_chain, iter_chain, merge_chains, sort_chain, take_chain
+from .value_index import ValueIndex
+
+class SinglyLinkedList:
+    def __init__(self, indexed=False):
+        """
+        indexed keeps a ValueIndex so membership tests are O(1). The index
+        also numbers each node: position = number - base while numbered is
+        set. Work at the ends keeps the numbers valid; anything that shifts
+        the middle clears numbered and the next search renumbers in one pass.
+        """
+        self.head = None
+        self.tail = None
+        self.size = 0
+        self.index = ValueIndex() if indexed else None
+        self.base = 0
+        self.numbered = True
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        current = self.head
+        while current:
+            yield current.data
+            current = current.next
+
+    def __contains__(self, value):
+        return self.contains(value)
+
+    def _node_at(self, index):
+        """Return the node at index (0 <= index < size)"""
+        if index == self.size - 1:
+            return self.tail
+        current = self.head
+        for i in range(index):
+            current = current.next
+        return current
+
+    def _splice_after(self, before, first, last, count):
+        """Link the chain first..last (count nodes) after before (None for the head)"""
+        if before is self.tail:
+            number = self.base + self.size
+        elif before is None:
+            self.base -= count
+            number = self.base
+        else:
+            self.numbered = False
+            number = None
+        if before:
+            last.next = before.next
+            before.next = first
+        else:
+            last.next = self.head
+            self.head = first
+        if before is self.tail:
+            self.tail = last
+        self.size += count
+        if self.index is not None:
+            node = first
+            for i in range(count):
+                self.index.add(node.data, node, number)
+                if number is not None:
+                    number += 1
+                node = node.next
+
+    def _cut_after(self, before, count):
+        """Unlink count nodes after before (None for the head) and return the first"""
+        first = before.next if before else self.head
+        last = first
+        for i in range(count - 1):
+            last = last.next
+        after = last.next
+        if before:
+            before.next = after
+        else:
+            self.head = after
+        if not after:
+            self.tail = before
+        last.next = None
+        self.size -= count
+        if not before:
+            self.base += count
+        elif after:
+            self.numbered = False
+        if self.index is not None:
+            node = first
+            while node:
+                self.index.discard(node.data, node)
+                node = node.next
+        return first
+
+    def append(self, value):
+        """Insert at the tail in O(1)"""
+        new_node = Node(value)
+        self._splice_after(self.tail, new_node, new_node, 1)
+        return new_node
+
+    def appendleft(self, value):
+        """Insert at the head in O(1)"""
+        new_node = Node(value)
+        self._splice_after(None, new_node, new_node, 1)
+        return new_node
+
+    def insert(self, value, position=None):
+        """Insert value at position (end if None) and return the new node"""
+        if position is None:
+            return self.append(value)
+        if position < 0 or position > self.size:
+            raise ValueError(f"Position must be between 0 and {self.size}")
+        if position == 0:
+            return self.appendleft(value)
+
+        new_node = Node(value)
+        self._splice_after(self._node_at(position - 1), new_node, new_node, 1)
+        return new_node
+
+    def popleft(self):
+        """Remove and return the head value in O(1)"""
+        if not self.head:
+            raise ValueError("List is empty!")
+        return self._cut_after(None, 1).data
+
+    def pop(self):
+        """Remove and return the tail value (walks to the node before the tail)"""
+        if not self.head:
+            raise ValueError("List is empty!")
+        return self.delete(self.size - 1)
+
+    def delete(self, position=None):
+        """Remove the value at position (end if None) and return it"""
+        if not self.head:
+            raise ValueError("List is empty!")
+        if position is None:
+            return self.pop()
+        if position < 0 or position >= self.size:
+            raise ValueError(f"Position must be between 0 and {self.size - 1}")
+        before = self._node_at(position - 1) if position else None
+        return self._cut_after(before, 1).data
+
+    # Bulk operations
+    @classmethod
+    def from_iterable(cls, values, max_count=None, **options):
+        """Build a new list from values in one pass"""
+        linked = cls(**options)
+        linked.extend(values, max_count)
+        return linked
+
+    def extend(self, values, max_count=None):
+        """Append every value in one splice and return how many were added"""
+        return self.insert_many(None, values, max_count)
+
+    def insert_many(self, position, values, max_count=None):
+        """Splice values in starting at position (end if None); return the count"""
+        if position is None:
+            position = self.size
+        if position < 0 or position > self.size:
+            raise ValueError(f"Position must be between 0 and {self.size}")
+        first, last, count = build_chain(values, max_count, doubly=False)
+        if not count:
+            return 0
+
+        before = self._node_at(position - 1) if position else None
+        self._splice_after(before, first, last, count)
+        return count
+
+    def _cut_range(self, start, stop):
+        """Unlink positions start..stop-1 and return the detached chain (None if empty)"""
+        if start < 0 or stop > self.size or start > stop:
+            raise ValueError(f"Range must satisfy 0 <= start <= stop <= {self.size}")
+        count = stop - start
+        if not count:
+            return None
+
+        before = self._node_at(start - 1) if start else None
+        return self._cut_after(before, count)
+
+    def delete_range(self, start, stop):
+        """Unlink positions start..stop-1 in one pass and return how many were removed"""
+        self._cut_range(start, stop)
+        return stop - start
+
+    def pop_range(self, start, stop):
+        """Unlink positions start..stop-1 and return their values"""
+        return list(iter_chain(self._cut_range(start, stop)))
+
+    def reverse_inplace(self):
+        """Reverse the links in one pass with O(1) extra space"""
+        previous = None
+        current = self.head
+        while current:
+            following = current.next
+            current.next = previous
+            previous = current
+            current = following
+        self.head, self.tail = self.tail, self.head
+        self.numbered = False
+
+    # Sorting
+    def _unlink_all(self):
+        """Detach every node as a None-terminated chain and return the first; the index keeps its entries"""
+        first = self.head
+        self.head = None
+        self.tail = None
+        self.size = 0
+        return first
+
+    def _relink_all(self, first, last, count):
+        """Make the None-terminated chain first..last (count nodes) the whole list"""
+        self.head = first
+        self.tail = last
+        self.size = count
+        self.numbered = False
+
+    def sort(self, key=None, reverse=False):
+        """Stable merge sort that relinks the existing nodes: O(n log n) time, no new nodes"""
+        count = self.size
+        first, last = sort_chain(self._unlink_all(), key, reverse)
+        self._relink_all(first, last, count)
+
+    def merge_sorted(self, other, key=None, reverse=False):
+        """
+        Merge the sorted values of other into this sorted list in one pass,
+        keeping it sorted (ties keep this list's values first); return how many
+        were added. Node-based lists hand over their nodes and are left empty.
+        """
+        if other is self:
+            raise ValueError("Cannot merge a list into itself")
+        incoming, added = take_chain(other, self.index)
+        count = self.size + added
+        first, last = merge_chains(self._unlink_all(), incoming, key, reverse)
+        self._relink_all(first, last, count)
+        return added
+
+    # Search
+    def contains(self, value):
+        """Membership test; O(1) on average when indexed"""
+        if self.index is not None:
+            return value in self.index
+        return any(data == value for data in self)
+
+    def _renumber(self):
+        """Number every node by its position in one pass"""
+        node = self.head
+        for i in range(self.size):
+            self.index.place(node.data, node, i)
+            node = node.next
+        self.base = 0
+        self.numbered = True
+
+    def search(self, value):
+        """
+        Return the position of the first node holding value (from head), or -1.
+        Indexed lists answer from the node numbers, renumbering first if the
+        middle changed since the last search.
+        """
+        if self.index is not None:
+            if value not in self.index:
+                return -1
+            if not self.numbered:
+                self._renumber()
+            return self.index.lowest(value)[0] - self.base
+        for i, data in enumerate(self):
+            if data == value:
+                return i
+        return -1
+
+    def delete_value(self, value):
+        """Remove the first node holding value and return True, or False if absent"""
+        position = self.search(value)
+        if position == -1:
+            return False
+        self.delete(position)
+        return True
+
+    def traverse(self):
+        """Return (index, value) pairs from head to tail"""
+        return list(enumerate(self))
+
+    def to_list(self):
+        """Return the values from head to tail as a Python list"""
+        return list(self)
+
+    def peek(self):
+        """Peek at the first element"""
+        if not self.head:
+            return None
+        return self.head.data
+
+    def clear(self):
+        """Remove all nodes"""
+        self.head = None
+        self.tail = None
+        self.size = 0
+        self.base = 0
+        self.numbered = True
+        if self.index is not None:
+            self.index.clear()
+
+    def validate(self):
+        """Check links, tail and cached size in O(n); raise ValueError if broken"""
+        nodes = []
+        current = self.head
+        while current:
+            if len(nodes) == self.size:
+                raise ValueError(f"Invalid list: more than {self.size} nodes or a cycle")
+            nodes.append(current)
+            current = current.next
+        if len(nodes) != self.size:
+            raise ValueError(f"Invalid list: {len(nodes)} nodes but size is {self.size}")
+        if self.tail is not (nodes[-1] if nodes else None):
+            raise ValueError("Invalid list: tail is not the last node")
+        if self.index is not None:
+            self.index.validate((node.data, node) for node in nodes)
+            if self.numbered:
+                self.index.check_numbers(((node.data, node) for node in nodes), self.base)
+        return True
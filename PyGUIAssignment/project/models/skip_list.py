@@ -0,0 +1,361 @@
+"""
+Indexable skip list: a singly linked list with express lanes.
+
+Every node links to its successor on level 0 like a singly list, and taller
+nodes also link further ahead on higher levels. Each link stores its width
+(how many positions it skips), so a seek to any position drops down the
+levels in O(log n) expected steps instead of walking from the head.
+"""
+import random
+from heapq import merge
+from .value_index import ValueIndex
+
+MAX_LEVEL = 32
+
+
+class SkipNode:
+    """A value plus one (next, width) link per level it reaches"""
+    __slots__ = ('data', 'next', 'width')
+
+    def __init__(self, data, height):
+        self.data = data
+        self.next = [None] * height
+        self.width = [0] * height
+
+    @property
+    def height(self):
+        return len(self.next)
+
+
+class SkipList:
+    def __init__(self, indexed=False, seed=None):
+        """
+        indexed keeps a ValueIndex so membership tests are O(1);
+        seed fixes the node heights (for reproducible benchmarks).
+        Positions count from 1 inside the levels: the head sits at 0 and a
+        link's width runs to the next node, or to size + 1 when it has none.
+        """
+        self.head = SkipNode(None, MAX_LEVEL)
+        self.level = 1
+        self.head.width[0] = 1
+        self.size = 0
+        self.random = random.Random(seed)
+        self.index = ValueIndex() if indexed else None
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        current = self.head.next[0]
+        while current:
+            yield current.data
+            current = current.next[0]
+
+    def __contains__(self, value):
+        return self.contains(value)
+
+    def _height(self):
+        """Random height with P(height > h) = 2**-h"""
+        bits = self.random.getrandbits(MAX_LEVEL - 1)
+        return (bits & -bits).bit_length() if bits else MAX_LEVEL
+
+    def _seek(self, position):
+        """
+        Return the last node at or before position on every level, and the
+        position of each, dropping down from the top level.
+        """
+        chain = [None] * self.level
+        steps = [0] * self.level
+        node = self.head
+        dist = 0
+        for level in range(self.level - 1, -1, -1):
+            nxt = node.next[level]
+            while nxt is not None and dist + node.width[level] <= position:
+                dist += node.width[level]
+                node = nxt
+                nxt = node.next[level]
+            chain[level] = node
+            steps[level] = dist
+        return chain, steps
+
+    def _node_at(self, position):
+        """Return the node at list position (0 <= position < size) in O(log n)"""
+        node = self.head
+        dist = 0
+        target = position + 1
+        for level in range(self.level - 1, -1, -1):
+            while node.next[level] is not None and dist + node.width[level] <= target:
+                dist += node.width[level]
+                node = node.next[level]
+            if dist == target:
+                break
+        return node
+
+    def _grow(self, height):
+        """Open head links up to height before a node that tall is linked"""
+        for level in range(self.level, height):
+            self.head.next[level] = None
+            self.head.width[level] = self.size + 1
+        self.level = max(self.level, height)
+
+    def _link(self, value, position):
+        """Link a new node so it lands at position and return it"""
+        node = SkipNode(value, self._height())
+        height = node.height
+        self._grow(height)
+        chain, steps = self._seek(position)
+        for level in range(self.level):
+            before = chain[level]
+            if level < height:
+                offset = position - steps[level]
+                node.next[level] = before.next[level]
+                node.width[level] = before.width[level] - offset
+                before.next[level] = node
+                before.width[level] = offset + 1
+            else:
+                before.width[level] += 1
+        self.size += 1
+        if self.index is not None:
+            self.index.add(value, node)
+        return node
+
+    def _unlink(self, position):
+        """Unlink the node at position and return it"""
+        chain, steps = self._seek(position)
+        node = chain[0].next[0]
+        for level in range(self.level):
+            before = chain[level]
+            if before.next[level] is node:
+                before.next[level] = node.next[level]
+                before.width[level] += node.width[level] - 1
+            else:
+                before.width[level] -= 1
+        self.size -= 1
+        if self.index is not None:
+            self.index.discard(node.data, node)
+        return node
+
+    def get(self, position):
+        """Return the value at position in O(log n)"""
+        if position < 0 or position >= self.size:
+            raise ValueError(f"Position must be between 0 and {self.size - 1}")
+        return self._node_at(position).data
+
+    def append(self, value):
+        """Insert at the end in O(log n)"""
+        return self._link(value, self.size)
+
+    def appendleft(self, value):
+        """Insert at the front in O(log n)"""
+        return self._link(value, 0)
+
+    def insert(self, value, position=None):
+        """Insert value at position (end if None) in O(log n) and return the new node"""
+        if position is None:
+            return self.append(value)
+        if position < 0 or position > self.size:
+            raise ValueError(f"Position must be between 0 and {self.size}")
+        return self._link(value, position)
+
+    def pop(self):
+        """Remove and return the last value"""
+        if not self.size:
+            raise ValueError("List is empty!")
+        return self._unlink(self.size - 1).data
+
+    def popleft(self):
+        """Remove and return the first value"""
+        if not self.size:
+            raise ValueError("List is empty!")
+        return self._unlink(0).data
+
+    def delete(self, position=None):
+        """Remove the value at position (end if None) in O(log n) and return it"""
+        if not self.size:
+            raise ValueError("List is empty!")
+        if position is None:
+            return self.pop()
+        if position < 0 or position >= self.size:
+            raise ValueError(f"Position must be between 0 and {self.size - 1}")
+        return self._unlink(position).data
+
+    # Bulk operations
+    @classmethod
+    def from_iterable(cls, values, max_count=None, **options):
+        """Build a new list from values in one O(n) pass"""
+        linked = cls(**options)
+        linked.extend(values, max_count)
+        return linked
+
+    def extend(self, values, max_count=None):
+        """Append every value and return how many were added"""
+        return self.insert_many(None, values, max_count)
+
+    def _build(self, values, max_count):
+        """Link values into an empty list level by level in O(n)"""
+        last = [self.head] * MAX_LEVEL
+        last_at = [0] * MAX_LEVEL
+        count = 0
+        for value in values:
+            if count == max_count:
+                self.clear()
+                raise ValueError(f"List is full! Only {max_count} more nodes fit.")
+            count += 1
+            node = SkipNode(value, self._height())
+            for level in range(node.height):
+                before = last[level]
+                before.next[level] = node
+                before.width[level] = count - last_at[level]
+                last[level] = node
+                last_at[level] = count
+            self.level = max(self.level, node.height)
+            if self.index is not None:
+                self.index.add(value, node)
+        for level in range(self.level):
+            last[level].next[level] = None
+            last[level].width[level] = count + 1 - last_at[level]
+        self.size = count
+        return count
+
+    def insert_many(self, position, values, max_count=None):
+        """
+        Insert values starting at position (end if None); return the count.
+        An empty list is built in O(n), otherwise each value costs O(log n).
+        """
+        if position is None:
+            position = self.size
+        if position < 0 or position > self.size:
+            raise ValueError(f"Position must be between 0 and {self.size}")
+        if not self.size:
+            return self._build(values, max_count)
+        values = list(values)
+        if max_count is not None and len(values) > max_count:
+            raise ValueError(f"List is full! Only {max_count} more nodes fit.")
+        for offset, value in enumerate(values):
+            self._link(value, position + offset)
+        return len(values)
+
+    def delete_range(self, start, stop):
+        """Remove positions start..stop-1 and return how many were removed"""
+        return len(self.pop_range(start, stop))
+
+    def pop_range(self, start, stop):
+        """Remove positions start..stop-1 and return their values"""
+        if start < 0 or stop > self.size or start > stop:
+            raise ValueError(f"Range must satisfy 0 <= start <= stop <= {self.size}")
+        return [self._unlink(start).data for i in range(stop - start)]
+
+    # Sorting
+    def sort(self, key=None, reverse=False):
+        """Stable sort: the values are sorted in one array and the list is rebuilt in O(n)"""
+        values = sorted(self, key=key, reverse=reverse)
+        self.clear()
+        self.extend(values)
+
+    def merge_sorted(self, other, key=None, reverse=False):
+        """
+        Merge the sorted values of other into this sorted list in one pass,
+        keeping it sorted (ties keep this list's values first); return how many
+        were added. other is only read.
+        """
+        if other is self:
+            raise ValueError("Cannot merge a list into itself")
+        incoming = list(other)
+        values = list(merge(self, incoming, key=key, reverse=reverse))
+        self.clear()
+        self.extend(values)
+        return len(incoming)
+
+    # Search
+    def contains(self, value):
+        """Membership test; O(1) on average when indexed"""
+        if self.index is not None:
+            return value in self.index
+        return any(data == value for data in self)
+
+    def search(self, value):
+        """Return the position of the first node holding value (from head), or -1"""
+        if self.index is not None and value not in self.index:
+            return -1
+        for i, data in enumerate(self):
+            if data == value:
+                return i
+        return -1
+
+    def bisect_right(self, value):
+        """
+        Return how many leading values are <= value, for a sorted list: the
+        position that inserts value after its equals, found in O(log n)
+        """
+        node = self.head
+        dist = 0
+        for level in range(self.level - 1, -1, -1):
+            while node.next[level] is not None and not value < node.next[level].data:
+                dist += node.width[level]
+                node = node.next[level]
+        return dist
+
+    def towers(self):
+        """Return (value, height) pairs from head to tail"""
+        result = []
+        current = self.head.next[0]
+        while current:
+            result.append((current.data, current.height))
+            current = current.next[0]
+        return result
+
+    def traverse(self):
+        """Return (index, value) pairs from head to tail"""
+        return list(enumerate(self))
+
+    def to_list(self):
+        """Return the values from head to tail as a Python list"""
+        return list(self)
+
+    def peek(self):
+        """Peek at the first element"""
+        first = self.head.next[0]
+        return first.data if first else None
+
+    def clear(self):
+        """Remove all nodes"""
+        self.head = SkipNode(None, MAX_LEVEL)
+        self.head.width[0] = 1
+        self.level = 1
+        self.size = 0
+        if self.index is not None:
+            self.index.clear()
+
+    def validate(self):
+        """Check every level's links and widths against the bottom level in O(n log n); raise ValueError if broken"""
+        positions = {}
+        current = self.head.next[0]
+        while current:
+            if len(positions) == self.size:
+                raise ValueError(f"Invalid list: more than {self.size} nodes or a cycle")
+            positions[id(current)] = len(positions) + 1
+            current = current.next[0]
+        if len(positions) != self.size:
+            raise ValueError(f"Invalid list: {len(positions)} nodes but size is {self.size}")
+        for level in range(self.level):
+            node = self.head
+            at = 0
+            while True:
+                nxt = node.next[level]
+                target = self.size + 1 if nxt is None else positions.get(id(nxt))
+                if target is None or target <= at or node.width[level] != target - at:
+                    raise ValueError(f"Invalid list: bad link or width on level {level}")
+                if nxt is None:
+                    break
+                node = nxt
+                at = target
+        if self.index is not None:
+            self.index.validate((node.data, node) for node in self._nodes())
+        return True
+
+    def _nodes(self):
+        """Yield nodes from head to tail"""
+        current = self.head.next[0]
+        while current:
+            yield current
+            current = current.next[0]
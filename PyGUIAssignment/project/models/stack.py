@@ -1,23 +1,96 @@
 """Stack implementation"""
+from bisect import bisect_left, insort
+from .ring_buffer import RingBuffer
 
 MAX_STACK_SIZE = 10
 
 class StackManager:
-    def __init__(self):
-        self.linked_list_stack = []
+    def __init__(self, capacity=MAX_STACK_SIZE, indexed=False, journal=None, ring_buffer=False):
+        """
+        capacity caps the number of elements (None for unbounded);
+        indexed keeps value -> stack slots so contains/search are O(1);
+        journal is an OperationJournal that records every mutation for undo/redo;
+        ring_buffer preallocates capacity slots instead of growing a list
+        """
+        self.capacity = capacity
+        self.ring_buffer = ring_buffer
+        self.linked_list_stack = self._new_stack()
+        self.index = {} if indexed else None
+        self.journal = journal
+    
+    def _new_stack(self):
+        """Empty storage: a RingBuffer of capacity slots, or a plain list"""
+        return RingBuffer(self.capacity) if self.ring_buffer else []
+    
+    def _push(self, value):
+        """Push without capacity checks or journaling"""
+        if self.index is not None:
+            self.index.setdefault(value, []).append(len(self.linked_list_stack))
+        self.linked_list_stack.append(value)
+    
+    def _pop(self):
+        """Pop without journaling and return the value"""
+        value = self.linked_list_stack.pop()
+        if self.index is not None:
+            slots = self.index[value]
+            slots.pop()
+            if not slots:
+                del self.index[value]
+        return value
+    
+    def _remove_at(self, slot):
+        """Remove the value at slot (0 is the bottom) without journaling and return it"""
+        stack = self.linked_list_stack
+        if self.ring_buffer:
+            value = stack.pop_range(slot, slot + 1)[0]
+        else:
+            value = stack.pop(slot)
+        if self.index is not None:
+            slots = self.index[value]
+            del slots[bisect_left(slots, slot)]
+            if not slots:
+                del self.index[value]
+            # Only the values above slot moved down, each by one
+            for moved in range(slot, len(stack)):
+                slots = self.index[stack[moved]]
+                slots[bisect_left(slots, moved + 1)] = moved
+        return value
+    
+    def _insert_at(self, slot, value):
+        """Put value back at slot without capacity checks or journaling"""
+        stack = self.linked_list_stack
+        if self.ring_buffer:
+            stack.insert_many(slot, (value,))
+        else:
+            stack.insert(slot, value)
+        if self.index is not None:
+            # Only the values above slot moved up, each by one (top first so slots stay distinct)
+            for moved in range(len(stack) - 1, slot, -1):
+                slots = self.index[stack[moved]]
+                slots[bisect_left(slots, moved - 1)] = moved
+            insort(self.index.setdefault(value, []), slot)
+    
+    def _restore(self, stack, index):
+        """Swap in whole stack state (used to undo and redo clear)"""
+        self.linked_list_stack = stack
+        self.index = index
     
     def push(self, value):
         """Push value onto stack"""
-        if len(self.linked_list_stack) >= MAX_STACK_SIZE:
-            raise ValueError(f"Stack is full! Maximum {MAX_STACK_SIZE} elements allowed.")
-        self.linked_list_stack.append(value)
+        if self.capacity is not None and len(self.linked_list_stack) >= self.capacity:
+            raise ValueError(f"Stack is full! Maximum {self.capacity} elements allowed.")
+        self._push(value)
+        if self.journal is not None:
+            self.journal.record(self._push, (value,), self._pop, ())
         return f"Pushed node with value: {value}"
     
     def pop(self):
         """Pop value from stack"""
         if not self.linked_list_stack:
             raise ValueError("Stack is empty!")
-        value = self.linked_list_stack.pop()
+        value = self._pop()
+        if self.journal is not None:
+            self.journal.record(self._pop, (), self._push, (value,))
         return f"Popped value: {value}"
     
     def peek(self):
@@ -32,7 +105,39 @@ class StackManager:
     
     def clear(self):
         """Clear the stack"""
+        if self.journal is not None:
+            old = (self.linked_list_stack, self.index)
+            new = (self._new_stack(), {} if self.index is not None else None)
+            self._restore(*new)
+            self.journal.record(self._restore, new, self._restore, old)
+            return
         self.linked_list_stack.clear()
+        if self.index is not None:
+            self.index.clear()
+    
+    def _build(self, values):
+        """New (stack, index) state holding values (bottom first), not swapped in"""
+        stack = self._new_stack()
+        index = {} if self.index is not None else None
+        for value in values:
+            if self.capacity is not None and len(stack) >= self.capacity:
+                raise ValueError(f"Stack is full! Maximum {self.capacity} elements allowed.")
+            if index is not None:
+                index.setdefault(value, []).append(len(stack))
+            stack.append(value)
+        return stack, index
+    
+    def _swap_in(self, stack, index):
+        """Make a state from _build the current one (journaled) and return the load message"""
+        old = (self.linked_list_stack, self.index)
+        self._restore(stack, index)
+        if self.journal is not None:
+            self.journal.record(self._restore, (stack, index), self._restore, old)
+        return f"Loaded {len(stack)} values"
+    
+    def from_iterable(self, values):
+        """Replace the stack with values (bottom first) in one pass"""
+        return self._swap_in(*self._build(values))
     
     def get_stack(self):
         """Get the stack as list"""
@@ -43,11 +148,51 @@ class StackManager:
         Search for a value in the stack
         Returns the position from top (0-indexed) if found, else -1
         """
+        if self.index is not None:
+            slots = self.index.get(value)
+            if not slots:
+                return -1
+            return len(self.linked_list_stack) - 1 - slots[-1]
+        
         for i in range(len(self.linked_list_stack) - 1, -1, -1):  # Search from top to bottom
             if self.linked_list_stack[i] == value:
                 return len(self.linked_list_stack) - 1 - i  # Position from top (0-indexed)
         return -1  # Value not found
     
+    def delete_value(self, value):
+        """
+        Remove the topmost occurrence of value (the one search reports) from
+        the stack; the index only updates the slots above it
+        """
+        position = self.search(value)
+        if position == -1:
+            raise ValueError(f"Value '{value}' not found")
+        slot = len(self.linked_list_stack) - 1 - position
+        self._remove_at(slot)
+        if self.journal is not None:
+            self.journal.record(self._remove_at, (slot,), self._insert_at, (slot, value))
+        return f"Deleted value: {value}"
+    
+    def contains(self, value):
+        """Check if value is anywhere in the stack"""
+        if self.index is not None:
+            return value in self.index
+        return value in self.linked_list_stack
+    
     def size(self):
         """Return the size of the stack"""
-        return len(self.linked_list_stack)
\ No newline at end of file
+        return len(self.linked_list_stack)
+    
+    def undo(self):
+        """Reverse the latest journaled step"""
+        if self.journal is None:
+            raise ValueError("Undo is not enabled!")
+        count = self.journal.undo()
+        return f"Undid {count} operation(s)"
+    
+    def redo(self):
+        """Replay the latest undone step"""
+        if self.journal is None:
+            raise ValueError("Undo is not enabled!")
+        count = self.journal.redo()
+        return f"Redid {count} operation(s)"
\ No newline at end of file
@@ -0,0 +1,324 @@
+"""
+Streaming save/load of LinkedListManager, StackManager and queue/deque state.
+
+Two formats share one layout: a header, then one section per structure
+(name, node count, then the values head first / stack bottom first /
+queue front first).
+- binary: length-prefixed runs of same-typed values, read back through mmap;
+  ints and floats are packed arrays and each run of strings is one UTF-8 blob
+- JSONL: one JSON document per line, for diffing and hand editing
+
+Values are written while walking the lists and read back into new
+structures one at a time, so neither side holds a second copy of the data.
+A load builds every section before swapping any of them in (as one undo
+step), so a section that fails, e.g. on capacity, leaves the managers as
+they were.
+"""
+import gc
+import json
+import mmap
+import os
+import shutil
+import struct
+import sys
+import tempfile
+from array import array
+from collections import deque
+from contextlib import ExitStack, contextmanager
+from itertools import accumulate, chain
+from .linked_lists import LIST_KINDS
+
+MAGIC = b"LLST\x01"
+JSONL_HEADER = {"format": "linked-lists", "version": 1}
+
+_U8 = struct.Struct("<B")
+_U32 = struct.Struct("<I")
+_U64 = struct.Struct("<Q")
+_RUN = struct.Struct("<BI")
+
+# Run kinds, and the tags of the one-off records inside an _OTHER run
+_STR, _INT, _FLOAT, _OTHER = b"sidO"
+_TRUE, _FALSE, _NONE, _BIGINT = b"TFnb"
+
+_RUN_LENGTH = 4096
+_FLUSH_AT = 1 << 16
+
+
+def _sections(list_manager, stack_manager, queue_manager):
+    """Yield (name, count, values) for every structure being saved"""
+    if list_manager is not None:
+        for kind in LIST_KINDS:
+            linked = getattr(list_manager, f"{kind}_list")
+            yield kind, linked.size, iter(linked)
+    if stack_manager is not None:
+        yield "stack", stack_manager.size(), iter(stack_manager.get_stack())
+    if queue_manager is not None:
+        yield "queue", queue_manager.size(), iter(queue_manager.linked_list)
+
+
+def _run_kind(value):
+    kind = type(value)
+    if kind is str:
+        return _STR
+    if kind is int and -(1 << 63) <= value < (1 << 63):
+        return _INT
+    if kind is float:
+        return _FLOAT
+    return _OTHER
+
+
+def _packed(typecode, values):
+    """Little-endian bytes of an array of values"""
+    packed = array(typecode, values)
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def _unpacked(typecode, data, pos, count):
+    """Read count little-endian array items starting at pos"""
+    unpacked = array(typecode)
+    unpacked.frombytes(data[pos:pos + count * unpacked.itemsize])
+    if sys.byteorder == "big":
+        unpacked.byteswap()
+    return unpacked
+
+
+def _encode_run(kind, run, out):
+    """Append one run of same-kind values to the bytearray out"""
+    out += _RUN.pack(kind, len(run))
+    if kind == _INT:
+        out += _packed("q", run)
+    elif kind == _FLOAT:
+        out += _packed("d", run)
+    elif kind == _STR:
+        # Lengths are in characters so the decoded blob can be sliced directly
+        out += _packed("I", map(len, run))
+        raw = "".join(run).encode("utf-8", "surrogatepass")
+        out += _U64.pack(len(raw))
+        out += raw
+    else:
+        for value in run:
+            if value is True:
+                out.append(_TRUE)
+            elif value is False:
+                out.append(_FALSE)
+            elif value is None:
+                out.append(_NONE)
+            elif isinstance(value, int):
+                raw = str(value).encode("ascii")
+                out.append(_BIGINT)
+                out += _U32.pack(len(raw))
+                out += raw
+            else:
+                raise ValueError(f"Cannot save value of type {type(value).__name__}")
+
+
+def _write_binary(file, sections):
+    file.write(MAGIC)
+    out = bytearray()
+    for name, count, values in sections:
+        raw = name.encode("utf-8")
+        out += _U8.pack(len(raw))
+        out += raw
+        out += _U64.pack(count)
+        run = []
+        kind = None
+        for value in values:
+            value_kind = _run_kind(value)
+            if value_kind != kind or len(run) == _RUN_LENGTH:
+                if run:
+                    _encode_run(kind, run, out)
+                    run = []
+                kind = value_kind
+                if len(out) >= _FLUSH_AT:
+                    file.write(out)
+                    out.clear()
+            run.append(value)
+        if run:
+            _encode_run(kind, run, out)
+    file.write(out)
+
+
+def _write_jsonl(file, sections):
+    file.write(json.dumps(JSONL_HEADER) + "\n")
+    for name, count, values in sections:
+        file.write(json.dumps({"section": name, "count": count}) + "\n")
+        for value in values:
+            try:
+                line = json.dumps(value)
+            except TypeError:
+                raise ValueError(f"Cannot save value of type {type(value).__name__}") from None
+            file.write(line + "\n")
+
+
+def save_state(path, list_manager=None, stack_manager=None, queue_manager=None, binary=None):
+    """
+    Stream the managers' contents to path (queue_manager is a QueueManager
+    or DequeManager). binary defaults to True unless path ends with .jsonl.
+    The file is written beside path and moved over it only once complete,
+    so a failed save (e.g. an unsupported value) leaves the old file intact.
+    """
+    if binary is None:
+        binary = not str(path).endswith(".jsonl")
+    sections = _sections(list_manager, stack_manager, queue_manager)
+    handle, temp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)),
+                                    prefix=".save-", suffix=".tmp")
+    try:
+        if binary:
+            with open(handle, "wb") as file:
+                _write_binary(file, sections)
+        else:
+            with open(handle, "w", encoding="utf-8") as file:
+                _write_jsonl(file, sections)
+        if os.path.exists(path):
+            shutil.copymode(path, temp)
+        os.replace(temp, path)
+    except BaseException:
+        try:
+            os.unlink(temp)
+        except OSError:
+            pass
+        raise
+
+
+class _BinaryReader:
+    """Walks a mapped binary file; pos is shared by the section value generators"""
+    def __init__(self, data):
+        self.data = data
+        self.pos = len(MAGIC)
+
+    def sections(self):
+        """Yield (name, values) per section, skipping whatever the caller leaves unread"""
+        data = self.data
+        while self.pos < len(data):
+            pos = self.pos
+            length = data[pos]
+            name = str(data[pos + 1:pos + 1 + length], "utf-8")
+            pos += 1 + length
+            count, = _U64.unpack_from(data, pos)
+            self.pos = pos + 8
+            values = self._values(count)
+            yield name, values
+            deque(values, maxlen=0)
+
+    def _values(self, count):
+        data = self.data
+        pos = self.pos
+        remaining = count
+        while remaining:
+            kind, length = _RUN.unpack_from(data, pos)
+            pos += _RUN.size
+            remaining -= length
+            if kind == _INT or kind == _FLOAT:
+                values = _unpacked("q" if kind == _INT else "d", data, pos, length)
+                pos += 8 * length
+                yield from values
+            elif kind == _STR:
+                ends = list(accumulate(_unpacked("I", data, pos, length)))
+                pos += 4 * length
+                size, = _U64.unpack_from(data, pos)
+                pos += 8
+                text = str(data[pos:pos + size], "utf-8", "surrogatepass")
+                pos += size
+                yield from map(text.__getitem__, map(slice, chain((0,), ends), ends))
+            elif kind == _OTHER:
+                for i in range(length):
+                    tag = data[pos]
+                    pos += 1
+                    if tag == _NONE:
+                        yield None
+                    elif tag == _TRUE:
+                        yield True
+                    elif tag == _FALSE:
+                        yield False
+                    elif tag == _BIGINT:
+                        size, = _U32.unpack_from(data, pos)
+                        pos += 4
+                        yield int(data[pos:pos + size])
+                        pos += size
+                    else:
+                        raise ValueError(f"Corrupt save file: unknown record tag {tag}")
+            else:
+                raise ValueError(f"Corrupt save file: unknown run kind {kind}")
+        self.pos = pos
+
+
+def _jsonl_sections(lines):
+    """Yield (name, values) per section of a JSONL save"""
+    for line in lines:
+        header = json.loads(line)
+        count = header["count"]
+        values = (json.loads(next(lines)) for i in range(count))
+        yield header["section"], values
+        deque(values, maxlen=0)
+
+
+@contextmanager
+def _collector_paused():
+    """
+    Keep the cyclic collector off while sections are built: every new node
+    would otherwise count towards collections that rescan the nodes already
+    built, which costs about as much as building them
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _apply(sections, list_manager, stack_manager, queue_manager):
+    """
+    Build every section's structure, then swap them all into the matching
+    managers and return one message per section. Nothing is swapped in if
+    any section fails to build.
+    """
+    staged = []
+    with _collector_paused():
+        for name, values in sections:
+            if name == "stack":
+                if stack_manager is not None:
+                    stack, index = stack_manager._build(values)
+                    staged.append((name, len(stack), stack_manager._swap_in, (stack, index)))
+            elif name == "queue":
+                if queue_manager is not None:
+                    linked = queue_manager._build(values)
+                    staged.append((name, linked.size, queue_manager._swap_in, (linked,)))
+            elif list_manager is not None and name in LIST_KINDS:
+                attr = f"{name}_list"
+                linked = list_manager._build(attr, values)
+                staged.append((name, linked.size, list_manager._replace, (attr, linked)))
+
+    managers = (list_manager, stack_manager, queue_manager)
+    journals = {id(m.journal): m.journal for m in managers if m is not None and m.journal is not None}
+    messages = []
+    with ExitStack() as batches:
+        for journal in journals.values():
+            batches.enter_context(journal.batch())
+        for name, count, swap_in, state in staged:
+            swap_in(*state)
+            messages.append(f"{name}: Loaded {count} values")
+    return messages
+
+
+def load_state(path, list_manager=None, stack_manager=None, queue_manager=None):
+    """
+    Replace the managers' contents with a file written by save_state.
+    The format is detected from the header; returns one message per section.
+    Raises ValueError (with no manager changed) if a section does not fit.
+    """
+    with open(path, "rb") as file:
+        head = file.read(len(MAGIC))
+        if head == MAGIC:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                return _apply(_BinaryReader(data).sections(), list_manager, stack_manager, queue_manager)
+
+    with open(path, encoding="utf-8") as file:
+        lines = iter(file)
+        header = json.loads(next(lines, "null"))
+        if header != JSONL_HEADER:
+            raise ValueError("Not a saved linked list state file")
+        return _apply(_jsonl_sections(lines), list_manager, stack_manager, queue_manager)
@@ -0,0 +1,198 @@
+"""Multi-threaded stress checks for the concurrent managers
+
+Run from the project directory (no GUI needed):
+    python -m models.stress
+Each check raises AssertionError when an invariant breaks.
+"""
+import asyncio
+import random
+import threading
+from collections import Counter
+from .linked_lists import LIST_KINDS
+from .journal import OperationJournal
+from .threadsafe import ConcurrentLinkedListManager, ConcurrentStackManager, AsyncStackManager
+
+
+TIMEOUT = 30
+
+
+def _run_threads(targets, watch):
+    """
+    Run each target in its own thread while another thread loops over watch(),
+    then re-raise the first error any of them hit.
+    """
+    errors = []
+    done = threading.Event()
+
+    def guarded(target):
+        def run():
+            try:
+                target()
+            except BaseException as e:
+                errors.append(e)
+        return run
+
+    def watching():
+        while not done.is_set() and not errors:
+            watch()
+
+    threads = [threading.Thread(target=guarded(target)) for target in targets]
+    watcher = threading.Thread(target=guarded(watching))
+    watcher.start()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    done.set()
+    watcher.join()
+    if errors:
+        raise errors[0]
+
+
+def _check_stack(stack):
+    """Capacity and index invariants; call with stack.changed held"""
+    values = stack.linked_list_stack
+    assert stack.capacity is None or len(values) <= stack.capacity, "stack over capacity"
+    if stack.index is not None:
+        slots = sorted(slot for positions in stack.index.values() for slot in positions)
+        assert slots == list(range(len(values))), "stack index out of sync"
+
+
+def stress_stack(producers=4, consumers=4, per_producer=5_000, capacity=16):
+    """Blocking producers and consumers: every pushed value is popped exactly once"""
+    stack = ConcurrentStackManager(capacity=capacity, indexed=True)
+    consumed = [Counter() for i in range(consumers)]
+    total = producers * per_producer
+
+    def produce(pid):
+        for i in range(per_producer):
+            stack.push_wait((pid, i), TIMEOUT)
+
+    def consume(cid):
+        for i in range(total // consumers + (cid < total % consumers)):
+            consumed[cid][stack.pop_wait(TIMEOUT)] += 1
+
+    def watch():
+        with stack.changed:
+            _check_stack(stack)
+
+    _run_threads([lambda p=p: produce(p) for p in range(producers)]
+                 + [lambda c=c: consume(c) for c in range(consumers)], watch)
+
+    received = sum(consumed, Counter())
+    assert received == Counter((p, i) for p in range(producers) for i in range(per_producer)), \
+        "values lost or duplicated"
+    assert stack.is_empty() and not stack.index
+    print(f"stack: {total:,} values through {producers} producers / {consumers} consumers ok")
+    return received
+
+
+def _check_lists(manager):
+    """Capacity, size and index invariants; call with every lock held"""
+    for kind in LIST_KINDS:
+        linked = getattr(manager, f"{kind}_list")
+        values = linked.to_list()
+        assert len(values) == linked.size, f"{kind}: size out of sync"
+        assert manager.capacity is None or linked.size <= manager.capacity, f"{kind}: over capacity"
+        if linked.index is not None:
+            assert sorted(map(repr, linked.index.entries)) == sorted(map(repr, set(values))), \
+                f"{kind}: index out of sync"
+
+
+def stress_lists(workers=8, ops=3_000, capacity=50, seed=0, journaled=False):
+    """
+    Racing inserts/deletes on every list kind never break capacity or sizes.
+    journaled shares one journal between all kinds and mixes in bulk ops,
+    undo and redo; afterwards undoing every step must empty every list and
+    redoing them all must rebuild the final state.
+    """
+    journal = OperationJournal(max_steps=None) if journaled else None
+    manager = ConcurrentLinkedListManager(capacity=capacity, indexed=True, journal=journal)
+    added = [Counter() for i in range(workers)]
+    removed = [Counter() for i in range(workers)]
+
+    def work(wid):
+        rng = random.Random(seed + wid)
+        for i in range(ops):
+            kind = rng.choice(LIST_KINDS)
+            size = getattr(manager, f"{kind}_list").size
+            position = rng.choice([None, rng.randrange(size + 1)])
+            try:
+                if journaled and rng.random() < 0.1:
+                    action = rng.choice(("extend", "delete_range", "undo", "redo"))
+                    if action == "extend":
+                        getattr(manager, f"{kind}_extend")([f"{wid}:{i}:{j}" for j in range(3)])
+                    elif action == "delete_range":
+                        getattr(manager, f"{kind}_delete_range")(0, min(size, 3))
+                    else:
+                        getattr(manager, action)()
+                elif rng.random() < 0.55:
+                    getattr(manager, f"{kind}_insert")(f"{wid}:{i}", position)
+                    added[wid][kind] += 1
+                else:
+                    getattr(manager, f"{kind}_delete")(position)
+                    removed[wid][kind] += 1
+            except ValueError:
+                pass  # full, empty, nothing to undo, or a position another worker made stale
+            if kind.endswith("doubly") and rng.random() < 0.05:
+                getattr(manager, f"{kind}_reverse")()
+
+    def watch():
+        with manager.all_locks():
+            _check_lists(manager)
+
+    _run_threads([lambda w=w: work(w) for w in range(workers)], watch)
+    watch()
+    if journaled:
+        final = {kind: getattr(manager, f"{kind}_list").to_list() for kind in LIST_KINDS}
+        while journal.can_undo():
+            manager.undo()
+        manager.validate()
+        for kind in LIST_KINDS:
+            assert not getattr(manager, f"{kind}_list").size, f"{kind}: undo did not restore the empty list"
+        while journal.can_redo():
+            manager.redo()
+        manager.validate()
+        for kind in LIST_KINDS:
+            assert getattr(manager, f"{kind}_list").to_list() == final[kind], f"{kind}: redo lost updates"
+        print(f"lists (journaled): {workers} workers x {ops:,} ops, full undo/redo ok")
+        return final
+    net = sum(added, Counter())
+    net.subtract(sum(removed, Counter()))
+    for kind in LIST_KINDS:
+        assert getattr(manager, f"{kind}_list").size == net[kind], f"{kind}: lost updates"
+    print(f"lists: {workers} workers x {ops:,} ops ok")
+    return net
+
+
+def stress_async(producers=4, consumers=4, per_producer=5_000, capacity=16):
+    """Awaitable push/pop: every pushed value is popped exactly once"""
+    async def main():
+        stack = AsyncStackManager(ConcurrentStackManager(capacity=capacity))
+
+        async def produce(pid):
+            for i in range(per_producer):
+                await stack.push((pid, i))
+
+        async def consume(count):
+            return [await stack.pop() for i in range(count)]
+
+        total = producers * per_producer
+        tasks = [produce(p) for p in range(producers)]
+        tasks += [consume(total // consumers + (c < total % consumers)) for c in range(consumers)]
+        results = await asyncio.gather(*tasks)
+        received = Counter(value for chunk in results[producers:] for value in chunk)
+        assert received == Counter((p, i) for p in range(producers) for i in range(per_producer))
+        assert stack.stack_manager.is_empty()
+        return received
+
+    received = asyncio.run(main())
+    print(f"async stack: {sum(received.values()):,} values ok")
+    return received
+
+
+if __name__ == "__main__":
+    stress_stack()
+    stress_lists()
+    stress_lists(journaled=True)
+    stress_async()
@@ -0,0 +1,151 @@
+"""
+Thread-safe and asyncio variants of the managers.
+
+ConcurrentLinkedListManager holds one re-entrant lock per list kind, so
+producers feeding different lists never contend and the capacity check and
+insert of one call happen under the same lock. ConcurrentStackManager guards
+the stack with a Condition so callers can also block until there is room or
+a value. AsyncStackManager gives awaitable push/pop for a single event loop.
+"""
+import asyncio
+import functools
+import threading
+from contextlib import ExitStack
+from .linked_lists import LinkedListManager, LIST_KINDS
+from .stack import StackManager
+
+
+def _kind_of(name):
+    """Return the list kind a LinkedListManager method works on, or None"""
+    if name.startswith("get_"):
+        name = name[len("get_"):]
+    for kind in sorted(LIST_KINDS, key=len, reverse=True):
+        if name.startswith(kind + "_"):
+            return kind
+    return None
+
+
+def _has_room(stack_manager):
+    return (stack_manager.capacity is None
+            or stack_manager.size() < stack_manager.capacity)
+
+
+def _locked(kind, method):
+    """Run a manager method while holding the lock of its list kind"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.locks[kind]:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+def _synchronized(method, notify=False):
+    """Run a stack method under the stack's condition, waking waiters if it mutates"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.changed:
+            result = method(self, *args, **kwargs)
+            if notify:
+                self.changed.notify_all()
+            return result
+    return wrapper
+
+
+class ConcurrentLinkedListManager(LinkedListManager):
+    """
+    LinkedListManager whose per-kind methods each run under that kind's lock.
+    Lazy iterators (*_iter*) are not locked; hold locks[kind] while consuming
+    them if other threads may write. undo/redo and validate take every lock in
+    a fixed order. A journal is shared by all kinds; its own lock (always taken
+    last) keeps records from racing batches, undo and redo.
+    """
+    def __init__(self, *args, **kwargs):
+        self.locks = {kind: threading.RLock() for kind in LIST_KINDS}
+        super().__init__(*args, **kwargs)
+
+    def all_locks(self):
+        """Context manager holding every list lock (always acquired in LIST_KINDS order)"""
+        stack = ExitStack()
+        for kind in LIST_KINDS:
+            stack.enter_context(self.locks[kind])
+        return stack
+
+    def undo(self):
+        with self.all_locks():
+            return super().undo()
+
+    def redo(self):
+        with self.all_locks():
+            return super().redo()
+
+    def validate(self):
+        with self.all_locks():
+            return super().validate()
+
+
+for _name, _method in list(vars(LinkedListManager).items()):
+    _kind = _kind_of(_name)
+    if _kind and callable(_method) and "_iter" not in _name:
+        setattr(ConcurrentLinkedListManager, _name, _locked(_kind, _method))
+
+
+class ConcurrentStackManager(StackManager):
+    """StackManager guarded by one Condition, with blocking push_wait/pop_wait"""
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.changed = threading.Condition(threading.RLock())
+
+    def get_stack(self):
+        """Get a snapshot of the stack as list"""
+        with self.changed:
+            return list(self.linked_list_stack)
+
+    def push_wait(self, value, timeout=None):
+        """Push value, waiting up to timeout seconds (forever if None) for room"""
+        with self.changed:
+            if not self.changed.wait_for(lambda: _has_room(self), timeout):
+                raise ValueError(f"Stack is full! Maximum {self.capacity} elements allowed.")
+            return self.push(value)
+
+    def pop_wait(self, timeout=None):
+        """Pop and return the top value, waiting up to timeout seconds for one"""
+        with self.changed:
+            if not self.changed.wait_for(lambda: self.linked_list_stack, timeout):
+                raise ValueError("Stack is empty!")
+            value = self.linked_list_stack[-1]
+            self.pop()
+            return value
+
+
+for _name in ("push", "pop", "delete_value", "clear", "from_iterable", "undo", "redo"):
+    setattr(ConcurrentStackManager, _name,
+            _synchronized(getattr(StackManager, _name), notify=True))
+for _name in ("peek", "is_empty", "search", "contains", "size"):
+    setattr(ConcurrentStackManager, _name, _synchronized(getattr(StackManager, _name)))
+
+
+class AsyncStackManager:
+    """
+    Awaitable push/pop over a StackManager, for use from one event loop.
+    Waiters are only woken by calls made through this wrapper.
+    """
+    def __init__(self, stack_manager=None):
+        self.stack_manager = stack_manager if stack_manager is not None else StackManager()
+        self.changed = asyncio.Condition()
+
+    async def push(self, value):
+        """Push value, waiting while the stack is full; returns the push message"""
+        async with self.changed:
+            await self.changed.wait_for(lambda: _has_room(self.stack_manager))
+            message = self.stack_manager.push(value)
+            self.changed.notify_all()
+            return message
+
+    async def pop(self):
+        """Pop and return the top value, waiting while the stack is empty"""
+        async with self.changed:
+            await self.changed.wait_for(lambda: not self.stack_manager.is_empty())
+            value = self.stack_manager.peek()
+            self.stack_manager.pop()
+            self.changed.notify_all()
+            return value
@@ -0,0 +1,460 @@
+"""
+Unrolled doubly linked list: each node holds a block of up to BLOCK_SIZE values.
+
+Traversal hops one pointer per block instead of one per value, and a block's
+values sit in one contiguous Python list, so iteration and bulk copies run at
+list speed and the per-value overhead is a single pointer. Blocks split when
+full and merge with a neighbour when less than half full.
+"""
+from collections import Counter
+from heapq import merge
+from itertools import chain, count, islice
+
+BLOCK_SIZE = 64
+# Shared by every list so a version never repeats across lists
+_versions = count()
+
+
+class Block:
+    """One unrolled node: a list of values plus prev/next block links"""
+    __slots__ = ('values', 'next', 'prev')
+
+    def __init__(self, values):
+        self.values = values
+        self.next = None
+        self.prev = None
+
+
+class UnrolledLinkedList:
+    def __init__(self, indexed=False, block_size=BLOCK_SIZE):
+        """
+        indexed keeps value counts so membership tests are O(1).
+        head/tail are the physical end blocks; while reversed is set, positions
+        count from the tail and traversal reads blocks backwards (see reverse).
+        Handles from find() are (position, version) pairs: every mutation
+        takes a new version, so remove_node rejects a handle once the list
+        has changed since find (or for another list).
+        """
+        if block_size < 2:
+            raise ValueError("Block size must be at least 2")
+        self.block_size = block_size
+        self.head = None
+        self.tail = None
+        self.size = 0
+        self.reversed = False
+        self.index = Counter() if indexed else None
+        self.version = next(_versions)
+
+    def __len__(self):
+        return self.size
+
+    def _blocks(self, forward=True):
+        """Yield blocks along the physical next (forward) or prev links"""
+        block = self.head if forward else self.tail
+        while block:
+            yield block
+            block = block.next if forward else block.prev
+
+    def _values(self, forward):
+        if forward:
+            return chain.from_iterable(block.values for block in self._blocks())
+        return chain.from_iterable(reversed(block.values) for block in self._blocks(False))
+
+    def __iter__(self):
+        return self._values(not self.reversed)
+
+    def __reversed__(self):
+        return self._values(self.reversed)
+
+    def __contains__(self, value):
+        return self.contains(value)
+
+    def _physical(self, position):
+        """Map a logical value position to its physical position"""
+        return self.size - 1 - position if self.reversed else position
+
+    def _locate(self, index):
+        """
+        Return (block, offset) for physical index (0 <= index <= size),
+        walking blocks from the nearer end; index == size gives the tail's end.
+        """
+        if index <= self.size // 2:
+            block = self.head
+            while index > len(block.values) or (index == len(block.values) and block.next):
+                index -= len(block.values)
+                block = block.next
+            return block, index
+        block = self.tail
+        remaining = self.size - index
+        while remaining > len(block.values):
+            remaining -= len(block.values)
+            block = block.prev
+        return block, len(block.values) - remaining
+
+    def _link_after(self, block, new):
+        """Link new right after block (at the front if block is None)"""
+        new.prev = block
+        new.next = block.next if block else self.head
+        if new.next:
+            new.next.prev = new
+        else:
+            self.tail = new
+        if block:
+            block.next = new
+        else:
+            self.head = new
+
+    def _unlink(self, block):
+        if block.prev:
+            block.prev.next = block.next
+        else:
+            self.head = block.next
+        if block.next:
+            block.next.prev = block.prev
+        else:
+            self.tail = block.prev
+
+    def _rebalance(self, block):
+        """
+        Fix an underfull block: drop it if empty, else merge it with a
+        neighbour when both fit in one block, or split their values evenly.
+        """
+        if not block.values:
+            self._unlink(block)
+            return
+        after = block.next
+        if after is None:
+            block, after = block.prev, block
+            if block is None:
+                return
+        total = len(block.values) + len(after.values)
+        if total <= self.block_size:
+            block.values.extend(after.values)
+            self._unlink(after)
+        else:
+            values = block.values + after.values
+            block.values = values[:total // 2]
+            after.values = values[total // 2:]
+
+    def _add(self, value):
+        if self.index is not None:
+            self.index[value] += 1
+
+    def _drop(self, value):
+        if self.index is not None:
+            self.index[value] -= 1
+            if not self.index[value]:
+                del self.index[value]
+
+    def _changed(self):
+        """Take a new version, invalidating every outstanding handle"""
+        self.version = next(_versions)
+
+    def _insert_at(self, index, value):
+        """
+        Insert value at physical index. A full block gets a fresh neighbour
+        when the value lands on its edge (so appends keep blocks full), and
+        is split in half otherwise.
+        """
+        self._changed()
+        if not self.head:
+            self._link_after(None, Block([value]))
+        else:
+            block, offset = self._locate(index)
+            if len(block.values) < self.block_size:
+                block.values.insert(offset, value)
+            elif offset == len(block.values):
+                self._link_after(block, Block([value]))
+            elif offset == 0:
+                self._link_after(block.prev, Block([value]))
+            else:
+                half = len(block.values) // 2
+                self._link_after(block, Block(block.values[half:]))
+                del block.values[half:]
+                if offset > half:
+                    block, offset = block.next, offset - half
+                block.values.insert(offset, value)
+        self.size += 1
+        self._add(value)
+
+    def _delete_at(self, index):
+        """Remove and return the value at physical index"""
+        self._changed()
+        block, offset = self._locate(index)
+        value = block.values.pop(offset)
+        self.size -= 1
+        self._drop(value)
+        if len(block.values) < self.block_size // 2:
+            self._rebalance(block)
+        return value
+
+    def reverse(self):
+        """Reverse the list in O(1) by flipping which way the blocks are read"""
+        self.reversed = not self.reversed
+        self._changed()
+
+    def append(self, value):
+        """Insert at the end in O(1) amortized"""
+        self._insert_at(0 if self.reversed else self.size, value)
+
+    def appendleft(self, value):
+        """Insert at the front in O(1) amortized"""
+        self._insert_at(self.size if self.reversed else 0, value)
+
+    def insert(self, value, position=None):
+        """Insert value at position (end if None)"""
+        if position is None or position == self.size:
+            return self.append(value)
+        if position < 0 or position > self.size:
+            raise ValueError("Position out of range")
+        self._insert_at(self.size - position if self.reversed else position, value)
+
+    def pop(self):
+        """Remove and return the last value"""
+        if not self.size:
+            raise ValueError("List is empty!")
+        return self._delete_at(self._physical(self.size - 1))
+
+    def popleft(self):
+        """Remove and return the first value"""
+        if not self.size:
+            raise ValueError("List is empty!")
+        return self._delete_at(self._physical(0))
+
+    def delete(self, position=None):
+        """Remove the value at position (end if None) and return it"""
+        if not self.size:
+            raise ValueError("List is empty!")
+        if position is None:
+            return self.pop()
+        if position < 0 or position >= self.size:
+            raise ValueError("Position out of range")
+        return self._delete_at(self._physical(position))
+
+    # Bulk operations
+    @classmethod
+    def from_iterable(cls, values, max_count=None, **options):
+        """Build a new list from values in one pass"""
+        linked = cls(**options)
+        linked.extend(values, max_count)
+        return linked
+
+    def extend(self, values, max_count=None):
+        """Append every value in one splice and return how many were added"""
+        return self.insert_many(None, values, max_count)
+
+    def insert_many(self, position, values, max_count=None):
+        """Splice values in as full blocks starting at position (end if None); return the count"""
+        if position is None:
+            position = self.size
+        if position < 0 or position > self.size:
+            raise ValueError("Position out of range")
+
+        values = iter(values)
+        chunks = []
+        count = 0
+        while True:
+            chunk = list(islice(values, self.block_size))
+            if not chunk:
+                break
+            count += len(chunk)
+            if max_count is not None and count > max_count:
+                raise ValueError(f"List is full! Only {max_count} more nodes fit.")
+            chunks.append(chunk)
+        if not count:
+            return 0
+        self._changed()
+        if self.reversed:
+            position = self.size - position
+            chunks = [chunk[::-1] for chunk in reversed(chunks)]
+
+        # Split the block at position so the new blocks slot in between
+        before = None
+        if self.head:
+            block, offset = self._locate(position)
+            if offset == 0:
+                before = block.prev
+            else:
+                before = block
+                if offset < len(block.values):
+                    self._link_after(block, Block(block.values[offset:]))
+                    del block.values[offset:]
+        first = before
+        for chunk in chunks:
+            new = Block(chunk)
+            self._link_after(before, new)
+            before = new
+            if self.index is not None:
+                self.index.update(chunk)
+        self.size += count
+        # Only the blocks at the two seams can be underfull
+        minimum = self.block_size // 2
+        if before.next and min(len(before.values), len(before.next.values)) < minimum:
+            self._rebalance(before)
+        if first and min(len(first.values), len(first.next.values)) < minimum:
+            self._rebalance(first)
+        return count
+
+    def delete_range(self, start, stop):
+        """Remove positions start..stop-1 block by block and return how many were removed"""
+        return len(self.pop_range(start, stop))
+
+    def pop_range(self, start, stop):
+        """Remove positions start..stop-1 block by block and return their values"""
+        if start < 0 or stop > self.size or start > stop:
+            raise ValueError(f"Range must satisfy 0 <= start <= stop <= {self.size}")
+        count = stop - start
+        if not count:
+            return []
+        self._changed()
+        if self.reversed:
+            start = self.size - stop
+
+        block, offset = self._locate(start)
+        values = []
+        survivors = []
+        remaining = count
+        while remaining:
+            if offset == len(block.values):
+                block, offset = block.next, 0
+            taken = block.values[offset:offset + remaining]
+            del block.values[offset:offset + len(taken)]
+            values.extend(taken)
+            remaining -= len(taken)
+            after = block.next
+            if block.values:
+                survivors.append(block)
+            else:
+                self._unlink(block)
+            block, offset = after, 0
+        self.size -= count
+        if self.index is not None:
+            for value in values:
+                self._drop(value)
+        # At most the first and last touched blocks survive, and they are adjacent
+        if any(len(survivor.values) < self.block_size // 2 for survivor in survivors):
+            self._rebalance(survivors[0])
+        if self.reversed:
+            values.reverse()
+        return values
+
+    # Sorting
+    def sort(self, key=None, reverse=False):
+        """
+        Stable sort: the values are sorted in one array and written back into
+        the existing blocks, which keep their sizes and links
+        """
+        values = sorted(self, key=key, reverse=reverse)
+        self._changed()
+        if self.reversed:
+            values.reverse()
+        position = 0
+        for block in self._blocks():
+            count = len(block.values)
+            block.values[:] = values[position:position + count]
+            position += count
+
+    def merge_sorted(self, other, key=None, reverse=False):
+        """
+        Merge the sorted values of other into this sorted list in one pass,
+        keeping it sorted (ties keep this list's values first); return how many
+        were added. other is only read.
+        """
+        if other is self:
+            raise ValueError("Cannot merge a list into itself")
+        incoming = list(other)
+        values = list(merge(self, incoming, key=key, reverse=reverse))
+        self.clear()
+        self.extend(values)
+        return len(incoming)
+
+    # Search
+    def contains(self, value):
+        """Membership test; O(1) on average when indexed"""
+        if self.index is not None:
+            return value in self.index
+        return any(value in block.values for block in self._blocks())
+
+    def search(self, value):
+        """Return the position of the first value equal to value (from head), or -1"""
+        if self.index is not None and value not in self.index:
+            return -1
+        for i, data in enumerate(self):
+            if data == value:
+                return i
+        return -1
+
+    def find(self, value):
+        """Return a (position, version) handle for the first match, or None"""
+        position = self.search(value)
+        return None if position == -1 else (position, self.version)
+
+    def remove_node(self, handle):
+        """Remove the value at a handle returned by find and return it; ValueError if the list changed since"""
+        return self.delete(self.index_of(handle))
+
+    def index_of(self, handle):
+        """Return the position of a handle, or raise ValueError if the list changed since find"""
+        position, version = handle
+        if version != self.version:
+            raise ValueError("Node is not in this list")
+        return position
+
+    def delete_value(self, value):
+        """Remove the first value equal to value and return True, or False if absent"""
+        position = self.search(value)
+        if position == -1:
+            return False
+        self.delete(position)
+        return True
+
+    def traverse_forward(self):
+        """Return (index, value) pairs from head to tail"""
+        return list(enumerate(self))
+
+    def traverse_reverse(self):
+        """Return (index, value) pairs from tail to head"""
+        return list(enumerate(reversed(self)))
+
+    def to_list(self):
+        """Return the values from head to tail as a Python list"""
+        return list(self)
+
+    def peek(self):
+        """Peek at the first element"""
+        if not self.size:
+            return None
+        return self.tail.values[-1] if self.reversed else self.head.values[0]
+
+    def clear(self):
+        """Remove all blocks"""
+        self._changed()
+        self.head = None
+        self.tail = None
+        self.size = 0
+        self.reversed = False
+        if self.index is not None:
+            self.index.clear()
+
+    def validate(self):
+        """Check block links, block fill and cached size in O(n); raise ValueError if broken"""
+        count = 0
+        previous = None
+        block = self.head
+        while block:
+            if count > self.size:
+                raise ValueError(f"Invalid list: more than {self.size} values or a cycle")
+            if block.prev is not previous:
+                raise ValueError("Invalid list: prev link of a block is wrong")
+            if not 0 < len(block.values) <= self.block_size:
+                raise ValueError(f"Invalid list: block holds {len(block.values)} values")
+            count += len(block.values)
+            previous = block
+            block = block.next
+        if count != self.size:
+            raise ValueError(f"Invalid list: {count} values but size is {self.size}")
+        if self.tail is not previous:
+            raise ValueError("Invalid list: tail is not the last block")
+        if self.index is not None and self.index != Counter(self):
+            raise ValueError("Invalid list: value counts out of sync")
+        return True
@@ -0,0 +1,86 @@
+"""Hash index from values to the nodes holding them"""
+
+class ValueIndex:
+    """
+    Maps each value to the nodes (or pool slots) that currently hold it.
+    Handles for a value are kept in an insertion-ordered dict so that
+    adding and discarding one handle are both O(1). Lists that number their
+    nodes keep each handle's number as its dict value (None otherwise).
+    """
+    def __init__(self):
+        self.entries = {}
+
+    def __contains__(self, value):
+        return value in self.entries
+
+    def __len__(self):
+        return len(self.entries)
+
+    def add(self, value, handle, position=None):
+        """Record that handle holds value (at position, for lists that number their nodes)"""
+        handles = self.entries.get(value)
+        if handles is None:
+            self.entries[value] = {handle: position}
+        else:
+            handles[handle] = position
+
+    def place(self, value, handle, position):
+        """Renumber a handle already recorded for value"""
+        self.entries[value][handle] = position
+
+    def lowest(self, value):
+        """Return (position, handle) with the lowest position recorded for value, or None"""
+        handles = self.entries.get(value)
+        if not handles:
+            return None
+        handle = min(handles, key=handles.__getitem__)
+        return handles[handle], handle
+
+    def highest(self, value):
+        """Return (position, handle) with the highest position recorded for value, or None"""
+        handles = self.entries.get(value)
+        if not handles:
+            return None
+        handle = max(handles, key=handles.__getitem__)
+        return handles[handle], handle
+
+    def discard(self, value, handle):
+        """Forget that handle holds value"""
+        handles = self.entries[value]
+        del handles[handle]
+        if not handles:
+            del self.entries[value]
+
+    def handles(self, value):
+        """Return the handles holding value, oldest first"""
+        return list(self.entries.get(value, ()))
+
+    def first(self, value):
+        """Return the oldest handle holding value, or None"""
+        handles = self.entries.get(value)
+        if not handles:
+            return None
+        return next(iter(handles))
+
+    def count(self, value):
+        """Return how many handles hold value"""
+        return len(self.entries.get(value, ()))
+
+    def clear(self):
+        """Drop every entry"""
+        self.entries.clear()
+
+    def validate(self, pairs):
+        """Raise ValueError unless the index holds exactly the (value, handle) pairs given"""
+        expected = {}
+        for value, handle in pairs:
+            expected.setdefault(value, set()).add(handle)
+        actual = {value: set(handles) for value, handles in self.entries.items()}
+        if actual != expected:
+            raise ValueError("Invalid list: value index out of sync")
+
+    def check_numbers(self, handles, base):
+        """Raise ValueError unless the handles, in list order, are numbered base, base + 1, ..."""
+        for position, (value, handle) in enumerate(handles, base):
+            if self.entries[value][handle] != position:
+                raise ValueError(f"Invalid list: node {position - base} is misnumbered")
@@ -101,6 +101,8 @@ class LinkedListPanel:
             self.create_circular_singly_operations()
         elif list_type == "Circular Doubly":
             self.create_circular_doubly_operations()
+        elif list_type == "Skip List":
+            self.create_skip_operations()
     
     def create_singly_operations(self):
         """Create operations for singly linked list"""
@@ -116,6 +118,9 @@ class LinkedListPanel:
         
         self.create_button(self.operations_frame, "Traverse", self.colors['blue'], 
                           self.singly_traverse, width=26).pack(pady=3)
+        self.create_button(self.operations_frame, "Reverse List", self.colors['sapphire'], 
+                          self.singly_reverse, width=26).pack(pady=3)
+        self.create_sort_buttons('singly')
         self.create_button(self.operations_frame, "Clear List", self.colors['maroon'], 
                           self.singly_clear, width=26).pack(pady=3)
     
@@ -138,6 +143,9 @@ class LinkedListPanel:
         self.create_button(btn_frame2, "Reverse", self.colors['sapphire'], 
                           self.doubly_traverse_reverse).pack(side=tk.LEFT, padx=3)
         
+        self.create_button(self.operations_frame, "Reverse List", self.colors['teal'], 
+                          self.doubly_reverse, width=26).pack(pady=3)
+        self.create_sort_buttons('doubly')
         self.create_button(self.operations_frame, "Clear List", self.colors['maroon'], 
                           self.doubly_clear, width=26).pack(pady=3)
     
@@ -155,6 +163,9 @@ class LinkedListPanel:
         
         self.create_button(self.operations_frame, "Traverse (2 cycles)", self.colors['yellow'], 
                           self.circular_singly_traverse, width=26).pack(pady=3)
+        self.create_button(self.operations_frame, "Rotate (position = steps)", self.colors['sapphire'], 
+                          self.circular_singly_rotate, width=26).pack(pady=3)
+        self.create_sort_buttons('circular_singly')
         self.create_button(self.operations_frame, "Clear List", self.colors['maroon'], 
                           self.circular_singly_clear, width=26).pack(pady=3)
     
@@ -177,9 +188,65 @@ class LinkedListPanel:
         self.create_button(btn_frame2, "Reverse", self.colors['sapphire'], 
                           self.circular_doubly_traverse_reverse).pack(side=tk.LEFT, padx=3)
         
+        self.create_button(self.operations_frame, "Reverse List", self.colors['teal'], 
+                          self.circular_doubly_reverse, width=26).pack(pady=3)
+        self.create_sort_buttons('circular_doubly')
         self.create_button(self.operations_frame, "Clear List", self.colors['maroon'], 
                           self.circular_doubly_clear, width=26).pack(pady=3)
     
+    def create_skip_operations(self):
+        """Create operations for the indexable skip list"""
+        tk.Label(self.operations_frame, text="Skip List Operations (O(log n) by position):", 
+                bg=self.colors['mantle'], fg=self.colors['subtext'], 
+                font=("Segoe UI", 9, "italic")).pack(pady=(0, 5))
+        
+        btn_frame1 = tk.Frame(self.operations_frame, bg=self.colors['mantle'])
+        btn_frame1.pack(pady=3)
+        self.create_button(btn_frame1, "Insert", self.colors['green'], 
+                          self.skip_insert).pack(side=tk.LEFT, padx=3)
+        self.create_button(btn_frame1, "Delete", self.colors['red'], 
+                          self.skip_delete).pack(side=tk.LEFT, padx=3)
+        
+        btn_frame2 = tk.Frame(self.operations_frame, bg=self.colors['mantle'])
+        btn_frame2.pack(pady=3)
+        self.create_button(btn_frame2, "Get", self.colors['lavender'], 
+                          self.skip_get).pack(side=tk.LEFT, padx=3)
+        self.create_button(btn_frame2, "Traverse", self.colors['blue'], 
+                          self.skip_traverse).pack(side=tk.LEFT, padx=3)
+        
+        self.create_sort_buttons('skip')
+        self.create_button(self.operations_frame, "Clear List", self.colors['maroon'], 
+                          self.skip_clear, width=26).pack(pady=3)
+    
+    def create_sort_buttons(self, kind):
+        """Sort and Keep Sorted buttons for the list kind (e.g. 'singly')"""
+        frame = tk.Frame(self.operations_frame, bg=self.colors['mantle'])
+        frame.pack(pady=3)
+        self.create_button(frame, "Sort", self.colors['peach'], 
+                          lambda: self.sort_list(kind)).pack(side=tk.LEFT, padx=3)
+        ordered = f"{kind}_list" in self.main_window.list_manager.ordered
+        self.create_button(frame, "Stop Sorting" if ordered else "Keep Sorted", self.colors['flamingo'], 
+                          lambda: self.toggle_ordered(kind)).pack(side=tk.LEFT, padx=3)
+    
+    # Sorting (shared by every list kind)
+    def sort_list(self, kind):
+        try:
+            msg = getattr(self.main_window.list_manager, f"{kind}_sort")()
+            self.main_window.log(f"✅ {msg}")
+            self.main_window.refresh_visualization()
+        except ValueError as e:
+            messagebox.showwarning("Error", str(e))
+    
+    def toggle_ordered(self, kind):
+        manager = self.main_window.list_manager
+        try:
+            msg = getattr(manager, f"{kind}_set_ordered")(f"{kind}_list" not in manager.ordered)
+            self.main_window.log(f"✅ {msg}")
+            self.update_operations_ui()
+            self.main_window.refresh_visualization()
+        except ValueError as e:
+            messagebox.showwarning("Error", str(e))
+    
     # Singly Linked List Operations
     def singly_insert(self):
         value = self.node_entry.get()
@@ -232,6 +299,11 @@ class LinkedListPanel:
         for i, value in result:
             self.main_window.log(f"  • Node {i}: {value}")
     
+    def singly_reverse(self):
+        msg = self.main_window.list_manager.singly_reverse()
+        self.main_window.log(f"✅ {msg}")
+        self.main_window.refresh_visualization()
+    
     def singly_clear(self):
         self.main_window.list_manager.singly_clear()
         self.main_window.log("✅ Singly linked list cleared!")
@@ -303,6 +375,11 @@ class LinkedListPanel:
         self.main_window.visualization.set_reverse_mode(True)
         self.main_window.refresh_visualization()
     
+    def doubly_reverse(self):
+        msg = self.main_window.list_manager.doubly_reverse()
+        self.main_window.log(f"✅ {msg}")
+        self.main_window.refresh_visualization()
+    
     def doubly_clear(self):
         self.main_window.list_manager.doubly_clear()
         self.main_window.log("✅ Doubly linked list cleared!")
@@ -353,13 +430,32 @@ class LinkedListPanel:
             messagebox.showinfo("Info", str(e))
     
     def circular_singly_traverse(self):
-        result = self.main_window.list_manager.circular_singly_traverse()
-        if not result:
-            self.main_window.log("⚠ List is empty!")
-            return
-        self.main_window.log("🔄 Circular Singly Linked List (2 complete cycles):")
-        for i, value, idx in result:
+        is_empty = True
+        for i, value, idx in self.main_window.list_manager.circular_singly_iter():
+            if is_empty:
+                self.main_window.log("🔄 Circular Singly Linked List (2 complete cycles):")
+                is_empty = False
             self.main_window.log(f"  • Node {i}: {value} (index {idx})")
+        if is_empty:
+            self.main_window.log("⚠ List is empty!")
+    
+    def circular_singly_rotate(self):
+        pos_str = self.position_entry.get()
+        steps = 1
+        if pos_str:
+            try:
+                steps = int(pos_str)
+            except ValueError:
+                messagebox.showwarning("Invalid Input", "Position must be a number")
+                return
+        
+        try:
+            msg = self.main_window.list_manager.circular_singly_rotate(steps)
+            self.main_window.log(f"✅ {msg}")
+            self.position_entry.delete(0, tk.END)
+            self.main_window.refresh_visualization()
+        except ValueError as e:
+            messagebox.showinfo("Info", str(e))
     
     def circular_singly_clear(self):
         self.main_window.list_manager.circular_singly_clear()
@@ -410,24 +506,102 @@ class LinkedListPanel:
             messagebox.showinfo("Info", str(e))
     
     def circular_doubly_traverse_forward(self):
-        result = self.main_window.list_manager.circular_doubly_traverse_forward()
-        if not result:
-            self.main_window.log("⚠ List is empty!")
-            return
-        self.main_window.log("🔄 Circular Doubly Linked List (Forward, 2 cycles):")
-        for i, value in result:
+        is_empty = True
+        for i, value in self.main_window.list_manager.circular_doubly_iter_forward():
+            if is_empty:
+                self.main_window.log("🔄 Circular Doubly Linked List (Forward, 2 cycles):")
+                is_empty = False
             self.main_window.log(f"  • Node {i}: {value}")
+        if is_empty:
+            self.main_window.log("⚠ List is empty!")
     
     def circular_doubly_traverse_reverse(self):
-        result = self.main_window.list_manager.circular_doubly_traverse_reverse()
+        is_empty = True
+        for i, value in self.main_window.list_manager.circular_doubly_iter_reverse():
+            if is_empty:
+                self.main_window.log("🔄 Circular Doubly Linked List (Reverse, 2 cycles):")
+                is_empty = False
+            self.main_window.log(f"  • Node {i}: {value}")
+        if is_empty:
+            self.main_window.log("⚠ List is empty!")
+    
+    def circular_doubly_reverse(self):
+        msg = self.main_window.list_manager.circular_doubly_reverse()
+        self.main_window.log(f"✅ {msg}")
+        self.main_window.refresh_visualization()
+    
+    def circular_doubly_clear(self):
+        self.main_window.list_manager.circular_doubly_clear()
+        self.main_window.log("✅ Circular doubly linked list cleared!")
+        self.main_window.refresh_visualization()
+    
+    # Skip List Operations
+    def skip_insert(self):
+        value = self.node_entry.get()
+        if not value:
+            messagebox.showwarning("Input Error", "Please enter a node value")
+            return
+        
+        pos_str = self.position_entry.get()
+        position = None
+        if pos_str:
+            try:
+                position = int(pos_str)
+            except ValueError:
+                messagebox.showwarning("Invalid Input", "Position must be a number")
+                return
+        
+        try:
+            msg = self.main_window.list_manager.skip_insert(value, position)
+            self.main_window.log(f"✅ {msg}")
+            self.node_entry.delete(0, tk.END)
+            self.position_entry.delete(0, tk.END)
+            self.main_window.refresh_visualization()
+        except ValueError as e:
+            messagebox.showwarning("Error", str(e))
+    
+    def skip_delete(self):
+        pos_str = self.position_entry.get()
+        position = None
+        if pos_str:
+            try:
+                position = int(pos_str)
+            except ValueError:
+                messagebox.showwarning("Invalid Input", "Position must be a number")
+                return
+        
+        try:
+            msg = self.main_window.list_manager.skip_delete(position)
+            self.main_window.log(f"✅ {msg}")
+            self.position_entry.delete(0, tk.END)
+            self.main_window.refresh_visualization()
+        except ValueError as e:
+            messagebox.showinfo("Info", str(e))
+    
+    def skip_get(self):
+        pos_str = self.position_entry.get()
+        try:
+            position = int(pos_str)
+        except ValueError:
+            messagebox.showwarning("Invalid Input", "Position must be a number")
+            return
+        
+        try:
+            value = self.main_window.list_manager.skip_get(position)
+            self.main_window.log(f"👁️ Skip list position {position}: {value}")
+        except ValueError as e:
+            messagebox.showinfo("Info", str(e))
+    
+    def skip_traverse(self):
+        result = self.main_window.list_manager.skip_traverse()
         if not result:
             self.main_window.log("⚠ List is empty!")
             return
-        self.main_window.log("🔄 Circular Doubly Linked List (Reverse, 2 cycles):")
+        self.main_window.log("→ Skip List Traverse:")
         for i, value in result:
             self.main_window.log(f"  • Node {i}: {value}")
     
-    def circular_doubly_clear(self):
-        self.main_window.list_manager.circular_doubly_clear()
-        self.main_window.log("✅ Circular doubly linked list cleared!")
-        self.main_window.refresh_visualization()
\ No newline at end of file
+    def skip_clear(self):
+        self.main_window.list_manager.skip_clear()
+        self.main_window.log("✅ Skip list cleared!")
+        self.main_window.refresh_visualization()
@@ -1,15 +1,18 @@
 """Main window controller"""
 import tkinter as tk
-from tkinter import scrolledtext
+from tkinter import scrolledtext, filedialog, messagebox
 from config import COLORS, WINDOW_TITLE, WINDOW_GEOMETRY
-from models import LinkedListManager, StackManager
+from models import (LinkedListManager, StackManager, DequeManager, Instrumentation,
+                    save_state, load_state)
 from utils import RPSGame
 from .linked_list_panel import LinkedListPanel
 from .stack_panel import StackPanel
+from .queue_panel import QueuePanel
 from .rps_panel import RPSPanel
 from .visualization import VisualizationCanvas
 from .exit_splash import ExitSplashScreen
 
+SESSION_FILETYPES = [("Binary session", "*.llst"), ("JSON lines", "*.jsonl"), ("All files", "*.*")]
 
 class MainWindow:
     def __init__(self, root):
@@ -25,9 +28,28 @@ class MainWindow:
         # Initialize managers
         self.list_manager = LinkedListManager()
         self.stack_manager = StackManager()
+        self.queue_manager = DequeManager()
         self.rps_game = RPSGame()
         self.current_list_type = "Singly"
         
+        # File menu for saving/loading the session
+        menubar = tk.Menu(root)
+        file_menu = tk.Menu(menubar, tearoff=0)
+        file_menu.add_command(label="Save Session...", command=self.save_session)
+        file_menu.add_command(label="Load Session...", command=self.load_session)
+        menubar.add_cascade(label="File", menu=file_menu)
+
+        # Stats menu: opt-in per-operation counters and timings
+        self.instrumentation = None
+        self.recording_stats = tk.BooleanVar(value=False)
+        stats_menu = tk.Menu(menubar, tearoff=0)
+        stats_menu.add_checkbutton(label="Record Operation Stats", variable=self.recording_stats,
+                                   command=self.toggle_stats)
+        stats_menu.add_command(label="Show Stats in Log", command=self.log_stats)
+        stats_menu.add_command(label="Reset Stats", command=self.reset_stats)
+        menubar.add_cascade(label="Stats", menu=stats_menu)
+        root.config(menu=menubar)
+        
         # Main container
         main_container = tk.Frame(root, bg=COLORS['base'])
         main_container.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
@@ -60,6 +82,7 @@ class MainWindow:
         # Now create panels INSIDE self.left_content_frame (not left_container!)
         self.linked_list_panel = LinkedListPanel(self.left_content_frame, self)
         self.stack_panel = StackPanel(self.left_content_frame, self)
+        self.queue_panel = QueuePanel(self.left_content_frame, self)
         self.rps_panel = RPSPanel(self.left_content_frame, self)
 
         # ===== RIGHT SIDE - Visualization and Output =====
@@ -113,6 +136,60 @@ class MainWindow:
         self.output_text.insert(tk.END, message + "\n")
         self.output_text.see(tk.END)
 
+    def save_session(self):
+        path = filedialog.asksaveasfilename(defaultextension=".llst", filetypes=SESSION_FILETYPES)
+        if not path:
+            return
+        try:
+            save_state(path, self.list_manager, self.stack_manager, self.queue_manager)
+        except (OSError, ValueError) as e:
+            messagebox.showwarning("Save Error", str(e))
+            return
+        self.log(f"💾 Session saved to {path}")
+
+    def load_session(self):
+        path = filedialog.askopenfilename(filetypes=SESSION_FILETYPES)
+        if not path:
+            return
+        try:
+            messages = load_state(path, self.list_manager, self.stack_manager, self.queue_manager)
+        except (OSError, ValueError) as e:
+            messagebox.showwarning("Load Error", str(e))
+            return
+        for message in messages:
+            self.log(f"✅ {message}")
+        self.refresh_visualization()
+
+    def _managers(self):
+        return (("", self.list_manager), ("stack.", self.stack_manager),
+                ("queue.", self.queue_manager))
+
+    def toggle_stats(self):
+        """Attach or detach the instrumentation on every manager"""
+        if self.recording_stats.get():
+            if self.instrumentation is None:
+                self.instrumentation = Instrumentation()
+            for prefix, manager in self._managers():
+                self.instrumentation.attach(manager, prefix)
+            self.log("📊 Recording operation stats")
+        elif self.instrumentation is not None:
+            self.instrumentation.detach_all()
+            self.log("📊 Stopped recording operation stats")
+
+    def log_stats(self):
+        """Dump the per-operation counts, latencies and nodes walked to the log"""
+        if self.instrumentation is None:
+            self.log("⚠ Stats are off (Stats → Record Operation Stats)")
+            return
+        self.log("📊 Operation stats (busiest first):")
+        for line in self.instrumentation.lines():
+            self.log(f"   {line}")
+
+    def reset_stats(self):
+        if self.instrumentation is not None:
+            self.instrumentation.reset()
+        self.log("📊 Stats reset")
+
     def refresh_visualization(self):
         self.visualization.draw()
         if not self.rps_game.is_active:
@@ -0,0 +1,113 @@
+"""Queue / deque control panel"""
+import tkinter as tk
+from tkinter import messagebox
+from config import COLORS
+
+class QueuePanel:
+    def __init__(self, parent, main_window):
+        self.main_window = main_window
+        self.colors = COLORS
+
+        # Create frame
+        queue_frame = tk.Frame(parent, bg=self.colors['mantle'], relief=tk.FLAT)
+        queue_frame.pack(side=tk.TOP, fill=tk.BOTH, expand=True, pady=(0, 10))
+
+        queue_inner = tk.Frame(queue_frame, bg=self.colors['mantle'])
+        queue_inner.pack(padx=15, pady=15, fill=tk.BOTH, expand=True)
+
+        self.create_widgets(queue_inner)
+
+    def create_widgets(self, parent):
+        """Create all widgets"""
+        tk.Label(parent, text="Queue / Deque (front ← → back)",
+                bg=self.colors['mantle'], fg=self.colors['mauve'],
+                font=("Segoe UI", 13, "bold")).pack(pady=(0, 10))
+
+        tk.Label(parent, text="Value to add:", bg=self.colors['mantle'],
+                fg=self.colors['text'], font=("Segoe UI", 10)).pack()
+
+        entry_frame = tk.Frame(parent, bg=self.colors['surface0'])
+        entry_frame.pack(pady=5)
+        self.value_entry = tk.Entry(entry_frame, width=28, bg=self.colors['surface0'],
+                                    fg=self.colors['text'], font=("Segoe UI", 10),
+                                    relief=tk.FLAT, insertbackground=self.colors['text'])
+        self.value_entry.pack(padx=2, pady=2)
+
+        # FIFO operations - Row 1: Enqueue, Dequeue
+        queue_frame_row1 = tk.Frame(parent, bg=self.colors['mantle'])
+        queue_frame_row1.pack(pady=5)
+        self.create_button(queue_frame_row1, "Enqueue", self.colors['blue'],
+                          self.enqueue).pack(side=tk.LEFT, padx=3)
+        self.create_button(queue_frame_row1, "Dequeue", self.colors['pink'],
+                          self.dequeue).pack(side=tk.LEFT, padx=3)
+
+        # Deque operations - Row 2: Push front, Pop back
+        queue_frame_row2 = tk.Frame(parent, bg=self.colors['mantle'])
+        queue_frame_row2.pack(pady=3)
+        self.create_button(queue_frame_row2, "Push front", self.colors['sapphire'],
+                          self.push_front).pack(side=tk.LEFT, padx=3)
+        self.create_button(queue_frame_row2, "Pop back", self.colors['flamingo'],
+                          self.pop_back).pack(side=tk.LEFT, padx=3)
+
+        # Row 3: Peek, Clear
+        queue_frame_row3 = tk.Frame(parent, bg=self.colors['mantle'])
+        queue_frame_row3.pack(pady=3)
+        self.create_button(queue_frame_row3, "Peek", self.colors['lavender'],
+                          self.peek).pack(side=tk.LEFT, padx=3)
+        self.create_button(queue_frame_row3, "Clear", self.colors['red'],
+                          self.clear).pack(side=tk.LEFT, padx=3)
+
+    def create_button(self, parent, text, color, command, width=12):
+        """Create a styled button"""
+        btn = tk.Button(parent, text=text, bg=color, fg=self.colors['crust'],
+                       font=("Segoe UI", 9, "bold"), relief=tk.FLAT,
+                       command=command, width=width, cursor="hand2",
+                       activebackground=color, activeforeground=self.colors['base'])
+        return btn
+
+    def _add(self, push):
+        value = self.value_entry.get()
+        if not value:
+            messagebox.showwarning("Input Error", "Please enter a value to add")
+            return
+        try:
+            msg = push(value)
+            self.main_window.log(f"✅ {msg}")
+            self.value_entry.delete(0, tk.END)
+            self.main_window.refresh_visualization()
+        except ValueError as e:
+            messagebox.showerror("Error", str(e))
+
+    def _remove(self, pop):
+        try:
+            msg = pop()
+            self.main_window.log(f"✅ {msg}")
+            self.main_window.refresh_visualization()
+        except ValueError as e:
+            self.main_window.log(f"⚠ {str(e)}")
+            messagebox.showinfo("Info", str(e))
+
+    def enqueue(self):
+        self._add(self.main_window.queue_manager.push_back)
+
+    def dequeue(self):
+        self._remove(self.main_window.queue_manager.pop_front)
+
+    def push_front(self):
+        self._add(self.main_window.queue_manager.push_front)
+
+    def pop_back(self):
+        self._remove(self.main_window.queue_manager.pop_back)
+
+    def peek(self):
+        """Log both ends without removing them"""
+        queue = self.main_window.queue_manager
+        if queue.is_empty():
+            self.main_window.log("⚠ Queue is empty!")
+            return
+        self.main_window.log(f"👁️ Front: {queue.peek_front()}, back: {queue.peek_back()}")
+
+    def clear(self):
+        self.main_window.queue_manager.clear()
+        self.main_window.log("✅ Queue cleared!")
+        self.main_window.refresh_visualization()
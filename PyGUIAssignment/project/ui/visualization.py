@@ -1,25 +1,202 @@
 """Visualization canvas for drawing linked lists and RPS game"""
 import tkinter as tk
+from collections import Counter
 from config import COLORS
 
+# Pixels drawn past each edge of the viewport, so short scrolls find nodes ready
+VIEW_MARGIN = 300
+# Vertical room between wrapped rows (for arrows) and between sections
+ROW_GAP = 70
+SECTION_GAP = 110
+
+
+class CanvasScene:
+    """
+    Retained canvas items, so a redraw only touches what changed.
+    
+    Every item is put under a key each frame: the first put creates it, later
+    puts move or reconfigure it only when its coordinates or options differ,
+    and flush() deletes whatever was not put again. Node glyphs (shadow, box
+    and label) share one tag per node and move together with a single
+    canvas.move.
+    """
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self.items = {}   # key -> [item id, item type, coords, options]
+        self.nodes = {}   # key -> [tag, x, y, fill, text, (shadow, box, label)]
+        self.seen = set()
+        self.tags = 0
+    
+    def put(self, key, item_type, coords, **options):
+        """Create, move or reconfigure the item under key"""
+        self.seen.add(key)
+        entry = self.items.get(key)
+        # A different item type or option set (e.g. a curve becoming an elbow) is recreated
+        if entry is None or entry[1] != item_type or entry[3].keys() != options.keys():
+            if entry is not None:
+                self.canvas.delete(entry[0])
+            item = getattr(self.canvas, f"create_{item_type}")(*coords, **options)
+            self.items[key] = [item, item_type, coords, options]
+            return item
+        item, _, old_coords, old_options = entry
+        if old_coords != coords:
+            self.canvas.coords(item, *coords)
+            entry[2] = coords
+        if old_options != options:
+            changed = {name: value for name, value in options.items() if old_options.get(name) != value}
+            self.canvas.itemconfigure(item, **changed)
+            entry[3] = options
+        return item
+    
+    def node(self, key, x, y, width, height, fill, outline, text):
+        """Create or update the shadow, box and label of one node with its top-left corner at (x, y)"""
+        self.seen.add(key)
+        entry = self.nodes.get(key)
+        if entry is None:
+            self.tags += 1
+            tag = f"node{self.tags}"
+            shadow = self.canvas.create_rectangle(x + 3, y + 3, x + width + 3, y + height + 3,
+                                                  fill=COLORS['crust'], outline="", tags=(tag,))
+            box = self.canvas.create_rectangle(x, y, x + width, y + height,
+                                               fill=fill, outline=outline, width=3, tags=(tag,))
+            label = self.canvas.create_text(x + width//2, y + height//2, text=text,
+                                            fill=COLORS['crust'], font=("Segoe UI", 12, "bold"),
+                                            tags=(tag,))
+            self.nodes[key] = [tag, x, y, fill, text, (shadow, box, label)]
+            return
+        tag, old_x, old_y, old_fill, old_text, (shadow, box, label) = entry
+        if (old_x, old_y) != (x, y):
+            self.canvas.move(tag, x - old_x, y - old_y)
+            entry[1], entry[2] = x, y
+        if old_fill != fill:
+            self.canvas.itemconfigure(box, fill=fill)
+            entry[3] = fill
+        if old_text != text:
+            self.canvas.itemconfigure(label, text=text)
+            entry[4] = text
+    
+    def flush(self):
+        """Delete every item and node not put since the last flush"""
+        for key in [key for key in self.items if key not in self.seen]:
+            self.canvas.delete(self.items.pop(key)[0])
+        for key in [key for key in self.nodes if key not in self.seen]:
+            self.canvas.delete(self.nodes.pop(key)[0])
+        self.seen = set()
+    
+    def reset(self):
+        """Forget every item and clear the canvas"""
+        self.canvas.delete("all")
+        self.items.clear()
+        self.nodes.clear()
+        self.seen = set()
+
+
+def node_keys(values, visible):
+    """
+    Stable keys for the visible slice of a row of values, as {index:
+    (value, occurrence)}. The managers hand out values rather than nodes, and
+    this keeps a node's key when others are inserted or deleted around it, so
+    only the changed nodes get new items. Occurrences before the slice are
+    counted in bulk, so a frame only does per-node work for what is on screen.
+    """
+    labels = list(map(str, values[:visible.stop]))
+    seen = Counter(labels[:visible.start])
+    keys = {}
+    for i in visible:
+        label = labels[i]
+        keys[i] = (label, seen[label])
+        seen[label] += 1
+    return keys
+
+
+class RowLayout:
+    """
+    Where node i of a row goes: one long row that scrolls sideways, or (when
+    wrap_width is given) rows of as many nodes as fit that width, stacked
+    downwards. visible() culls the nodes outside the viewport.
+    """
+    def __init__(self, count, start_x, y, spacing, node_height, wrap_width=None):
+        self.count = count
+        self.start_x = start_x
+        self.y = y
+        self.spacing = spacing
+        self.node_height = node_height
+        self.row_height = node_height + ROW_GAP
+        if wrap_width:
+            self.per_row = max(1, (wrap_width - start_x) // spacing)
+        else:
+            self.per_row = max(count, 1)
+        self.rows = max(1, -(-count // self.per_row))
+
+    def position(self, i):
+        """Top-left corner of node i"""
+        row, column = divmod(i, self.per_row)
+        return self.start_x + column * self.spacing, self.y + row * self.row_height
+
+    @property
+    def right(self):
+        return self.start_x + min(self.count, self.per_row) * self.spacing
+
+    @property
+    def bottom(self):
+        return self.y + (self.rows - 1) * self.row_height + self.node_height
+
+    def visible(self, view):
+        """Indices of the nodes inside view (left, top, right, bottom) plus VIEW_MARGIN"""
+        left, top, right, bottom = view
+        if self.rows == 1:
+            first = int(left - VIEW_MARGIN - self.start_x) // self.spacing
+            last = int(right + VIEW_MARGIN - self.start_x) // self.spacing + 1
+        else:
+            first = int(top - VIEW_MARGIN - self.y) // self.row_height * self.per_row
+            last = (int(bottom + VIEW_MARGIN - self.y) // self.row_height + 1) * self.per_row
+        return range(max(first, 0), min(last, self.count))
+
+
 class VisualizationCanvas:
     def __init__(self, parent, main_window):
         self.main_window = main_window
         self.colors = COLORS
         self.reverse_mode = False
+        self.showing_rps = False
+        self.wrap_rows = False
+        self.view = (0, 0, 0, 0)
+        self.extent = [0, 0]
+        self.region = None
+        self.wrap_width = None
         
         # Visualization area
         viz_frame = tk.Frame(parent, bg=self.colors['mantle'], relief=tk.FLAT)
         viz_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
         
-        # Canvas for drawing linked list and RPS
-        self.canvas = tk.Canvas(viz_frame, bg=self.colors['mantle'], 
+        # Canvas for drawing linked list and RPS, scrollable both ways
+        self.canvas = tk.Canvas(viz_frame, bg=self.colors['mantle'],
                                highlightthickness=0, highlightbackground=self.colors['surface0'])
+        x_scrollbar = tk.Scrollbar(viz_frame, orient=tk.HORIZONTAL, command=self.scroll_x)
+        y_scrollbar = tk.Scrollbar(viz_frame, orient=tk.VERTICAL, command=self.scroll_y)
+        self.canvas.configure(xscrollcommand=x_scrollbar.set, yscrollcommand=y_scrollbar.set)
+        x_scrollbar.pack(side=tk.BOTTOM, fill=tk.X)
+        y_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         self.canvas.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        
-        # Refresh button
-        self.create_button(parent, "Refresh visualization", self.colors['lavender'], 
-                          self.main_window.refresh_visualization, width=60).pack(pady=5)
+        self.scene = CanvasScene(self.canvas)
+        
+        # Only the visible nodes have items, so resizing and scrolling redraw
+        self.canvas.bind("<Configure>", lambda event: self.draw())
+        self.canvas.bind("<MouseWheel>", self._on_mousewheel)
+        self.canvas.bind("<Shift-MouseWheel>", self._on_shift_mousewheel)
+        # X11 reports the wheel as buttons 4 (up) and 5 (down) instead
+        for button in (4, 5):
+            self.canvas.bind(f"<Button-{button}>", self._on_mousewheel)
+            self.canvas.bind(f"<Shift-Button-{button}>", self._on_shift_mousewheel)
+        
+        # Refresh and wrap buttons
+        button_frame = tk.Frame(parent, bg=self.colors['base'])
+        button_frame.pack(pady=5)
+        self.create_button(button_frame, "Refresh visualization", self.colors['lavender'],
+                          self.main_window.refresh_visualization, width=44).pack(side=tk.LEFT, padx=3)
+        self.wrap_button = self.create_button(button_frame, "Wrap Rows: Off", self.colors['sky'],
+                                              self.toggle_wrap, width=14)
+        self.wrap_button.pack(side=tk.LEFT, padx=3)
     
     def create_button(self, parent, text, color, command, width=12):
         """Create a styled button"""
@@ -33,10 +210,43 @@ class VisualizationCanvas:
         """Set reverse visualization mode"""
         self.reverse_mode = is_reverse
     
+    def toggle_wrap(self):
+        """Switch between one long row per structure and rows that fit the canvas width"""
+        self.wrap_rows = not self.wrap_rows
+        self.wrap_button.config(text=f"Wrap Rows: {'On' if self.wrap_rows else 'Off'}")
+        self.canvas.xview_moveto(0)
+        self.canvas.yview_moveto(0)
+        self.draw()
+    
+    def scroll_x(self, *args):
+        self.canvas.xview(*args)
+        self.draw()
+    
+    def scroll_y(self, *args):
+        self.canvas.yview(*args)
+        self.draw()
+    
+    def _wheel_units(self, event):
+        """Scroll units for a wheel event: delta on Windows/macOS, button 4/5 on X11"""
+        if event.num == 4:
+            return -1
+        if event.num == 5:
+            return 1
+        return int(-1 * (event.delta / 120))
+    
+    def _on_mousewheel(self, event):
+        self.scroll_y("scroll", self._wheel_units(event), "units")
+    
+    def _on_shift_mousewheel(self, event):
+        self.scroll_x("scroll", self._wheel_units(event), "units")
+    
     def draw(self):
-        """Main draw method"""
-        self.canvas.delete("all")
-        
+        """
+        Main draw method. The list views are retained and virtualized: only
+        nodes inside the viewport (plus VIEW_MARGIN) get items, and each draw
+        diffs them against the items already on the canvas (see CanvasScene).
+        The RPS view is small and redrawn from scratch.
+        """
         # Get canvas dimensions
         canvas_width = self.canvas.winfo_width()
         canvas_height = self.canvas.winfo_height()
@@ -48,23 +258,56 @@ class VisualizationCanvas:
         
         if self.main_window.rps_game.is_active:
             # Draw RPS game visualization
+            self.scene.reset()
+            self.set_scrollregion(canvas_width, canvas_height)
+            self.showing_rps = True
             self.draw_rps_game(canvas_width, canvas_height)
-        else:
-            # Draw linked list based on type
-            list_type = self.main_window.current_list_type
-            if list_type == "Singly":
-                self.draw_singly_list(canvas_width, canvas_height)
-            elif list_type == "Doubly":
-                self.draw_doubly_list(canvas_width, canvas_height)
-            elif list_type == "Circular Singly":
-                self.draw_circular_singly_list(canvas_width, canvas_height)
-            elif list_type == "Circular Doubly":
-                self.draw_circular_doubly_list(canvas_width, canvas_height)
-            
-            # Draw stack at bottom
-            self.draw_stack_bottom(canvas_width, canvas_height)
+            return
+        if self.showing_rps:
+            self.scene.reset()
+            self.showing_rps = False
+        
+        # Visible part of the drawing, in canvas coordinates
+        self.view = (self.canvas.canvasx(0), self.canvas.canvasy(0),
+                     self.canvas.canvasx(canvas_width), self.canvas.canvasy(canvas_height))
+        self.extent = [canvas_width, canvas_height]
+        self.wrap_width = canvas_width if self.wrap_rows else None
+        
+        # Draw linked list based on type
+        list_type = self.main_window.current_list_type
+        bottom = canvas_height // 4
+        if list_type == "Singly":
+            bottom = self.draw_singly_list(canvas_width, canvas_height)
+        elif list_type == "Doubly":
+            bottom = self.draw_doubly_list(canvas_width, canvas_height)
+        elif list_type == "Circular Singly":
+            bottom = self.draw_circular_singly_list(canvas_width, canvas_height)
+        elif list_type == "Circular Doubly":
+            bottom = self.draw_circular_doubly_list(canvas_width, canvas_height)
+        elif list_type == "Skip List":
+            bottom = self.draw_skip_list(canvas_width, canvas_height)
+        
+        # Draw stack and queue at bottom (below the list's rows when wrapping)
+        bottom = self.draw_stack_bottom(canvas_width, canvas_height, bottom if self.wrap_rows else None)
+        bottom = self.draw_queue_bottom(canvas_width, canvas_height, bottom if self.wrap_rows else None)
+        self.extent[1] = max(self.extent[1], bottom + 40)
+        self.set_scrollregion(*self.extent)
+        self.scene.flush()
+    
+    def set_scrollregion(self, width, height):
+        region = (0, 0, width, height)
+        if region != self.region:
+            self.canvas.configure(scrollregion=region)
+            self.region = region
+    
+    def row_layout(self, count, start_x, y_pos, spacing, node_height):
+        """Lay out a row of count nodes and grow the scrollable extent to fit it"""
+        layout = RowLayout(count, start_x, y_pos, spacing, node_height, self.wrap_width)
+        self.extent[0] = max(self.extent[0], layout.right + 80)
+        self.extent[1] = max(self.extent[1], layout.bottom + 60)
+        return layout
     
-    def draw_curved_arrow(self, x1, y1, x2, y2, color, direction="forward"):
+    def draw_curved_arrow(self, key, x1, y1, x2, y2, color, direction="forward"):
         """Draw a curved arrow between two points"""
         # Calculate control point for curve
         mid_x = (x1 + x2) / 2
@@ -74,357 +317,414 @@ class VisualizationCanvas:
             control_y = max(y1, y2) + 20
         
         # Create smooth curve
-        self.canvas.create_line(x1, y1, mid_x, control_y, x2, y2,
-                               arrow=tk.LAST, fill=color, width=3, smooth=True)
+        self.scene.put(key, "line", (x1, y1, mid_x, control_y, x2, y2),
+                       arrow=tk.LAST, fill=color, width=3, smooth=True)
+    
+    def draw_link(self, key, layout, i, node_width, offset_y, color, direction="forward", end_gap=5):
+        """
+        Arrow from node i to node i + 1 (pointing back for prev links) at
+        offset_y below the node tops. Where a wrapped row breaks, next links
+        become an elbow down to the start of the next row and prev links are
+        left out.
+        """
+        x, y = layout.position(i)
+        next_x, next_y = layout.position(i + 1)
+        start_x = x + node_width + 5
+        end_x = next_x - end_gap
+        if next_y == y:
+            if direction == "forward":
+                self.draw_curved_arrow(key, start_x, y + offset_y, end_x, y + offset_y, color, direction)
+            else:
+                self.draw_curved_arrow(key, end_x, y + offset_y, start_x, y + offset_y, color, direction)
+        elif direction == "forward":
+            turn_y = y + layout.node_height + ROW_GAP // 2
+            self.scene.put(key, "line", (start_x, y + offset_y, start_x + 15, y + offset_y,
+                                         start_x + 15, turn_y, end_x - 15, turn_y,
+                                         end_x - 15, next_y + offset_y, end_x, next_y + offset_y),
+                           arrow=tk.LAST, fill=color, width=3)
+    
+    def draw_title(self, key, x, y, text):
+        self.scene.put(key, "text", (x, y), text=text, fill=self.colors['mauve'],
+                       font=("Segoe UI", 12, "bold"), anchor="w")
+    
+    def draw_empty(self, key, y_pos):
+        self.scene.put(key, "text", (60, y_pos + 30), text="Empty", fill=self.colors['surface2'],
+                       font=("Segoe UI", 12, "italic"), anchor="w")
+        return y_pos + 60
+    
+    def draw_null(self, key, x, y, size=10):
+        self.scene.put(key, "text", (x, y), text="NULL", fill=self.colors['surface2'],
+                       font=("Segoe UI", size, "italic"))
     
     def draw_singly_list(self, canvas_width, canvas_height):
-        """Draw singly linked list"""
+        """Draw singly linked list; return the bottom of the drawing"""
         y_pos = canvas_height // 4
-        self.canvas.create_text(60, 35, text="Singly Linked List:", 
-                               fill=self.colors['mauve'], font=("Segoe UI", 12, "bold"), 
-                               anchor="w")
+        self.draw_title("list.title", 60, 35, "Singly Linked List:")
         
         singly_list = self.main_window.list_manager.get_singly_list()
         
-        if singly_list:
-            node_width = 60
-            node_height = 50
-            spacing = 100
-            start_x = 80
+        if not singly_list:
+            return self.draw_empty("list.empty", y_pos)
+        
+        node_width = 60
+        node_height = 50
+        spacing = 100
+        start_x = 80
+        layout = self.row_layout(len(singly_list), start_x, y_pos, spacing, node_height)
+        visible = layout.visible(self.view)
+        keys = node_keys(singly_list, visible)
+        
+        for i in visible:
+            x, y = layout.position(i)
             
-            for i, value in enumerate(singly_list):
-                x = start_x + (i * spacing)
-                
-                # Draw shadow
-                self.canvas.create_rectangle(x + 3, y_pos + 3, 
-                                            x + node_width + 3, y_pos + node_height + 3,
-                                            fill=self.colors['crust'], outline="")
-                
-                # Draw node
-                self.canvas.create_rectangle(x, y_pos, 
-                                            x + node_width, y_pos + node_height,
-                                            fill=self.colors['blue'], outline=self.colors['lavender'], 
-                                            width=3)
-                self.canvas.create_text(x + node_width//2, y_pos + node_height//2,
-                                       text=str(value), fill=self.colors['crust'], 
-                                       font=("Segoe UI", 12, "bold"))
-                
-                # Draw curved arrow to next node
-                if i < len(singly_list) - 1:
-                    arrow_start_x = x + node_width + 5
-                    arrow_end_x = x + spacing - 5
-                    arrow_y = y_pos + node_height//2
-                    self.draw_curved_arrow(arrow_start_x, arrow_y, arrow_end_x, arrow_y, 
-                                          self.colors['sapphire'], "forward")
-                else:
-                    # NULL indicator
-                    self.canvas.create_text(x + node_width + 30, y_pos + node_height//2,
-                                          text="NULL", fill=self.colors['surface2'],
-                                          font=("Segoe UI", 10, "italic"))
-        else:
-            self.canvas.create_text(60, y_pos + 30, text="Empty", 
-                                   fill=self.colors['surface2'], 
-                                   font=("Segoe UI", 12, "italic"), anchor="w")
+            # Draw node (with its shadow)
+            self.scene.node(("list", keys[i]), x, y, node_width, node_height,
+                            self.colors['blue'], self.colors['lavender'], keys[i][0])
+            
+            # Draw curved arrow to next node
+            if i < len(singly_list) - 1:
+                self.draw_link(("list.next", i), layout, i, node_width, node_height//2,
+                               self.colors['sapphire'])
+            else:
+                # NULL indicator
+                self.draw_null("list.null", x + node_width + 30, y + node_height//2)
+        return layout.bottom
     
     def draw_doubly_list(self, canvas_width, canvas_height):
-        """Draw doubly linked list"""
+        """Draw doubly linked list; return the bottom of the drawing"""
         y_pos = canvas_height // 4
         title = "Doubly Linked List (Reversed)" if self.reverse_mode else "Doubly Linked List:"
-        self.canvas.create_text(60, 35, text=title, 
-                               fill=self.colors['mauve'], font=("Segoe UI", 12, "bold"), 
-                               anchor="w")
+        self.draw_title("list.title", 60, 35, title)
         
-        nodes = self.main_window.list_manager.get_doubly_list()
-        
-        # Reverse the visualization if in reverse mode
-        if self.reverse_mode:
-            nodes = list(reversed(nodes))
+        # Reverse mode walks the prev links instead of reversing a copy
+        nodes = self.main_window.list_manager.get_doubly_list(self.reverse_mode)
         
         if not nodes:
-            self.canvas.create_text(60, y_pos + 30, text="Empty", 
-                                   fill=self.colors['surface2'], 
-                                   font=("Segoe UI", 12, "italic"), anchor="w")
-            return
+            return self.draw_empty("list.empty", y_pos)
         
         node_width = 60
         node_height = 50
         spacing = 120
         start_x = 80
+        layout = self.row_layout(len(nodes), start_x, y_pos, spacing, node_height)
+        visible = layout.visible(self.view)
+        keys = node_keys(nodes, visible)
         
-        for i, value in enumerate(nodes):
-            x = start_x + (i * spacing)
-            
-            # Draw shadow
-            self.canvas.create_rectangle(x + 3, y_pos + 3, 
-                                        x + node_width + 3, y_pos + node_height + 3,
-                                        fill=self.colors['crust'], outline="")
+        for i in visible:
+            x, y = layout.position(i)
             
-            # Draw node
-            self.canvas.create_rectangle(x, y_pos, 
-                                        x + node_width, y_pos + node_height,
-                                        fill=self.colors['green'], outline=self.colors['lavender'], 
-                                        width=3)
-            self.canvas.create_text(x + node_width//2, y_pos + node_height//2,
-                                   text=str(value), fill=self.colors['crust'], 
-                                   font=("Segoe UI", 12, "bold"))
+            # Draw node (with its shadow)
+            self.scene.node(("list", keys[i]), x, y, node_width, node_height,
+                            self.colors['green'], self.colors['lavender'], keys[i][0])
             
             # Draw curved arrows to next node
             if i < len(nodes) - 1:
-                arrow_start_x = x + node_width + 5
-                arrow_end_x = x + spacing - 5
-                arrow_y_forward = y_pos + node_height//2
-                
                 # Forward arrow (top curve)
-                self.draw_curved_arrow(arrow_start_x, arrow_y_forward, arrow_end_x, arrow_y_forward,
-                                      self.colors['blue'], "forward")
+                self.draw_link(("list.next", i), layout, i, node_width, node_height//2,
+                               self.colors['blue'], "forward")
                 
                 # Backward arrow (bottom curve)
-                self.draw_curved_arrow(arrow_end_x, arrow_y_forward, arrow_start_x, arrow_y_forward,
-                                      self.colors['pink'], "backward")
+                self.draw_link(("list.prev", i), layout, i, node_width, node_height//2,
+                               self.colors['pink'], "backward")
             else:
                 # NULL indicators
-                self.canvas.create_text(x + node_width + 35, y_pos + node_height//3,
-                                      text="NULL", fill=self.colors['surface2'],
-                                      font=("Segoe UI", 9, "italic"))
+                self.draw_null("list.null", x + node_width + 35, y + node_height//3, 9)
         
         # NULL at beginning
-        if nodes:
-            self.canvas.create_text(start_x - 35, y_pos + (node_height * 2)//3,
-                                  text="NULL", fill=self.colors['surface2'],
-                                  font=("Segoe UI", 9, "italic"))
+        self.draw_null("list.null_start", start_x - 35, y_pos + (node_height * 2)//3, 9)
+        return layout.bottom
     
     def draw_circular_singly_list(self, canvas_width, canvas_height):
-        """Draw circular singly linked list with circular arrow"""
+        """Draw circular singly linked list with circular arrow; return the bottom of the drawing"""
         y_pos = canvas_height // 4
-        self.canvas.create_text(60, 35, text="Circular Singly Linked List:", 
-                               fill=self.colors['mauve'], font=("Segoe UI", 12, "bold"), 
-                               anchor="w")
+        self.draw_title("list.title", 60, 35, "Circular Singly Linked List:")
         
         circular_list = self.main_window.list_manager.get_circular_singly_list()
         
         if not circular_list:
-            self.canvas.create_text(60, y_pos + 30, text="Empty", 
-                                   fill=self.colors['surface2'], 
-                                   font=("Segoe UI", 12, "italic"), anchor="w")
-            return
+            return self.draw_empty("list.empty", y_pos)
         
         node_width = 60
         node_height = 50
         spacing = 100
         start_x = 80
+        layout = self.row_layout(len(circular_list), start_x, y_pos, spacing, node_height)
+        visible = layout.visible(self.view)
+        keys = node_keys(circular_list, visible)
         
-        for i, value in enumerate(circular_list):
-            x = start_x + (i * spacing)
+        for i in visible:
+            x, y = layout.position(i)
             
-            # Draw shadow
-            self.canvas.create_rectangle(x + 3, y_pos + 3, 
-                                        x + node_width + 3, y_pos + node_height + 3,
-                                        fill=self.colors['crust'], outline="")
-            
-            # Draw node
-            self.canvas.create_rectangle(x, y_pos, 
-                                        x + node_width, y_pos + node_height,
-                                        fill=self.colors['yellow'], outline=self.colors['lavender'], 
-                                        width=3)
-            self.canvas.create_text(x + node_width//2, y_pos + node_height//2,
-                                   text=str(value), fill=self.colors['crust'], 
-                                   font=("Segoe UI", 12, "bold"))
+            # Draw node (with its shadow)
+            self.scene.node(("list", keys[i]), x, y, node_width, node_height,
+                            self.colors['yellow'], self.colors['lavender'], keys[i][0])
             
             # Draw curved arrow to next node
             if i < len(circular_list) - 1:
-                arrow_start_x = x + node_width + 5
-                arrow_end_x = x + spacing - 5
-                arrow_y = y_pos + node_height//2
-                self.draw_curved_arrow(arrow_start_x, arrow_y, arrow_end_x, arrow_y,
-                                      self.colors['peach'], "forward")
+                self.draw_link(("list.next", i), layout, i, node_width, node_height//2,
+                               self.colors['peach'])
         
         # Draw circular arrow from last node back to first node
-        if len(circular_list) > 0:
-            last_x = start_x + ((len(circular_list) - 1) * spacing) + node_width
-            first_x = start_x
-            last_node_center_y = y_pos + node_height // 2
-            first_node_center_y = y_pos + node_height // 8
-            
-            # Starting point: right side of last node
-            arrow_start_x = last_x
-            arrow_start_y = last_node_center_y
-            
-            # Ending point: left side of first node
-            arrow_end_x = first_x
-            arrow_end_y = first_node_center_y
-            
-            # Create curved path going up and around
-            # Calculate control points for smooth curve
-            mid_x = (arrow_start_x + arrow_end_x) / 2
-            control_y = y_pos - 60  # Height of the arc above nodes
-            
-            # Draw the curved arrow using smooth bezier curve with arrow
-            self.canvas.create_line(
-                arrow_start_x, arrow_start_y,
-                arrow_start_x + 30, control_y,
-                mid_x, control_y - 20,
-                arrow_end_x - 30, control_y,
-                arrow_end_x, arrow_end_y,
-                smooth=True, fill=self.colors['peach'], width=4, arrow=tk.LAST
-            )
-            
-            # Label at the top
-            self.canvas.create_text(mid_x, control_y - 35,
-                                  text="🔄 Circular", fill=self.colors['yellow'],
-                                  font=("Segoe UI", 11, "bold"))
+        last_x, last_y = layout.position(len(circular_list) - 1)
+        last_x += node_width
+        first_x = start_x
+        last_node_center_y = last_y + node_height // 2
+        first_node_center_y = y_pos + node_height // 8
+        
+        # Starting point: right side of last node
+        arrow_start_x = last_x
+        arrow_start_y = last_node_center_y
+        
+        # Ending point: left side of first node
+        arrow_end_x = first_x
+        arrow_end_y = first_node_center_y
+        
+        # Create curved path going up and around
+        # Calculate control points for smooth curve
+        mid_x = (arrow_start_x + arrow_end_x) / 2
+        control_y = y_pos - 60  # Height of the arc above nodes
+        
+        # Draw the curved arrow using smooth bezier curve with arrow
+        self.scene.put("list.loop", "line", (
+            arrow_start_x, arrow_start_y,
+            arrow_start_x + 30, control_y,
+            mid_x, control_y - 20,
+            arrow_end_x - 30, control_y,
+            arrow_end_x, arrow_end_y,
+        ), smooth=True, fill=self.colors['peach'], width=4, arrow=tk.LAST)
+        
+        # Label at the top
+        self.scene.put("list.loop_label", "text", (mid_x, control_y - 35),
+                       text="🔄 Circular", fill=self.colors['yellow'],
+                       font=("Segoe UI", 11, "bold"))
+        return layout.bottom
     
-    # Replace the draw_circular_doubly_list method in visualization.py with this:
-
     def draw_circular_doubly_list(self, canvas_width, canvas_height):
-        """Draw circular doubly linked list"""
+        """Draw circular doubly linked list; return the bottom of the drawing"""
         y_pos = canvas_height // 4
         title = "Circular Doubly Linked List (Reversed)" if self.reverse_mode else "Circular Doubly Linked List:"
-        self.canvas.create_text(60, 35, text=title, 
-                            fill=self.colors['mauve'], font=("Segoe UI", 12, "bold"), 
-                            anchor="w")
-        
-        nodes = self.main_window.list_manager.get_circular_doubly_list()
+        self.draw_title("list.title", 60, 35, title)
         
-        # Reverse the visualization if in reverse mode
-        if self.reverse_mode:
-            nodes = list(reversed(nodes))
+        # Reverse mode walks the prev links instead of reversing a copy
+        nodes = self.main_window.list_manager.get_circular_doubly_list(self.reverse_mode)
         
         if not nodes:
-            self.canvas.create_text(60, y_pos + 30, text="Empty", 
-                                fill=self.colors['surface2'], 
-                                font=("Segoe UI", 12, "italic"), anchor="w")
-            return
+            return self.draw_empty("list.empty", y_pos)
         
         node_width = 60
         node_height = 50
         spacing = 120
         start_x = 80
+        layout = self.row_layout(len(nodes), start_x, y_pos, spacing, node_height)
+        visible = layout.visible(self.view)
+        keys = node_keys(nodes, visible)
         
-        for i, value in enumerate(nodes):
-            x = start_x + (i * spacing)
-            
-            # Draw shadow
-            self.canvas.create_rectangle(x + 3, y_pos + 3, 
-                                        x + node_width + 3, y_pos + node_height + 3,
-                                        fill=self.colors['crust'], outline="")
+        for i in visible:
+            x, y = layout.position(i)
             
-            # Draw node
-            self.canvas.create_rectangle(x, y_pos, 
-                                        x + node_width, y_pos + node_height,
-                                        fill=self.colors['teal'], outline=self.colors['lavender'], 
-                                        width=3)
-            self.canvas.create_text(x + node_width//2, y_pos + node_height//2,
-                                text=str(value), fill=self.colors['crust'], 
-                                font=("Segoe UI", 12, "bold"))
+            # Draw node (with its shadow)
+            self.scene.node(("list", keys[i]), x, y, node_width, node_height,
+                            self.colors['teal'], self.colors['lavender'], keys[i][0])
             
             # Draw curved arrows to next node
             if i < len(nodes) - 1:
-                arrow_start_x = x + node_width + 5
-                arrow_end_x = x + spacing - 5
-                arrow_y = y_pos + node_height//2
-                
                 # Forward arrow (top curve)
-                self.draw_curved_arrow(arrow_start_x, arrow_y, arrow_end_x, arrow_y,
-                                    self.colors['blue'], "forward")
+                self.draw_link(("list.next", i), layout, i, node_width, node_height//2,
+                               self.colors['blue'], "forward")
                 
                 # Backward arrow (bottom curve)
-                self.draw_curved_arrow(arrow_end_x, arrow_y, arrow_start_x, arrow_y,
-                                    self.colors['pink'], "backward")
+                self.draw_link(("list.prev", i), layout, i, node_width, node_height//2,
+                               self.colors['pink'], "backward")
         
         # Draw circular connections with proper arrows
         if len(nodes) > 1:
-            last_x = start_x + ((len(nodes) - 1) * spacing) + node_width
+            last_x, last_y = layout.position(len(nodes) - 1)
+            last_x += node_width
             first_x = start_x
             
             # Forward circular arrow (top) - from last node to first node
             arrow_start_x = last_x
-            arrow_start_y = y_pos + node_height // 3
+            arrow_start_y = last_y + node_height // 3
             arrow_end_x = first_x
             arrow_end_y = y_pos + node_height // 9
             
             mid_x = (arrow_start_x + arrow_end_x) / 2
             control_y = y_pos - 40
             
-            self.canvas.create_line(
+            self.scene.put("list.loop", "line", (
                 arrow_start_x, arrow_start_y,
                 arrow_start_x + 30, control_y,
                 mid_x, control_y - 10,
                 arrow_end_x - 30, control_y,
                 arrow_end_x, arrow_end_y,
-                smooth=True, fill=self.colors['blue'], width=4, arrow=tk.LAST
-            )
+            ), smooth=True, fill=self.colors['blue'], width=4, arrow=tk.LAST)
             
             # Backward circular arrow (bottom) - from first node to last node
             arrow_start_x2 = first_x
             arrow_start_y2 = y_pos + (node_height * 1) // 2
             arrow_end_x2 = last_x
-            arrow_end_y2 = y_pos + (node_height * 1) // 1
+            arrow_end_y2 = last_y + (node_height * 1) // 1
             
-            control_y2 = y_pos + node_height + 40
+            control_y2 = last_y + node_height + 40
             
-            self.canvas.create_line(
+            self.scene.put("list.loop_back", "line", (
                 arrow_start_x2, arrow_start_y2,
                 arrow_start_x2 - 30, control_y2,
                 mid_x, control_y2 + 10,
                 arrow_end_x2 + 30, control_y2,
                 arrow_end_x2, arrow_end_y2,
-                smooth=True, fill=self.colors['pink'], width=3, arrow=tk.LAST
-            )
+            ), smooth=True, fill=self.colors['pink'], width=3, arrow=tk.LAST)
+            
+            self.scene.put("list.loop_label", "text", (mid_x, control_y - 25),
+                           text="🔄 Circular Doubly", fill=self.colors['teal'],
+                           font=("Segoe UI", 10, "bold"))
+        return layout.bottom
+    
+    def draw_skip_list(self, canvas_width, canvas_height):
+        """Draw skip list nodes as towers with one express lane per level; return the bottom of the drawing"""
+        y_pos = canvas_height // 4
+        self.draw_title("list.title", 60, 35, "Skip List (express lanes above):")
+        
+        towers = self.main_window.list_manager.get_skip_towers()
+        
+        if not towers:
+            return self.draw_empty("list.empty", y_pos)
+        
+        node_width = 60
+        node_height = 50
+        spacing = 100
+        start_x = 80
+        lane_gap = 14
+        lane_colors = [self.colors['sapphire'], self.colors['teal'], self.colors['green'],
+                       self.colors['yellow'], self.colors['peach']]
+        layout = self.row_layout(len(towers), start_x, y_pos, spacing, node_height)
+        visible = layout.visible(self.view)
+        keys = node_keys([value for value, height in towers], visible)
+        
+        # Express lanes: level k links each tower of height > k to the next one
+        # (lanes are walked in full to find each link's source, but only links
+        # reaching into the viewport get items)
+        last = {}
+        for i, (value, height) in enumerate(towers):
+            x, y = layout.position(i)
+            for level in range(1, height):
+                lane_y = y - level * lane_gap
+                color = lane_colors[level % len(lane_colors)]
+                if i in visible:
+                    self.scene.put(("list.lane", keys[i], level), "rectangle",
+                                   (x + 10, lane_y - 4, x + node_width - 10, lane_y + 4),
+                                   fill=color, outline="")
+                source = last.get(level)
+                if source is not None and source < visible.stop and i >= visible.start:
+                    source_x, source_y = layout.position(source)
+                    if source_y == y:
+                        self.scene.put(("list.express", i, level), "line",
+                                       (source_x + node_width - 10, lane_y, x + 10, lane_y),
+                                       arrow=tk.LAST, fill=color, width=2)
+                last[level] = i
+        
+        for i in visible:
+            x, y = layout.position(i)
+            
+            # Draw node (with its shadow)
+            self.scene.node(("list", keys[i]), x, y, node_width, node_height,
+                            self.colors['blue'], self.colors['lavender'], keys[i][0])
             
-            self.canvas.create_text(mid_x, control_y - 25,
-                                text="🔄 Circular Doubly", fill=self.colors['teal'],
-                                font=("Segoe UI", 10, "bold"))
+            # Draw curved arrow to next node on the bottom level
+            if i < len(towers) - 1:
+                self.draw_link(("list.next", i), layout, i, node_width, node_height//2,
+                               self.colors['sapphire'])
+            else:
+                self.draw_null("list.null", x + node_width + 30, y + node_height//2)
+        return layout.bottom
     
-    def draw_stack_bottom(self, canvas_width, canvas_height):
-        """Draw stack at the bottom of canvas"""
-        y_pos = (canvas_height * 3) // 4
-        self.canvas.create_text(60, y_pos - 35, 
-                               text="Stack (peek/pop head):", 
-                               fill=self.colors['mauve'], font=("Segoe UI", 12, "bold"), 
-                               anchor="w")
+    def draw_stack_bottom(self, canvas_width, canvas_height, top=None):
+        """Draw stack at the bottom of canvas (at least SECTION_GAP below top if given); return its bottom"""
+        y_pos = (canvas_height * 5) // 8
+        if top is not None:
+            y_pos = max(y_pos, top + SECTION_GAP)
+        self.draw_title("stack.title", 60, y_pos - 35, "Stack (peek/pop head):")
         
         stack = self.main_window.stack_manager.get_stack()
         
-        if stack:
-            node_width = 60
-            node_height = 50
-            spacing = 100
-            start_x = 80
+        if not stack:
+            return self.draw_empty("stack.empty", y_pos)
+        
+        node_width = 60
+        node_height = 50
+        spacing = 100
+        start_x = 80
+        layout = self.row_layout(len(stack), start_x, y_pos, spacing, node_height)
+        visible = layout.visible(self.view)
+        keys = node_keys(stack, visible)
+        
+        for i in visible:
+            x, y = layout.position(i)
             
-            for i, value in enumerate(stack):
-                x = start_x + (i * spacing)
-                
-                # Draw shadow
-                self.canvas.create_rectangle(x + 3, y_pos + 3, 
-                                            x + node_width + 3, y_pos + node_height + 3,
-                                            fill=self.colors['crust'], outline="")
-                
-                # Draw node
-                color = self.colors['pink'] if i == len(stack) - 1 else self.colors['mauve']
-                self.canvas.create_rectangle(x, y_pos, 
-                                            x + node_width, y_pos + node_height,
-                                            fill=color, outline=self.colors['lavender'], 
-                                            width=3)
-                self.canvas.create_text(x + node_width//2, y_pos + node_height//2,
-                                       text=str(value), fill=self.colors['crust'], 
-                                       font=("Segoe UI", 12, "bold"))
-                
-                # Draw curved arrow to next node
-                if i < len(stack) - 1:
-                    arrow_start_x = x + node_width + 5
-                    arrow_end_x = x + spacing - 1
-                    arrow_y = y_pos + node_height//2
-                    self.draw_curved_arrow(arrow_start_x, arrow_y, arrow_end_x, arrow_y,
-                                          self.colors['flamingo'], "forward")
+            # Draw node (with its shadow)
+            color = self.colors['pink'] if i == len(stack) - 1 else self.colors['mauve']
+            self.scene.node(("stack", keys[i]), x, y, node_width, node_height,
+                            color, self.colors['lavender'], keys[i][0])
             
-            # Draw "TOP" indicator for stack
-            top_x = start_x + ((len(stack) - 1) * spacing) + node_width//2
-            self.canvas.create_text(top_x, y_pos - 15, text="TOP ↑", 
-                                   fill=self.colors['green'], font=("Segoe UI", 11, "bold"))
-        else:
-            self.canvas.create_text(60, y_pos + 30, text="Empty", 
-                                   fill=self.colors['surface2'], 
-                                   font=("Segoe UI", 12, "italic"), anchor="w")
+            # Draw curved arrow to next node
+            if i < len(stack) - 1:
+                self.draw_link(("stack.next", i), layout, i, node_width, node_height//2,
+                               self.colors['flamingo'], end_gap=1)
+        
+        # Draw "TOP" indicator for stack
+        top_x, top_y = layout.position(len(stack) - 1)
+        self.scene.put("stack.top", "text", (top_x + node_width//2, top_y - 15), text="TOP ↑",
+                       fill=self.colors['green'], font=("Segoe UI", 11, "bold"))
+        return layout.bottom
+    
+    def draw_queue_bottom(self, canvas_width, canvas_height, top=None):
+        """Draw queue / deque below the stack, front on the left; return its bottom"""
+        y_pos = (canvas_height * 7) // 8
+        if top is not None:
+            y_pos = max(y_pos, top + SECTION_GAP)
+        self.draw_title("queue.title", 60, y_pos - 35, "Queue / Deque (dequeue front, enqueue back):")
+        
+        queue = self.main_window.queue_manager.get_deque()
+        
+        if not queue:
+            return self.draw_empty("queue.empty", y_pos)
+        
+        node_width = 60
+        node_height = 50
+        spacing = 100
+        start_x = 80
+        layout = self.row_layout(len(queue), start_x, y_pos, spacing, node_height)
+        visible = layout.visible(self.view)
+        keys = node_keys(queue, visible)
+        
+        for i in visible:
+            x, y = layout.position(i)
+            
+            # Draw node (front and back highlighted)
+            if i == 0:
+                color = self.colors['green']
+            elif i == len(queue) - 1:
+                color = self.colors['peach']
+            else:
+                color = self.colors['sky']
+            self.scene.node(("queue", keys[i]), x, y, node_width, node_height,
+                            color, self.colors['lavender'], keys[i][0])
+            
+            # Draw next/prev arrows to the following node
+            if i < len(queue) - 1:
+                self.draw_link(("queue.next", i), layout, i, node_width, node_height//3,
+                               self.colors['flamingo'], "forward", end_gap=1)
+                self.draw_link(("queue.prev", i), layout, i, node_width, 2 * node_height//3,
+                               self.colors['teal'], "backward", end_gap=1)
+        
+        # FRONT / BACK indicators
+        self.scene.put("queue.front", "text", (start_x + node_width//2, y_pos - 15), text="FRONT ↓",
+                       fill=self.colors['green'], font=("Segoe UI", 11, "bold"))
+        if len(queue) > 1:
+            back_x, back_y = layout.position(len(queue) - 1)
+            self.scene.put("queue.back", "text", (back_x + node_width//2, back_y - 15), text="BACK ↓",
+                           fill=self.colors['peach'], font=("Segoe UI", 11, "bold"))
+        return layout.bottom
     
     def draw_rps_game(self, canvas_width, canvas_height):
         """Draw Rock Paper Scissors game visualization"""